@@ -0,0 +1,174 @@
+"""
+Shared fixtures for the benchmark suite.
+
+Weather requests never leave the process: `weather_stub` answers every
+Open-Meteo and NASA POWER call in-process from the payloads in
+`benchmarks/fixtures/`, so timings measure our code rather than the network.
+The data database, packed outlines and tiles are built in a scratch directory
+(the env vars are set here, before anything imports the app) and the TTL cache
+is pointed at a scratch database, so a run neither reads nor refreshes the
+artifacts under `.cache/`. Results are saved under `benchmarks/results/`
+whichever directory pytest is started from.
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+SCRATCH_DIR = tempfile.mkdtemp(prefix="fire-risk-bench-")
+os.environ.setdefault("FIRE_RISK_RELOAD_INTERVAL", "0")
+for name in ("FIRE_RISK_DATA_DB_DIR", "FIRE_RISK_GEOSTORE_DIR", "FIRE_RISK_TILES_DIR"):
+    os.environ[name] = SCRATCH_DIR
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def pytest_configure(config):
+    """Store runs next to pytest.ini unless --benchmark-storage is given (the plugin configures after this)."""
+    if not any(arg.startswith("--benchmark-storage") for arg in config.invocation_params.args):
+        config.option.benchmark_storage = f"file://{Path(config.inipath or __file__).parent / 'results'}"
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(SCRATCH_DIR, ignore_errors=True)
+
+
+def load_fixture(name: str) -> dict:
+    with open(FIXTURES_DIR / f"{name}.json", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+class StubResponse:
+    def __init__(self, url: str, status_code: int, payload: dict):
+        self.url = url
+        self.status_code = status_code
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} for url: {self.url}", response=self)
+
+    def json(self) -> dict:
+        return self._payload
+
+
+class WeatherStub:
+    """
+    Stand-in for `requests.get` that answers in-process from the local
+    weather stub (`fire_risk.services.weather_stub`) replaying the recorded
+    payloads, with no latency or faults injected.
+    """
+
+    def __init__(self):
+        from fire_risk.services.weather_stub import ReplayWeather, WeatherStubService
+
+        self.service = WeatherStubService(ReplayWeather(FIXTURES_DIR))
+        self.calls: list[str] = []
+
+    def __call__(self, url, *args, **kwargs) -> StubResponse:
+        self.calls.append(url)
+        parsed = urlparse(url)
+        params = {name: values[0] for name, values in parse_qs(parsed.query).items()}
+        status, payload, _ = self.service.respond(parsed.path, params)
+        return StubResponse(url, status, payload)
+
+
+@pytest.fixture(scope="session")
+def forecast_payload() -> dict:
+    return load_fixture("openmeteo_forecast_14d")
+
+
+@pytest.fixture(scope="session")
+def archive_payload() -> dict:
+    return load_fixture("openmeteo_archive_90d")
+
+
+@pytest.fixture(scope="session")
+def weather_stub():
+    """Replaces `requests.get` for the whole session (every benchmark needs it)."""
+    stub = WeatherStub()
+    original = requests.get
+    requests.get = stub
+    yield stub
+    requests.get = original
+
+
+@pytest.fixture(scope="session", autouse=True)
+def scratch_cache(tmp_path_factory, weather_stub):
+    """Point the shared TTL cache at a scratch database for the session."""
+    from fire_risk.services.cache import TTLCache, cache
+
+    original = cache.db_path
+    cache.db_path = TTLCache(str(tmp_path_factory.mktemp("cache") / "fire_risk_cache.sqlite")).db_path
+    yield cache
+    cache.db_path = original
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cffwis():
+    """Import xclim up front so no benchmark's first round pays for it."""
+    from fire_risk.legacy.fwi_fri import load_cffwis
+
+    return load_cffwis()
+
+
+@pytest.fixture(scope="session")
+def dash_app(scratch_cache):
+    from fire_risk.app import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def summary_store(dash_app):
+    """What the browser holds in `camp-summary-store`."""
+    from fire_risk.services.common import camp_summary_snapshot
+
+    return camp_summary_snapshot()
+
+
+@pytest.fixture(scope="session")
+def invoke_callback(dash_app):
+    """
+    Call a registered callback's function directly (no HTTP, no JSON),
+    looked up by a unique substring of its output id, with a callback
+    context in which `triggered` is the firing input.
+    """
+    from dash._callback_context import context_value
+    from dash._utils import AttributeDict
+
+    def find(output: str):
+        keys = [key for key in dash_app.callback_map if output in key]
+        if len(keys) != 1:
+            raise KeyError(f"{output!r} matches {len(keys)} callbacks")
+        callback = dash_app.callback_map[keys[0]]["callback"]
+        return getattr(callback, "__wrapped__", callback)
+
+    def invoke(output: str, *args, triggered: str | None = None):
+        func = find(output)
+        context = AttributeDict(
+            triggered_inputs=[{"prop_id": triggered, "value": None}] if triggered else [],
+            inputs_list=[],
+            states_list=[],
+            outputs_list=[],
+            args_grouping=[],
+            using_args_grouping=False,
+            using_outputs_grouping=False,
+            updated_props={},
+            ignore_register_page=True,
+        )
+        token = context_value.set(context)
+        try:
+            with dash_app.server.test_request_context("/"):
+                return func(*args)
+        finally:
+            context_value.reset(token)
+
+    return invoke
@@ -0,0 +1,64 @@
+"""
+Re-record the weather payloads in `benchmarks/fixtures/` from the live APIs.
+
+`python -m benchmarks.record_fixtures` fetches, for one camp location, the
+14-day Open-Meteo forecast, the 90-day Open-Meteo archive ending yesterday
+and the NASA POWER monthly and climatology responses, with the same query
+parameters as `fire_risk.legacy.fwi_fri`, and writes them unchanged. The
+benchmark stub replays them for any location and date, so a re-recording
+only changes the weather the benchmarks see, not what they exercise.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import date, timedelta
+from pathlib import Path
+
+import requests
+
+from fire_risk.legacy.fwi_fri import (
+    OPEN_METEO_ARCHIVE_URL,
+    OPEN_METEO_FORECAST_URL,
+    _open_meteo_url,
+    _power_climatology_url,
+    _power_monthly_url,
+    _safe_power_year,
+)
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+LAT, LON = 21.1894, 92.1553  # Camp 11
+
+
+def fixture_urls(lat: float, lon: float, today: date) -> dict[str, str]:
+    forecast_start = today + timedelta(days=1)
+    archive_end = today - timedelta(days=1)
+    return {
+        "openmeteo_forecast_14d": _open_meteo_url(
+            OPEN_METEO_FORECAST_URL, "forecast", lat, lon, forecast_start, forecast_start + timedelta(days=13),
+        ),
+        "openmeteo_archive_90d": _open_meteo_url(
+            OPEN_METEO_ARCHIVE_URL, "archive", lat, lon, archive_end - timedelta(days=89), archive_end,
+        ),
+        "power_monthly": _power_monthly_url(lat, lon, _safe_power_year()),
+        "power_climatology": _power_climatology_url(lat, lon),
+    }
+
+
+def record(lat: float = LAT, lon: float = LON, out_dir: Path = FIXTURES_DIR) -> None:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name, url in fixture_urls(lat, lon, date.today()).items():
+        resp = requests.get(url, timeout=60)
+        resp.raise_for_status()
+        with open(out_dir / f"{name}.json", "w", encoding="utf-8") as fh:
+            json.dump(resp.json(), fh, ensure_ascii=False, separators=(",", ":"))
+        print(f"[INFO] Recorded {name} ({len(resp.content) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lat", type=float, default=LAT)
+    parser.add_argument("--lon", type=float, default=LON)
+    parser.add_argument("--out", type=Path, default=FIXTURES_DIR)
+    args = parser.parse_args()
+    record(args.lat, args.lon, args.out)
@@ -0,0 +1,45 @@
+"""
+Server-side callbacks invoked directly, as Dash would after a page or
+dropdown change. Each benchmark runs with the app's caches warm (the first
+call fills them), which is what most requests see; the cold builds are
+covered by `test_fwi.py` and `test_services.py`.
+"""
+from __future__ import annotations
+
+import pytest
+
+CAMP, BLOCK = "Camp 11", "C"
+SUMMARY = object()  # replaced by the live `camp-summary-store` contents
+
+CALLBACKS = [
+    pytest.param("page-content.children", ("/block",), id="page_content"),
+    pytest.param("camp-summary-store.data", (0, None), id="camp_summary_store"),
+    pytest.param("site-details.children", (CAMP, SUMMARY), id="site_dashboard"),
+    pytest.param("site-fwi-content.children", (CAMP, "current", SUMMARY), id="site_fwi_current"),
+    pytest.param("site-fwi-content.children", (CAMP, "monthly", SUMMARY), id="site_fwi_monthly"),
+    pytest.param("site-fwi-content.children", (CAMP, "forecasted", SUMMARY), id="site_fwi_forecast"),
+    pytest.param("site-fri-content.children", (CAMP, "current", SUMMARY), id="site_fri_current"),
+    pytest.param("site-fri-content.children", (CAMP, "monthly", SUMMARY), id="site_fri_monthly"),
+    pytest.param("site-fri-content.children", (CAMP, "forecasted", SUMMARY), id="site_fri_forecast"),
+    pytest.param("windy-iframe.src", (CAMP,), id="windy"),
+    pytest.param("block-block-dropdown.options", (CAMP,), id="block_dropdown"),
+    pytest.param("block-page-body.children", (CAMP, BLOCK), id="block_page"),
+    pytest.param("block-fwi-content.children", ("forecasted", CAMP, BLOCK), id="block_fwi_forecast"),
+    pytest.param("block-fri-content.children", ("forecasted", CAMP, BLOCK), id="block_fri_forecast"),
+    pytest.param("action-plan-content.children", (CAMP, BLOCK), id="action_plan"),
+    pytest.param("equipment-marker-layer.children", (CAMP, BLOCK, "recorded"), id="equipment_map_block"),
+    pytest.param("equipment-marker-layer.children", (None, None, "recorded"), id="equipment_map_all"),
+    pytest.param(
+        "equipment-inventory-table.data",
+        (0, 15, [{"column_id": "Landmark", "direction": "asc"}], "{Overall status} = Functional", "camp", CAMP, BLOCK),
+        id="equipment_inventory",
+    ),
+    pytest.param("contact-content.children", (1, CAMP, False), id="contact"),
+]
+
+
+@pytest.mark.parametrize("output, args", CALLBACKS)
+def test_callback(benchmark, invoke_callback, summary_store, output, args):
+    args = tuple(summary_store if arg is SUMMARY else arg for arg in args)
+    invoke_callback(output, *args)
+    benchmark(invoke_callback, output, *args)
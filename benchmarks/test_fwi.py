@@ -0,0 +1,63 @@
+"""FWI/FRI computations from `fire_risk.legacy.fwi_fri` on the recorded weather."""
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from fire_risk.legacy.fwi_fri import (
+    _build_daily_weather_df_from_json,
+    apply_dynamic_fsi_adjustment,
+    compute_fwi_sequence_xclim,
+    get_monthly_fwi_xclim,
+    monthly_fwi_cache,
+)
+
+LAT, LON = 21.1894, 92.1553
+BASE_FSI = 55.0
+
+
+def _recorded_range(payload: dict) -> tuple[date, date]:
+    days = payload["daily"]["time"]
+    return date.fromisoformat(days[0]), date.fromisoformat(days[-1])
+
+
+@pytest.fixture(scope="module")
+def weather_frames(archive_payload, forecast_payload):
+    return {
+        14: _build_daily_weather_df_from_json(forecast_payload, *_recorded_range(forecast_payload)),
+        90: _build_daily_weather_df_from_json(archive_payload, *_recorded_range(archive_payload)),
+    }
+
+
+@pytest.mark.parametrize("days", [14, 90])
+def test_build_daily_weather_df_from_json(benchmark, archive_payload, forecast_payload, days):
+    payload = forecast_payload if days == 14 else archive_payload
+    result = benchmark(_build_daily_weather_df_from_json, payload, *_recorded_range(payload))
+    assert len(result) == days
+
+
+@pytest.mark.parametrize("days", [14, 90])
+def test_compute_fwi_sequence_xclim(benchmark, weather_frames, days):
+    result = benchmark(compute_fwi_sequence_xclim, weather_frames[days], LAT, 85.0, 6.0, 15.0)
+    assert len(result) == days
+    assert result["FWI"].notna().all()
+
+
+def test_get_monthly_fwi_xclim_synthetic_year(benchmark):
+    # Cleared before every round so each one fetches and builds the
+    # synthetic year instead of reading the module cache.
+    result = benchmark.pedantic(
+        get_monthly_fwi_xclim,
+        args=(LAT, LON),
+        setup=monthly_fwi_cache.clear,
+        rounds=10,
+        warmup_rounds=1,
+    )
+    assert len(result) == 12
+
+
+def test_apply_dynamic_fsi_adjustment(benchmark, weather_frames):
+    forecast = compute_fwi_sequence_xclim(weather_frames[14], LAT)
+    result = benchmark(apply_dynamic_fsi_adjustment, forecast, BASE_FSI)
+    assert result["FRI"].notna().all()
@@ -0,0 +1,46 @@
+"""Camp summary build and the SQLite TTL cache."""
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from fire_risk.legacy.data import build_current_camp_summary, current_data
+from fire_risk.legacy.fwi_fri import fwi_cache
+from fire_risk.services.cache import TTLCache
+
+
+def test_build_current_camp_summary(benchmark, weather_stub):
+    # Every round recomputes FWI for all camps (90-day archive replay plus
+    # the noon forecast per camp) rather than reading `fwi_cache`.
+    current_data()
+    summary = benchmark.pedantic(
+        build_current_camp_summary,
+        kwargs={"force_refresh": True},
+        setup=fwi_cache.clear,
+        rounds=3,
+        warmup_rounds=0,
+    )
+    assert summary["FWI"].notna().all()
+
+
+@pytest.fixture
+def ttl_cache(tmp_path):
+    return TTLCache(str(tmp_path / "bench_cache.sqlite"))
+
+
+@pytest.fixture(scope="module")
+def cached_frame():
+    return pd.DataFrame({"date": pd.date_range("2026-01-01", periods=14).astype(str), "FWI": range(14)})
+
+
+def test_ttl_cache_set(benchmark, ttl_cache, cached_frame):
+    benchmark(ttl_cache.set, "forecast:bench", cached_frame, 900)
+
+
+def test_ttl_cache_get_hit(benchmark, ttl_cache, cached_frame):
+    ttl_cache.set("forecast:bench", cached_frame, ttl_seconds=900)
+    assert benchmark(ttl_cache.get, "forecast:bench") is not None
+
+
+def test_ttl_cache_get_miss(benchmark, ttl_cache):
+    assert benchmark(ttl_cache.get, "forecast:missing") is None
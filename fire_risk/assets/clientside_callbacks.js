@@ -0,0 +1,166 @@
+// Clientside callbacks (dash.ClientsideFunction, namespace "fireRisk") for
+// UI state and the overview filter, which need no server round trip.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    fireRisk: {
+        toggleEquipmentModal: function (openClicks, closeClicks) {
+            return (openClicks || 0) > (closeClicks || 0);
+        },
+
+        toggleNavFilters: function (pathname) {
+            const style = function (display) {
+                return {display: display, alignItems: "center", justifyContent: "flex-end"};
+            };
+            if (pathname === "/") {
+                return [style("flex"), style("none")];
+            }
+            if (pathname === "/block") {
+                return [style("none"), style("flex")];
+            }
+            return [style("none"), style("none")];
+        },
+
+        toggleIndicatorModal: function (openClicks, closeClicks, isOpen) {
+            const trigger = window.dash_clientside.callback_context.triggered_id;
+            if (trigger === "indicator-definition-link" && (openClicks || 0) > 0) {
+                return true;
+            }
+            if (trigger === "close-indicator-modal" && (closeClicks || 0) > 0) {
+                return false;
+            }
+            return isOpen;
+        },
+
+        openActionPlan: function (nClicks, isOpen) {
+            return nClicks ? true : isOpen;
+        },
+
+        equipmentMapTitle: function (camp, block) {
+            let blockText = block ? String(block).trim() : "";
+            const campText = camp ? String(camp).trim() : "";
+            if (blockText && !blockText.toLowerCase().startsWith("block")) {
+                blockText = "Block " + blockText;
+            }
+            if (blockText && campText) {
+                return "Access and Infrastructure Map for " + blockText + ", Camp " + campText;
+            }
+            if (blockText) {
+                return "Access and Infrastructure Map for " + blockText;
+            }
+            if (campText) {
+                return "Access and Infrastructure Map for Camp " + campText;
+            }
+            return "Access and Infrastructure Map";
+        },
+
+        // Overview page from the camp summary store ({columns, rows}); the
+        // map and donut keep the styling they were rendered with and only
+        // get new values.
+        filterOverview: function (severity, summary, mapFig, donutFig) {
+            const dc = window.dash_clientside;
+            if (!summary || !summary.rows) {
+                throw dc.PreventUpdate;
+            }
+            const col = {};
+            summary.columns.forEach(function (name, i) { col[name] = i; });
+
+            const camps = summary.rows
+                .filter(function (r) { return severity === "All" || r[col.FRI_Class] === severity; })
+                .map(function (r) {
+                    return {
+                        CampName: r[col.CampName],
+                        FSI: Math.ceil(r[col.FSI_Calculated]),
+                        FWI: Math.ceil(r[col.FWI]),
+                        FRI: Math.ceil(r[col.FRI]),
+                        FRI_Class: r[col.FRI_Class],
+                    };
+                })
+                .sort(function (a, b) { return b.FRI - a.FRI; });
+
+            const tableData = camps.map(function (c, i) {
+                return {Rank: i + 1, Camp: c.CampName, FSI: c.FSI, FWI: c.FWI, FRI: c.FRI, "FRI Severity": c.FRI_Class};
+            });
+            const counts = {};
+            camps.forEach(function (c) { counts[c.FRI_Class] = (counts[c.FRI_Class] || 0) + 1; });
+            const note = function (text) {
+                return camps.length ? [] : [{text: text, x: 0.5, y: 0.5, showarrow: false}];
+            };
+
+            // The low-bandwidth page has no map figure to fill in.
+            const map = !(mapFig && mapFig.data && mapFig.data.length) ? dc.no_update : Object.assign({}, mapFig, {
+                data: [Object.assign({}, mapFig.data[0], {
+                    locations: camps.map(function (c) { return c.CampName; }),
+                    z: camps.map(function (c) { return c.FRI; }),
+                    hovertext: camps.map(function (c) { return c.CampName; }),
+                    customdata: camps.map(function (c) { return [c.FSI, c.FWI, c.FRI, c.CampName]; }),
+                })],
+                layout: Object.assign({}, mapFig.layout, {annotations: note("No camps match the selected filter.")}),
+            });
+            const donut = Object.assign({}, donutFig, {
+                data: [Object.assign({}, donutFig.data[0], {
+                    values: donutFig.data[0].labels.map(function (label) { return counts[label] || 0; }),
+                })],
+                layout: Object.assign({}, donutFig.layout, {annotations: note("No data")}),
+            });
+
+            const P = function (text, style) {
+                return {namespace: "dash_html_components", type: "P", props: {children: text, style: style}};
+            };
+            if (!camps.length) {
+                return [
+                    tableData, map, donut, "0", "0", "0", "0",
+                    P("No camps available under the selected severity filter."),
+                    P("No operational summary available for the current filter."),
+                ];
+            }
+
+            const extreme = counts["Extreme risk"] || 0;
+            const high = counts["High risk"] || 0;
+            const avg = Math.round(camps.reduce(function (s, c) { return s + c.FRI; }, 0) / camps.length * 10) / 10;
+            const top5 = {
+                namespace: "dash_html_components",
+                type: "Ol",
+                props: {
+                    children: camps.slice(0, 5).map(function (c) {
+                        return {
+                            namespace: "dash_html_components",
+                            type: "Li",
+                            props: {children: c.CampName + " — FRI " + c.FRI + " (" + c.FRI_Class + ")"},
+                        };
+                    }),
+                    style: {paddingLeft: "18px", fontSize: "14px", marginBottom: "0"},
+                },
+            };
+            const highest = camps[0];
+            const lowest = camps[camps.length - 1];
+            const narrative = {
+                namespace: "dash_html_components",
+                type: "Div",
+                props: {children: [
+                    P(
+                        "There are " + camps.length + " camps in the current view. " +
+                        extreme + " camp(s) fall under extreme risk and " + high + " under high risk.",
+                        {fontSize: "14px"}
+                    ),
+                    P(
+                        "The highest-risk camp is " + highest.CampName + " with an FRI of " + highest.FRI +
+                        " (" + highest.FRI_Class + "). The lowest-risk camp in the current view is " +
+                        lowest.CampName + " with an FRI of " + lowest.FRI + ".",
+                        {fontSize: "14px"}
+                    ),
+                    P(
+                        "Operational attention should focus first on camps in the extreme and high-risk categories, " +
+                        "while maintaining prevention and preparedness measures in moderate-risk camps.",
+                        {fontSize: "14px", marginBottom: "0"}
+                    ),
+                ]},
+            };
+
+            return [
+                tableData, map, donut,
+                String(camps.length), String(extreme), String(high),
+                Number.isInteger(avg) ? avg.toFixed(1) : String(avg),
+                top5, narrative,
+            ];
+        },
+    },
+});
@@ -0,0 +1,52 @@
+// Client-side rendering for the clustered equipment layer (dl.GeoJSON).
+// Points arrive as {id, s} (row id, status code); colours come from the
+// layer's hideout and popup details are fetched when a popup opens.
+window.fireRisk = Object.assign({}, window.fireRisk, {
+    equipment: {
+        pointToLayer: function (feature, latlng, context) {
+            const hideout = context.hideout || {};
+            const colors = hideout.colors || [];
+            const marker = L.circleMarker(latlng, {
+                radius: 6,
+                color: colors[feature.properties.s] || "orange",
+                fill: true,
+                fillOpacity: 0.8,
+            });
+            marker.bindPopup("Loading…", {maxWidth: 350, minWidth: 260});
+            marker.on("popupopen", function (e) {
+                fetch(hideout.popupUrl + feature.properties.id)
+                    .then(function (r) { return r.ok ? r.json() : Promise.reject(r.status); })
+                    .then(function (d) { e.popup.setContent(window.fireRisk.equipment.popupHtml(d)); })
+                    .catch(function () { e.popup.setContent("Details unavailable."); });
+            });
+            return marker;
+        },
+
+        clusterToLayer: function (feature, latlng, index, context) {
+            const count = feature.properties.point_count;
+            const size = count < 50 ? 30 : count < 500 ? 38 : 46;
+            const icon = L.divIcon({
+                html: '<div style="width:' + size + 'px;height:' + size + 'px;line-height:' + size + 'px;' +
+                      'border-radius:50%;background:rgba(0,51,160,0.75);color:#fff;' +
+                      'text-align:center;font-size:12px;font-weight:600;">' +
+                      feature.properties.point_count_abbreviated + '</div>',
+                className: "",
+                iconSize: L.point(size, size),
+            });
+            return L.marker(latlng, {icon: icon});
+        },
+
+        popupHtml: function (d) {
+            const esc = function (v) {
+                return String(v).replace(/[&<>"']/g, function (c) {
+                    return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}[c];
+                });
+            };
+            let html = '<div style="min-width:260px"><h6 class="mb-1">' + esc(d.title) + '</h6>';
+            d.fields.forEach(function (f) {
+                html += '<p class="mb-1">' + esc(f[0]) + ': ' + esc(f[1]) + '</p>';
+            });
+            return html + '</div>';
+        },
+    },
+});
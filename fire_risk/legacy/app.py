@@ -1,3 +1,6 @@
+import os
+from functools import lru_cache
+
 import dash
 import dash_bootstrap_components as dbc
 import dash_leaflet as dl
@@ -9,40 +12,47 @@ from fire_risk.legacy.callbacks import (
     register_overview_callbacks,
     register_site_callbacks,
 )
+from fire_risk.legacy.data import current_data
 from fire_risk.legacy.layouts import (
     FA_URL,
     about_layout,
     block_level_layout,
-    navbar,
+    build_navbar,
     overview_layout,
     site_level_layout,
 )
+from fire_risk.services.aggregates import get_equipment_aggregates
+from fire_risk.services.equipment import register_equipment_routes
+from fire_risk.services.lite import is_lite, register_lite_mode
+from fire_risk.services.spatial import get_coverage_index
+from fire_risk.services.tiles import register_tile_routes
+from fire_risk.services.warmup import PRELOADED, register_readiness_routes, start_worker
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 ASSETS_DIR = BASE_DIR / "assets"
 
-print("BASE_DIR:", BASE_DIR)
-print("ASSETS_DIR:", ASSETS_DIR)
-print("LOGO EXISTS:", (ASSETS_DIR / "iom_logo_white.png").exists())
+# Checking callbacks against every page means building all of them at import,
+# so it is only done in development.
+STRICT_CALLBACKS = os.environ.get("FIRE_RISK_STRICT_CALLBACKS", "0").strip().lower() in ("1", "true", "yes")
 
 app = dash.Dash(
     __name__,
     external_stylesheets=[dbc.themes.BOOTSTRAP, FA_URL],
     assets_folder=str(ASSETS_DIR),
     assets_url_path="/assets",
+    # Linked instead of the CDN stylesheets in low-bandwidth mode only.
+    assets_ignore=r"^lite\.css$",
 )
 app.title = "Fire Risk Analysis - Site-Level"
-app.config.suppress_callback_exceptions = True
-
-print("ASSETS_DIR =", ASSETS_DIR)
-print("LOGO EXISTS =", (ASSETS_DIR / "iom_logo_white.png").exists())
+app.config.suppress_callback_exceptions = not STRICT_CALLBACKS
 
 
-def build_app_layout():
+def build_app_layout(lite=False):
     return html.Div([
         dcc.Location(id="url", refresh=False),
         dcc.Interval(id="weather-refresh-interval", interval=15 * 60 * 1000, n_intervals=0),
-        navbar,
+        dcc.Store(id="camp-summary-store"),
+        build_navbar(lite),
         dbc.Modal([
             dbc.ModalHeader(dbc.ModalTitle("Indicator Definitions")),
             dbc.ModalBody(id="indicator-definition-content"),
@@ -54,6 +64,16 @@ def build_app_layout():
                 dbc.ModalTitle("Access and Infrastructure Map", id="equipment-map-modal-title")
             ),
             dbc.ModalBody([
+                dbc.RadioItems(
+                    id="equipment-match-mode",
+                    options=[
+                        {"label": "Recorded camp/block", "value": "recorded"},
+                        {"label": "Located inside the outline", "value": "location"},
+                    ],
+                    value="recorded",
+                    inline=True,
+                    className="mb-2",
+                ),
                 html.Div(id="equipment-summary-cards", className="mb-3"),
                 dl.Map(
                     id="equipment-map",
@@ -75,50 +95,83 @@ def build_app_layout():
     ])
 
 
-app.layout = build_app_layout()
-app.validation_layout = html.Div([
-    app.layout,
-    site_level_layout(),
-    block_level_layout(),
-    overview_layout(),
-    about_layout(),
-    html.Button(id="open-action-plan"),
-    html.Button(id="indicator-definition-link"),
-    html.Div(id="block-page-body"),
-    html.Div(id="block-fri-content"),
-    html.Div(id="block-fwi-content"),
-    html.Div(id="site-fwi-content"),
-    html.Div(id="site-fwi-narrative"),
-    html.Div(id="site-fri-content"),
-    dash_table.DataTable(id="overview-table"),
-    dcc.Graph(id="overview-heatmap"),
-    html.Div(id="site-details"),
-    html.Div(id="fsi-index"),
-    html.Div(id="fwi-index"),
-    html.Div(id="fri-index"),
-    dcc.Graph(id="block-bar-chart"),
-    dcc.Graph(id="fire-risk-map"),
-    dash_table.DataTable(id="susceptibility-table"),
-    html.Iframe(id="windy-iframe"),
-    dbc.Collapse(id="contact-collapse"),
-    html.Div(id="contact-content"),
-    dcc.Graph(id="overview-severity-donut"),
-    html.Div(id="overview-kpi-total-camps"),
-    html.Div(id="overview-kpi-extreme"),
-    html.Div(id="overview-kpi-high"),
-    html.Div(id="overview-kpi-avg-fri"),
-    html.Div(id="overview-top5"),
-    html.Div(id="overview-narrative"),
-    html.Button(id="btn-open-equipment-map"),
-    html.Button(id="close-equipment-map"),
-    html.Div(id="equipment-summary-cards"),
-    dl.Map(id="equipment-map"),
-    html.Div(id="equipment-boundary-layer"),
-    html.Div(id="equipment-marker-layer"),
-    html.Div(id="equipment-debug", style={"display": "none"}),
-])
+@lru_cache(maxsize=4)
+def _app_layout(data_version, lite):
+    return build_app_layout(lite)
+
+
+def serve_app_layout():
+    # Served on every page load; the navbar's camp list only changes with the data.
+    return _app_layout(current_data().version, is_lite())
+
+
+def build_validation_layout():
+    return html.Div([
+        build_app_layout(),
+        site_level_layout(),
+        block_level_layout(),
+        overview_layout(),
+        about_layout(),
+        html.Button(id="open-action-plan"),
+        html.Button(id="indicator-definition-link"),
+        html.Div(id="block-page-body"),
+        html.Div(id="block-fri-content"),
+        html.Div(id="block-fwi-content"),
+        html.Div(id="site-fwi-content"),
+        html.Div(id="site-fwi-narrative"),
+        html.Div(id="site-fri-content"),
+        dash_table.DataTable(id="overview-table"),
+        dcc.Graph(id="overview-heatmap"),
+        html.Div(id="site-details"),
+        html.Div(id="site-map-lite"),
+        html.Div(id="fsi-index"),
+        html.Div(id="fwi-index"),
+        html.Div(id="fri-index"),
+        dcc.Graph(id="block-bar-chart"),
+        dcc.Graph(id="fire-risk-map"),
+        dash_table.DataTable(id="susceptibility-table"),
+        html.Iframe(id="windy-iframe"),
+        dbc.Collapse(id="contact-collapse"),
+        html.Div(id="contact-content"),
+        dcc.Graph(id="overview-severity-donut"),
+        html.Div(id="overview-kpi-total-camps"),
+        html.Div(id="overview-kpi-extreme"),
+        html.Div(id="overview-kpi-high"),
+        html.Div(id="overview-kpi-avg-fri"),
+        html.Div(id="overview-top5"),
+        html.Div(id="overview-narrative"),
+        html.Button(id="btn-open-equipment-map"),
+        html.Button(id="close-equipment-map"),
+        html.Div(id="equipment-summary-cards"),
+        dbc.RadioItems(id="equipment-match-mode"),
+        dl.Map(id="equipment-map"),
+        html.Div(id="equipment-boundary-layer"),
+        html.Div(id="equipment-marker-layer"),
+        html.Div(id="equipment-debug", style={"display": "none"}),
+        dash_table.DataTable(id="equipment-inventory-table"),
+        dbc.RadioItems(id="equipment-inventory-scope"),
+        html.Div(id="equipment-inventory-count"),
+    ])
+
+
+if STRICT_CALLBACKS:
+    app.validation_layout = build_validation_layout()
+app.layout = serve_app_layout
 
 register_common_callbacks(app)
 register_overview_callbacks(app)
 register_block_callbacks(app)
-register_site_callbacks(app)
\ No newline at end of file
+register_site_callbacks(app)
+register_tile_routes(app.server)
+register_equipment_routes(app.server)
+register_readiness_routes(app.server)
+register_lite_mode(app)
+
+get_equipment_aggregates()
+get_equipment_aggregates(by="location")
+get_coverage_index()
+
+# Under gunicorn (gunicorn.conf.py) the watcher and warm-up start in each
+# worker after fork instead.
+if not PRELOADED:
+    start_worker()
@@ -1,27 +1,23 @@
 import math
-from datetime import date
 
 import dash
 import dash_bootstrap_components as dbc
 import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from dash import Input, Output, State, dcc, html, dash_table
+from dash import ClientsideFunction, Input, Output, State, dcc, html, dash_table
 from fire_risk.legacy.layouts import section_card, page_footer
 
 from fire_risk.legacy.layouts import section_card
-from fire_risk.legacy.data import cleaned_data, response_details, block_geojson
+from fire_risk.legacy.data import current_data
 from fire_risk.legacy.fwi_fri import (
     categorize_fri,
     categorize_fwi,
-    classify_fsi,
     compute_fri,
-    get_14day_fire_forecast,
-    get_fwi_xclim,
     get_weather_noon,
 )
 from fire_risk.legacy.layouts import section_card
+from fire_risk.services import figures
 from fire_risk.services.indicator_definitions import build_indicator_score_table
 from fire_risk.services.outlook_helpers import (
     build_fire_risk_outlook_calendar,
@@ -30,81 +26,54 @@ from fire_risk.services.outlook_helpers import (
     build_monthly_fri_narrative,
     build_monthly_fwi_narrative,
 )
+from fire_risk.services.figure_cache import cached_figures, cached_forecast, frame_fingerprint
+from fire_risk.services.geometry import index_for_zoom
+from fire_risk.services.inventory import INVENTORY_COLUMNS, get_equipment_inventory
+from fire_risk.services.lite import is_lite, lite_table, sparkline_row
+from fire_risk.services.repository import get_repository
 from fire_risk.services.risk_helpers import build_block_advisory_narrative
+from fire_risk.services.spatial import format_coverage, get_coverage_index
+from fire_risk.services.tiles import outline_layers
 from fire_risk.services.common import OUTLOOK_YEAR, OUTLOOK_LABEL
+from fire_risk.services.block_context import DIMENSIONS, get_block_context
 
 MONTH_ORDER = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+BLOCK_MAP_ZOOM = 13
+INVENTORY_PAGE_SIZE = 15
+INVENTORY_LABELS = {
+    "Sub_block": "Block",
+    "Type_of facility": "Facility type",
+    "Overall status": "Status",
+    "Majhee_section": "Majhee section",
+    "Source_of water": "Water source",
+}
 
 
 def register_callbacks(app):
     def build_block_level_content(camp_name, block_name):
-        block_data = cleaned_data[
-            (cleaned_data["CampName"] == camp_name)
-            & (cleaned_data["Block"] == block_name)
-        ]
-
-        if block_data.empty:
+        block = get_block_context(camp_name, block_name)
+        if block.empty:
             return html.P("No data available for this block.", style={"color": "red"})
 
-        camp_all = cleaned_data[cleaned_data["CampName"] == camp_name]
-
-        assessment_text = "N/A"
-        if "assessment_date" in block_data.columns:
-            dates = pd.to_datetime(block_data["assessment_date"], errors="coerce").dropna()
-            if not dates.empty:
-                min_date = dates.min().date().isoformat()
-                max_date = dates.max().date().isoformat()
-                assessment_text = min_date if min_date == max_date else f"{min_date} to {max_date}"
-
-        population_text = "N/A"
-        pop_col = "ENV_003a"
-        if pop_col in block_data.columns:
-            site_pop = pd.to_numeric(block_data[pop_col], errors="coerce").fillna(0).sum()
-            population_text = f"{site_pop:,.0f}"
-
-        dims_mean = block_data[["Environment", "Fuel", "Behaviour", "Response"]].mean()
-        fsi_value = math.ceil(
-            (dims_mean["Environment"] +
-             dims_mean["Fuel"] +
-             dims_mean["Behaviour"] +
-             dims_mean["Response"]) / 4
-        )
-        fsi_class = classify_fsi(fsi_value)
-
-        env_score = math.ceil(dims_mean["Environment"])
-        fuel_score = math.ceil(dims_mean["Fuel"])
-        beh_score = math.ceil(dims_mean["Behaviour"])
-        res_score = math.ceil(dims_mean["Response"])
+        assessment_text = block.assessment_text
+        population_text = block.population_text
 
-        advisory_points, advisory_overall = build_block_advisory_narrative(
-            env_score, fuel_score, beh_score, res_score
-        )
+        fsi_value = block.fsi_value
+        fsi_class = block.fsi_class
 
-        lat = block_data["Latitude"].mean()
-        lon = block_data["Longitude"].mean()
+        advisory_points, advisory_overall = build_block_advisory_narrative(*block.scores.values())
 
-        today_iso = date.today().isoformat()
-        fwi_value = math.ceil(get_fwi_xclim(lat, lon, date_for=today_iso))
+        lat, lon = block.lat, block.lon
+        today_iso = block.today_iso
+        fwi_value = block.fwi_value
 
         fri_value = math.ceil(fsi_value * (1 + fwi_value / 100))
         fri_severity = categorize_fri(fri_value)
 
-        block_stats = (
-            camp_all
-            .groupby("Block")[["Environment", "Fuel", "Behaviour", "Response", "Latitude", "Longitude"]]
-            .mean()
-            .reset_index()
+        block_stats = block.camp_blocks.assign(
+            FRI=lambda d: np.ceil(d["FSI"] * (1 + fwi_value / 100)).astype(int)
         )
-
-        block_stats["FSI"] = (
-            block_stats["Environment"] +
-            block_stats["Fuel"] +
-            block_stats["Behaviour"] +
-            block_stats["Response"]
-        ) / 4.0
-
-        block_stats["FRI"] = np.ceil(block_stats["FSI"] * (1 + fwi_value / 100)).astype(int)
         block_stats["FRI_Class"] = block_stats["FRI"].apply(categorize_fri)
 
         block_stats_sorted = block_stats.sort_values("FRI", ascending=False).reset_index(drop=True)
@@ -118,12 +87,15 @@ def register_callbacks(app):
         b_mod = counts_block.get("Moderate risk", 0)
         b_low = counts_block.get("Low risk", 0)
 
+        coverage = get_coverage_index().block(camp_name, block_name)
+
         site_card_body = html.Div(
             [
                 html.P([html.Strong("Camp: "), camp_name]),
                 html.P([html.Strong("Block: "), block_name]),
                 html.P([html.Strong("Assessment date: "), assessment_text]),
                 html.P([html.Strong("Site population: "), population_text]),
+                html.P([html.Strong("Response coverage: "), format_coverage(coverage)]),
             ],
             style={"fontSize": "14px"},
         )
@@ -362,64 +334,41 @@ def register_callbacks(app):
             className="g-3 mb-3",
         )
 
-        map_children = html.P("Block boundary data not available.")
-        if block_geojson is not None:
-            target = (block_name or "").strip().upper()
-
-            camp_feats = []
-            selected_feats = []
-
-            for f in block_geojson["features"]:
-                props = f.get("properties", {})
-                camp_match = (props.get("CampName_1", "").strip().upper() == camp_name.strip().upper())
-                if not camp_match:
-                    continue
-
-                camp_feats.append(f)
-
-                label = props.get("BlockLabel", "")
-                name_ = props.get("BlockName", "")
-                label_match = label.strip().upper() == target
-                name_match = name_.strip().upper() == target
-                if label_match or name_match:
-                    selected_feats.append(f)
-
-            if camp_feats and selected_feats:
-                selected_geojson = {
-                    "type": "FeatureCollection",
-                    "features": camp_feats,
-                }
-
-                coords = selected_feats[0]["geometry"]["coordinates"][0]
-                lons, lats = zip(*coords)
-                centre = {
-                    "lat": (max(lats) + min(lats)) / 2,
-                    "lon": (max(lons) + min(lons)) / 2,
-                }
+        if is_lite():
+            # Low-bandwidth mode: the camp's blocks as a table and the block's
+            # forecast as sparklines, without the map or the Windy embed.
+            forecast_df = cached_forecast(lat, lon, float(fsi_value))
+            if forecast_df.empty:
+                sparklines = [html.P("Forecast data is currently unavailable.", className="text-muted small mb-1")]
+            else:
+                sparklines = [
+                    sparkline_row("FRI, next 14 days", forecast_df["FRI"]),
+                    sparkline_row("FWI, next 14 days", forecast_df["FWI"]),
+                ]
+            table = lite_table(
+                block_stats_sorted.assign(FSI=block_stats_sorted["FSI"].round(0).astype(int)),
+                {"Block": "Block", "FSI": "FSI", "FRI": "FRI", "FRI_Class": "FRI Severity"},
+                highlight=block_stats_sorted["Block"] == block_name,
+            )
+            maps_row = dbc.Row(
+                dbc.Col(section_card(f"Blocks in {camp_name} by FRI", html.Div([*sparklines, table])), width=12),
+                className="g-3 mb-3",
+            )
+        else:
+            map_children = html.P("Block boundary data not available.")
+            outlines = index_for_zoom(BLOCK_MAP_ZOOM)
+            camp_blocks = outlines.blocks_in_camp(camp_name)
+            block_entry = outlines.block(camp_name, block_name)
+            if camp_blocks is not None and block_entry is not None:
+                target = (block_name or "").strip().upper()
+                selected_geojson = camp_blocks
+                centre = block_entry["centre"]
 
                 df_sel = block_stats[["Block", "FRI"]].copy()
                 df_sel = df_sel.rename(columns={"Block": "BlockLabel"})
                 df_sel["is_selected"] = df_sel["BlockLabel"].str.strip().str.upper() == target
                 df_sel["FRI_for_map"] = np.where(df_sel["is_selected"], df_sel["FRI"], 0)
 
-                map_fig = px.choropleth_mapbox(
-                    df_sel,
-                    geojson=selected_geojson,
-                    locations="BlockLabel",
-                    featureidkey="properties.BlockLabel",
-                    color="FRI_for_map",
-                    range_color=(0, max(100, float(df_sel["FRI"].max()) + 5)),
-                    color_continuous_scale=["#dddddd", "#fee8c8", "#fdbb84", "#e34a33"],
-                    center=centre,
-                    zoom=13,
-                    opacity=0.85,
-                    mapbox_style="carto-positron",
-                    hover_name="BlockLabel",
-                    hover_data={"FRI_for_map": False, "FRI": True},
-                )
-
-                map_fig.update_traces(marker_line_color="black", marker_line_width=1.5)
-
                 hover_text = (
                     "<b>Block: %{hovertext}</b><br>"
                     "FRI: %{customdata[0]}<br>"
@@ -430,47 +379,58 @@ def register_callbacks(app):
                     "<extra></extra>"
                 )
 
-                map_fig.update_traces(
+                map_fig = figures.choropleth_mapbox(
+                    selected_geojson,
+                    df_sel["BlockLabel"],
+                    df_sel["FRI_for_map"],
+                    featureidkey="properties.BlockLabel",
+                    range_color=(0, max(100, float(df_sel["FRI"].max()) + 5)),
+                    colorscale=["#dddddd", "#fee8c8", "#fdbb84", "#e34a33"],
+                    colorbar_title="FRI",
+                    center=centre,
+                    zoom=BLOCK_MAP_ZOOM,
+                    opacity=0.85,
                     customdata=np.stack([df_sel["FRI"]], axis=-1),
                     hovertemplate=hover_text,
-                )
-
-                map_fig.update_layout(
-                    margin={"l": 0, "r": 0, "t": 30, "b": 0},
-                    coloraxis_colorbar=dict(title="FRI", ticks="outside"),
+                    trace={"marker": {"line": {"color": "black", "width": 1.5}}},
+                    layout={
+                        "margin": {"l": 0, "r": 0, "t": 30, "b": 0},
+                        "coloraxis": {"colorbar": {"ticks": "outside"}},
+                        "mapbox": {"layers": outline_layers()},
+                    },
                 )
 
                 map_children = dcc.Graph(figure=map_fig, config={"displayModeBar": False})
 
-        windy_src = (
-            f"https://embed.windy.com/embed2.html?"
-            f"lat={lat}&lon={lon}"
-            f"&detailLat={lat}&detailLon={lon}"
-            f"&zoom=14"
-            f"&level=surface"
-            f"&overlay=wind"
-            f"&marker=true"
-            f"&markerWidth=60"
-            f"&markerHeight=60"
-            f"&location=coordinates"
-            f"&type=map"
-        )
-        windy_iframe = html.Iframe(
-            id="windy-block-iframe",
-            src=windy_src,
-            style={"width": "100%", "height": "400px", "border": "none"},
-        )
+            windy_src = (
+                f"https://embed.windy.com/embed2.html?"
+                f"lat={lat}&lon={lon}"
+                f"&detailLat={lat}&detailLon={lon}"
+                f"&zoom=14"
+                f"&level=surface"
+                f"&overlay=wind"
+                f"&marker=true"
+                f"&markerWidth=60"
+                f"&markerHeight=60"
+                f"&location=coordinates"
+                f"&type=map"
+            )
+            windy_iframe = html.Iframe(
+                id="windy-block-iframe",
+                src=windy_src,
+                style={"width": "100%", "height": "400px", "border": "none"},
+            )
 
-        maps_row = dbc.Row(
-            [
-                dbc.Col(section_card("Selected Block Boundary (FRI)", map_children), width=6),
-                dbc.Col(section_card("Live Wind Map (Block Focus)", windy_iframe), width=6),
-            ],
-            className="g-3 mb-3",
-        )
+            maps_row = dbc.Row(
+                [
+                    dbc.Col(section_card("Selected Block Boundary (FRI)", map_children), width=6),
+                    dbc.Col(section_card("Live Wind Map (Block Focus)", windy_iframe), width=6),
+                ],
+                className="g-3 mb-3",
+            )
 
-        dims = ["Environment", "Fuel", "Behaviour", "Response"]
-        scores = [math.ceil(dims_mean[d]) for d in dims]
+        dims = DIMENSIONS
+        scores = [block.scores[d] for d in dims]
 
         fig_dims = go.Figure()
         fig_dims.add_trace(
@@ -504,7 +464,7 @@ def register_callbacks(app):
         fig_dims.update_layout(title="FSI Dimensions (Block Summary)", margin=dict(l=60, r=40, t=50, b=40), height=300)
         dims_graph = dcc.Graph(figure=fig_dims, config={"displayModeBar": False})
 
-        indicator_df = build_indicator_score_table(block_data, cleaned_data)
+        indicator_df = build_indicator_score_table(block.block_data, current_data().cleaned_data)
 
         if not indicator_df.empty:
             indicator_table = dash_table.DataTable(
@@ -569,6 +529,58 @@ def register_callbacks(app):
             className="g-3 mb-3",
         )
 
+        inventory_section = section_card(
+            "Equipment Inventory",
+            html.Div(
+                [
+                    dbc.Row(
+                        [
+                            dbc.Col(
+                                dbc.RadioItems(
+                                    id="equipment-inventory-scope",
+                                    options=[
+                                        {"label": "This block", "value": "block"},
+                                        {"label": "This camp", "value": "camp"},
+                                        {"label": "All camps", "value": "all"},
+                                    ],
+                                    value="block",
+                                    inline=True,
+                                ),
+                                width=8,
+                            ),
+                            dbc.Col(
+                                html.Div(id="equipment-inventory-count", className="text-muted text-end"),
+                                width=4,
+                            ),
+                        ],
+                        className="mb-2",
+                    ),
+                    dash_table.DataTable(
+                        id="equipment-inventory-table",
+                        columns=[
+                            {"name": INVENTORY_LABELS.get(col, col), "id": col}
+                            for col in INVENTORY_COLUMNS
+                        ],
+                        page_current=0,
+                        page_size=INVENTORY_PAGE_SIZE,
+                        page_action="custom",
+                        sort_action="custom",
+                        sort_mode="multi",
+                        sort_by=[],
+                        filter_action="custom",
+                        filter_query="",
+                        style_table={"overflowX": "auto"},
+                        style_cell={"textAlign": "left", "padding": "6px", "fontSize": "13px"},
+                        style_header={"fontWeight": "bold", "backgroundColor": "#f2f2f2"},
+                        style_data_conditional=[
+                            {"if": {"filter_query": '{Overall status} contains "Non"', "column_id": "Overall status"}, "color": "#c93c3c", "fontWeight": "bold"},
+                        ],
+                    ),
+                ]
+            ),
+            icon="fas fa-fire-extinguisher",
+        )
+
         return html.Div(
             [
                 top_row,
@@ -582,20 +594,19 @@ def register_callbacks(app):
                 maps_row,
                 html.Hr(style={"borderTop": "1px solid #ccc"}),
                 bottom_row,
+                html.Hr(style={"borderTop": "1px solid #ccc"}),
+                inventory_section,
                 page_footer(),
             ]
         )
 
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction(namespace="fireRisk", function_name="openActionPlan"),
         Output("action-plan-offcanvas", "is_open"),
         Input("open-action-plan", "n_clicks"),
         State("action-plan-offcanvas", "is_open"),
         prevent_initial_call=True,
     )
-    def toggle_action_plan(n_clicks, is_open):
-        if not n_clicks:
-            return is_open
-        return True
 
     @app.callback(
         Output("action-plan-content", "children"),
@@ -608,24 +619,11 @@ def register_callbacks(app):
         if not selected_camp or not selected_block:
             return html.P("Please select a camp and block.")
 
-        block_data = cleaned_data[
-            (cleaned_data["CampName"] == selected_camp)
-            & (cleaned_data["Block"] == selected_block)
-        ]
-
-        if block_data.empty:
+        block = get_block_context(selected_camp, selected_block)
+        if block.empty:
             return html.P("No data available for this block.")
 
-        dims_mean = block_data[["Environment", "Fuel", "Behaviour", "Response"]].mean()
-
-        env_score = math.ceil(dims_mean["Environment"])
-        fuel_score = math.ceil(dims_mean["Fuel"])
-        beh_score = math.ceil(dims_mean["Behaviour"])
-        res_score = math.ceil(dims_mean["Response"])
-
-        advisory_points, advisory_overall = build_block_advisory_narrative(
-            env_score, fuel_score, beh_score, res_score
-        )
+        advisory_points, advisory_overall = build_block_advisory_narrative(*block.scores.values())
 
         return html.Div(
             [
@@ -661,6 +659,31 @@ def register_callbacks(app):
 
         return build_block_level_content(selected_camp, selected_block)
 
+    @app.callback(
+        Output("equipment-inventory-table", "data"),
+        Output("equipment-inventory-table", "page_count"),
+        Output("equipment-inventory-count", "children"),
+        Input("equipment-inventory-table", "page_current"),
+        Input("equipment-inventory-table", "page_size"),
+        Input("equipment-inventory-table", "sort_by"),
+        Input("equipment-inventory-table", "filter_query"),
+        Input("equipment-inventory-scope", "value"),
+        State("block-camp-dropdown", "value"),
+        State("block-block-dropdown", "value"),
+    )
+    def update_equipment_inventory(page_current, page_size, sort_by, filter_query, scope, camp_name, block_name):
+        camp = camp_name if scope in ("camp", "block") else None
+        block = block_name if scope == "block" else None
+        rows, page_count, total = get_equipment_inventory().page(
+            camp,
+            block,
+            page_current=page_current or 0,
+            page_size=page_size or INVENTORY_PAGE_SIZE,
+            sort_by=sort_by,
+            filter_query=filter_query,
+        )
+        return rows, page_count, f"{total:,} item(s)"
+
     @app.callback(
         Output("block-fri-content", "children"),
         [
@@ -673,45 +696,15 @@ def register_callbacks(app):
         if not camp_name or not block_name:
             return html.P("Please select a camp and block.", style={"fontStyle": "italic"})
 
-        block_data = cleaned_data[
-            (cleaned_data["CampName"] == camp_name)
-            & (cleaned_data["Block"] == block_name)
-        ]
-        if block_data.empty:
+        block = get_block_context(camp_name, block_name)
+        if block.empty:
             return html.P("No data available for this block.", style={"color": "red"})
 
-        camp_all = cleaned_data[cleaned_data["CampName"] == camp_name]
-
-        dims_mean = block_data[["Environment", "Fuel", "Behaviour", "Response"]].mean()
-        fsi_value = math.ceil(
-            (dims_mean["Environment"] + dims_mean["Fuel"] +
-             dims_mean["Behaviour"] + dims_mean["Response"]) / 4
-        )
-
-        lat = block_data["Latitude"].mean()
-        lon = block_data["Longitude"].mean()
-        today_iso = date.today().isoformat()
+        fsi_value = block.fsi_value
+        lat, lon = block.lat, block.lon
 
         if active_tab == "current":
-            centroids = camp_all.groupby("Block")[["Latitude", "Longitude"]].mean().reset_index()
-
-            block_stats = (
-                camp_all
-                .groupby("Block")[["Environment", "Fuel", "Behaviour", "Response"]]
-                .mean()
-                .reset_index()
-                .merge(centroids, on="Block", how="left")
-            )
-            block_stats["FSI"] = (
-                block_stats["Environment"] +
-                block_stats["Fuel"] +
-                block_stats["Behaviour"] +
-                block_stats["Response"]
-            ) / 4.0
-            block_stats["FWI"] = block_stats.apply(
-                lambda r: round(get_fwi_xclim(r["Latitude"], r["Longitude"], date_for=today_iso), 1),
-                axis=1,
-            )
+            block_stats = block.camp_blocks.assign(FWI=block.camp_block_fwi.round(1))
             block_stats["FRI"] = compute_fri(block_stats["FSI"], block_stats["FWI"])
             block_stats["FRI_Class"] = block_stats["FRI"].apply(categorize_fri)
 
@@ -726,16 +719,26 @@ def register_callbacks(app):
             colors = ["#1AAB48" if b == block_name else "#0033A0" for b in df["Block"]]
             text_colors = [risk_to_color_fri[c] for c in df["FRI_Class"]]
 
-            fig = px.bar(
+            fig = figures.bar(
                 df,
                 x="Block",
                 y="FRI",
                 text="FRI_Class",
                 labels={"Block": "Block", "FRI": "Fire Risk Index"},
                 title=f"Current FRI by Block in {camp_name}",
+                trace={
+                    "marker": {"color": colors},
+                    "textposition": "outside",
+                    "textfont": {"color": text_colors, "size": 11},
+                    "showlegend": False,
+                },
+                layout={
+                    "xaxis": {"tickangle": -45},
+                    "yaxis": {"range": [0, max(100, float(df["FRI"].max()) + 10)]},
+                    "plot_bgcolor": "white",
+                    "margin": {"l": 40, "r": 20, "t": 60, "b": 120},
+                },
             )
-            fig.update_traces(marker_color=colors, textposition="outside", textfont=dict(color=text_colors, size=11), showlegend=False)
-            fig.update_layout(xaxis_tickangle=-45, plot_bgcolor="white", margin=dict(l=40, r=20, t=60, b=120), yaxis=dict(range=[0, max(100, float(df["FRI"].max()) + 10)]))
             return dcc.Graph(figure=fig, config={"displayModeBar": False})
 
         elif active_tab == "monthly":
@@ -745,33 +748,36 @@ def register_callbacks(app):
             if outlook_df.empty:
                 return html.P("Seasonal outlook data is unavailable.", style={"color": "red"})
 
-            fri_bar = px.bar(
-                outlook_df,
-                x="Month",
-                y="FRI",
-                color="FRI_Risk",
-                text="FRI_Risk",
-                title=f"Projected Monthly Fire Risk Outlook – Block {block_name} ({OUTLOOK_YEAR})",
-                labels={"FRI": "Projected Fire Risk Index"},
-                category_orders={"Month": MONTH_ORDER},
-                color_discrete_map={
-                    "Low risk": "green",
-                    "Moderate risk": "orange",
-                    "High risk": "red",
-                    "Extreme risk": "purple",
-                },
-                template="plotly_white",
-            )
+            def build():
+                fri_bar = figures.bar(
+                    outlook_df,
+                    x="Month",
+                    y="FRI",
+                    color="FRI_Risk",
+                    text="FRI_Risk",
+                    title=f"Projected Monthly Fire Risk Outlook – Block {block_name} ({OUTLOOK_YEAR})",
+                    labels={"FRI": "Projected Fire Risk Index"},
+                    category_orders={"Month": MONTH_ORDER},
+                    color_discrete_map={
+                        "Low risk": "green",
+                        "Moderate risk": "orange",
+                        "High risk": "red",
+                        "Extreme risk": "purple",
+                    },
+                    template_name="plotly_white",
+                    trace={"textposition": "outside"},
+                    layout={"yaxis": {"range": [0, max(100, float(outlook_df["FRI"].max()) + 10)]}},
+                )
 
-            fri_bar.update_traces(textposition="outside")
-            fri_bar.update_yaxes(range=[0, max(100, float(outlook_df["FRI"].max()) + 10)])
+                fri_heatmap = build_monthly_outlook_heatmap(
+                    outlook_df,
+                    value_col="FRI",
+                    risk_col="FRI_Risk",
+                    title=f"Monthly Fire Risk Outlook – Block {block_name} ({OUTLOOK_YEAR})",
+                )
+                return [fri_bar, fri_heatmap]
 
-            fri_heatmap = build_monthly_outlook_heatmap(
-                outlook_df,
-                value_col="FRI",
-                risk_col="FRI_Risk",
-                title=f"Monthly Fire Risk Outlook – Block {block_name} ({OUTLOOK_YEAR})",
-            )
+            fri_bar, fri_heatmap = cached_figures("block-fri-monthly", build, camp=camp_name, block=block_name)
 
             narrative = build_monthly_fri_narrative(block_name, outlook_df, year=OUTLOOK_YEAR)
 
@@ -784,42 +790,47 @@ def register_callbacks(app):
             )
 
         else:
-            forecast_df = get_14day_fire_forecast(lat, lon, base_fsi=float(fsi_value))
+            forecast_df = cached_forecast(lat, lon, float(fsi_value))
 
             if forecast_df.empty:
                 return html.P("Forecast data is currently unavailable.", style={"color": "red"})
 
-            fig = px.line(
-                forecast_df,
-                x="Date",
-                y="FRI",
-                color="FRI_Risk",
-                markers=True,
-                title=f"14-Day Projected FRI – Block {block_name}",
-                labels={"FRI": "Projected Fire Risk Index", "FRI_Risk": "Severity"},
-                color_discrete_map={
-                    "Low risk": "green",
-                    "Moderate risk": "orange",
-                    "High risk": "red",
-                    "Extreme risk": "purple",
-                },
-                hover_data={
-                    "Adjusted_FSI": True,
-                    "FWI": True,
-                    "wind": True,
-                    "rh": True,
-                    "precip": True,
-                    "wind_dir_label": True,
-                },
-            )
-            fig.update_traces(mode="lines+markers")
-            fig.update_yaxes(range=[0, max(100, float(forecast_df["FRI"].max()) + 10)], title="Projected Fire Risk Index")
-
-            calendar_fig = build_fire_risk_outlook_calendar(
-                forecast_df,
-                value_col="FRI",
-                risk_col="FRI_Risk",
-                title=f"14-Day Fire Risk Outlook Calendar – Block {block_name}",
+            def build():
+                fig = figures.line(
+                    forecast_df,
+                    x="Date",
+                    y="FRI",
+                    color="FRI_Risk",
+                    markers=True,
+                    title=f"14-Day Projected FRI – Block {block_name}",
+                    labels={"FRI": "Projected Fire Risk Index", "FRI_Risk": "Severity"},
+                    color_discrete_map={
+                        "Low risk": "green",
+                        "Moderate risk": "orange",
+                        "High risk": "red",
+                        "Extreme risk": "purple",
+                    },
+                    hover_data=[
+                        "Adjusted_FSI",
+                        "FWI",
+                        "wind",
+                        "rh",
+                        "precip",
+                        "wind_dir_label",
+                    ],
+                    layout={"yaxis": {"range": [0, max(100, float(forecast_df["FRI"].max()) + 10)]}},
+                )
+
+                calendar_fig = build_fire_risk_outlook_calendar(
+                    forecast_df,
+                    value_col="FRI",
+                    risk_col="FRI_Risk",
+                    title=f"14-Day Fire Risk Outlook Calendar – Block {block_name}",
+                )
+                return [fig, calendar_fig]
+
+            fig, calendar_fig = cached_figures(
+                "block-fri-forecast", build, camp=camp_name, block=block_name, forecast=frame_fingerprint(forecast_df)
             )
 
             note = html.P(
@@ -847,36 +858,20 @@ def register_callbacks(app):
         if not camp_name or not block_name:
             return html.P("Please select a camp and block.", style={"fontStyle": "italic"})
 
-        block_data = cleaned_data[
-            (cleaned_data["CampName"] == camp_name)
-            & (cleaned_data["Block"] == block_name)
-        ]
-        if block_data.empty:
+        block = get_block_context(camp_name, block_name)
+        if block.empty:
             return html.P("No data available for this block.", style={"color": "red"})
 
-        camp_all = cleaned_data[cleaned_data["CampName"] == camp_name]
-
-        dims_mean = block_data[["Environment", "Fuel", "Behaviour", "Response"]].mean()
-        fsi_value = math.ceil(
-            (dims_mean["Environment"] +
-            dims_mean["Fuel"] +
-            dims_mean["Behaviour"] +
-            dims_mean["Response"]) / 4
-        )
-
-        lat = block_data["Latitude"].mean()
-        lon = block_data["Longitude"].mean()
-        today_iso = date.today().isoformat()
+        fsi_value = block.fsi_value
+        lat, lon = block.lat, block.lon
 
         if active_tab == "current":
-            centroids = camp_all.groupby("Block")[["Latitude", "Longitude"]].mean().reset_index()
-            records = []
-
-            for _, r in centroids.iterrows():
-                fwi_b = math.ceil(get_fwi_xclim(r["Latitude"], r["Longitude"], date_for=today_iso))
-                records.append({"Block": r["Block"], "FWI": fwi_b, "Risk": categorize_fwi(fwi_b)})
-
-            df = pd.DataFrame(records).sort_values("FWI", ascending=False).reset_index(drop=True)
+            fwi_b = np.ceil(block.camp_block_fwi).astype(int)
+            df = (
+                pd.DataFrame({"Block": block.camp_blocks["Block"], "FWI": fwi_b, "Risk": fwi_b.map(categorize_fwi)})
+                .sort_values("FWI", ascending=False)
+                .reset_index(drop=True)
+            )
 
             risk_to_color = {
                 "Low fire danger": "green",
@@ -887,16 +882,26 @@ def register_callbacks(app):
             colors = ["#1AAB48" if b == block_name else "#0033A0" for b in df["Block"]]
             text_colors = df["Risk"].map(risk_to_color)
 
-            fig = px.bar(
+            fig = figures.bar(
                 df,
                 x="Block",
                 y="FWI",
                 text="Risk",
                 labels={"Block": "Block", "FWI": "Fire Weather Index"},
                 title=f"Current FWI by Block in {camp_name}",
+                trace={
+                    "marker": {"color": colors},
+                    "textposition": "outside",
+                    "textfont": {"color": text_colors.tolist(), "size": 11},
+                    "showlegend": False,
+                },
+                layout={
+                    "xaxis": {"tickangle": -45},
+                    "yaxis": {"range": [0, max(100, float(df["FWI"].max()) + 10)]},
+                    "plot_bgcolor": "white",
+                    "margin": {"l": 40, "r": 20, "t": 60, "b": 120},
+                },
             )
-            fig.update_traces(marker_color=colors, textposition="outside", textfont=dict(color=text_colors, size=11), showlegend=False)
-            fig.update_layout(xaxis_tickangle=-45, plot_bgcolor="white", margin=dict(l=40, r=20, t=60, b=120), yaxis=dict(range=[0, max(100, float(df["FWI"].max()) + 10)]))
             return dcc.Graph(figure=fig, config={"displayModeBar": False})
 
         elif active_tab == "monthly":
@@ -906,33 +911,36 @@ def register_callbacks(app):
             if outlook_df.empty:
                 return html.P("Seasonal outlook data is unavailable.", style={"color": "red"})
 
-            fwi_bar = px.bar(
-                outlook_df,
-                x="Month",
-                y="FWI",
-                color="FWI_Risk",
-                text="FWI_Risk",
-                title=f"Projected Monthly Fire Weather Outlook – Block {block_name} ({OUTLOOK_YEAR})",
-                labels={"FWI": "Fire Weather Index"},
-                category_orders={"Month": MONTH_ORDER},
-                color_discrete_map={
-                    "Low fire danger": "green",
-                    "Moderate fire danger": "goldenrod",
-                    "High fire danger": "orange",
-                    "Severe fire danger": "red",
-                },
-                template="plotly_white",
-            )
+            def build():
+                fwi_bar = figures.bar(
+                    outlook_df,
+                    x="Month",
+                    y="FWI",
+                    color="FWI_Risk",
+                    text="FWI_Risk",
+                    title=f"Projected Monthly Fire Weather Outlook – Block {block_name} ({OUTLOOK_YEAR})",
+                    labels={"FWI": "Fire Weather Index"},
+                    category_orders={"Month": MONTH_ORDER},
+                    color_discrete_map={
+                        "Low fire danger": "green",
+                        "Moderate fire danger": "goldenrod",
+                        "High fire danger": "orange",
+                        "Severe fire danger": "red",
+                    },
+                    template_name="plotly_white",
+                    trace={"textposition": "outside"},
+                    layout={"yaxis": {"range": [0, max(100, float(outlook_df["FWI"].max()) + 10)]}},
+                )
 
-            fwi_bar.update_traces(textposition="outside")
-            fwi_bar.update_yaxes(range=[0, max(100, float(outlook_df["FWI"].max()) + 10)])
+                fwi_heatmap = build_monthly_outlook_heatmap(
+                    outlook_df,
+                    value_col="FWI",
+                    risk_col="FWI_Risk",
+                    title=f"Monthly Fire Weather Outlook – Block {block_name} ({OUTLOOK_YEAR})",
+                )
+                return [fwi_bar, fwi_heatmap]
 
-            fwi_heatmap = build_monthly_outlook_heatmap(
-                outlook_df,
-                value_col="FWI",
-                risk_col="FWI_Risk",
-                title=f"Monthly Fire Weather Outlook – Block {block_name} ({OUTLOOK_YEAR})",
-            )
+            fwi_bar, fwi_heatmap = cached_figures("block-fwi-monthly", build, camp=camp_name, block=block_name)
 
             narrative = build_monthly_fwi_narrative(block_name, outlook_df, year=OUTLOOK_YEAR)
 
@@ -945,43 +953,48 @@ def register_callbacks(app):
             )
 
         else:
-            forecast_df = get_14day_fire_forecast(lat, lon, base_fsi=float(fsi_value))
+            forecast_df = cached_forecast(lat, lon, float(fsi_value))
 
             if forecast_df.empty:
                 return html.P("Forecast data is currently unavailable.", style={"color": "red"})
 
-            fig = px.line(
-                forecast_df,
-                x="Date",
-                y="FWI",
-                color="FWI_Risk",
-                markers=True,
-                title=f"14-Day Stateful FWI Forecast – Block {block_name}",
-                labels={"FWI": "Fire Weather Index", "FWI_Risk": "Danger Level"},
-                color_discrete_map={
-                    "Low fire danger": "green",
-                    "Moderate fire danger": "goldenrod",
-                    "High fire danger": "orange",
-                    "Severe fire danger": "red",
-                },
-                hover_data={
-                    "wind": True,
-                    "rh": True,
-                    "precip": True,
-                    "wind_dir_label": True,
-                    "FFMC": True,
-                    "DMC": True,
-                    "DC": True,
-                },
-            )
-            fig.update_traces(mode="lines+markers")
-            fig.update_yaxes(range=[0, max(100, float(forecast_df["FWI"].max()) + 10)], title="Fire Weather Index")
-
-            calendar_fig = build_fire_risk_outlook_calendar(
-                forecast_df,
-                value_col="FWI",
-                risk_col="FWI_Risk",
-                title=f"14-Day Fire Weather Outlook Calendar – Block {block_name}",
+            def build():
+                fig = figures.line(
+                    forecast_df,
+                    x="Date",
+                    y="FWI",
+                    color="FWI_Risk",
+                    markers=True,
+                    title=f"14-Day Stateful FWI Forecast – Block {block_name}",
+                    labels={"FWI": "Fire Weather Index", "FWI_Risk": "Danger Level"},
+                    color_discrete_map={
+                        "Low fire danger": "green",
+                        "Moderate fire danger": "goldenrod",
+                        "High fire danger": "orange",
+                        "Severe fire danger": "red",
+                    },
+                    hover_data=[
+                        "wind",
+                        "rh",
+                        "precip",
+                        "wind_dir_label",
+                        "FFMC",
+                        "DMC",
+                        "DC",
+                    ],
+                    layout={"yaxis": {"range": [0, max(100, float(forecast_df["FWI"].max()) + 10)]}},
+                )
+
+                calendar_fig = build_fire_risk_outlook_calendar(
+                    forecast_df,
+                    value_col="FWI",
+                    risk_col="FWI_Risk",
+                    title=f"14-Day Fire Weather Outlook Calendar – Block {block_name}",
+                )
+                return [fig, calendar_fig]
+
+            fig, calendar_fig = cached_figures(
+                "block-fwi-forecast", build, camp=camp_name, block=block_name, forecast=frame_fingerprint(forecast_df)
             )
 
             note = html.P(
@@ -1006,7 +1019,7 @@ def register_callbacks(app):
         if not n_clicks:
             return False, dash.no_update
 
-        row = response_details.loc[response_details.CampName == selected_camp]
+        row = get_repository().contact(selected_camp)
         if row.empty:
             return not is_open, html.P("No contact info available for this camp.")
 
@@ -1,77 +1,50 @@
-import pandas as pd
+import dash
 import dash_leaflet as dl
 import dash_bootstrap_components as dbc
-from dash import Input, Output, State, ctx, dash_table, html
+from dash import ClientsideFunction, Input, Output, State, dash_table, html
 
-from fire_risk.legacy.data import cleaned_data, block_geojson, equipment_df, geojson_data
-from fire_risk.legacy.layouts import about_layout, block_level_layout, overview_layout, site_level_layout
+from fire_risk.legacy.data import current_data
+from fire_risk.legacy.layouts import page_layout
 from fire_risk.services.indicator_definitions import (
     DEFINITIONS_FILE,
-    INDICATOR_DEFINITIONS_DF,
     INDICATOR_GROUPS,
+    get_indicator_definitions,
 )
+from fire_risk.services.aggregates import MATCH_MODES, get_equipment_aggregates
+from fire_risk.services.common import camp_summary_snapshot
+from fire_risk.services.equipment import STATUS_COLORS, equipment_layer_url, popup_url_prefix
+from fire_risk.services.geometry import index_for_zoom
+from fire_risk.services.lite import LITE_OUTLINE_ZOOM, is_lite
+from fire_risk.services.spatial import format_coverage, get_coverage_index
+from fire_risk.services.spatial_join import get_equipment_join
 
 
 def register_callbacks(app):
     # -------------------------------------------------------------------
-    # EQUIPMENT MAP TITLE
+    # CAMP SUMMARY SNAPSHOT
     # -------------------------------------------------------------------
     @app.callback(
-        Output("equipment-map-modal-title", "children"),
-        Input("block-camp-dropdown", "value"),
-        Input("block-block-dropdown", "value"),
+        Output("camp-summary-store", "data"),
+        Input("weather-refresh-interval", "n_intervals"),
+        State("camp-summary-store", "data"),
     )
-    def update_equipment_map_title(selected_camp, selected_block):
-        if not selected_camp and not selected_block:
-            return "Access and Infrastructure Map"
-
-        block_text = str(selected_block).strip() if selected_block else ""
-        camp_text = str(selected_camp).strip() if selected_camp else ""
-
-        if block_text and not block_text.lower().startswith("block"):
-            block_text = f"Block {block_text}"
-
-        if block_text and camp_text:
-            return f"Access and Infrastructure Map for {block_text}, Camp {camp_text}"
-        if block_text:
-            return f"Access and Infrastructure Map for {block_text}"
-        if camp_text:
-            return f"Access and Infrastructure Map for Camp {camp_text}"
-
-        return "Access and Infrastructure Map"
+    def refresh_camp_summary(_n_intervals, current):
+        # Resolved once per refresh for every site page callback; an unchanged
+        # version leaves the store alone, so nothing downstream runs.
+        snapshot = camp_summary_snapshot()
+        if current and current.get("version") == snapshot["version"]:
+            return dash.no_update
+        return snapshot
 
     # -------------------------------------------------------------------
-    # EQUIPMENT MAP HELPERS
+    # EQUIPMENT MAP TITLE
     # -------------------------------------------------------------------
-    def get_equipment_color(status_group):
-        if status_group == "Functional":
-            return "green"
-        elif status_group == "Non-functional":
-            return "red"
-        return "orange"
-
-    def make_equipment_popup(row):
-        return dl.Popup(
-            html.Div(
-                [
-                    html.H6(str(row.get("Type_of facility", "Equipment")), className="mb-1"),
-                    html.P(f"Camp: {row.get('Camp', 'N/A')}", className="mb-1"),
-                    html.P(f"Sub-block: {row.get('Sub_block', 'N/A')}", className="mb-1"),
-                    html.P(f"Majhee Section: {row.get('Majhee_section', 'N/A')}", className="mb-1"),
-                    html.P(f"Landmark: {row.get('Landmark', 'N/A')}", className="mb-1"),
-                    html.P(f"Status: {row.get('Overall status', 'N/A')}", className="mb-1"),
-                    html.P(f"Water Source: {row.get('Source_of water', 'N/A')}", className="mb-1"),
-                    html.P(f"Distance from water: {row.get('Distance from water source', 'N/A')}", className="mb-1"),
-                    html.P(f"Material: {row.get('Material', 'N/A')}", className="mb-1"),
-                    html.P(f"Facility focal: {row.get('Facility focal name', 'N/A')}", className="mb-1"),
-                    html.P(f"DMU: {row.get('DMU', 'N/A')}", className="mb-1"),
-                    html.P(f"Warden: {row.get('Warden_name', 'N/A')}", className="mb-1"),
-                    html.P(f"Remarks: {row.get('Remarks', 'N/A')}", className="mb-1"),
-                ],
-                style={"minWidth": "260px"},
-            ),
-            maxWidth=350,
-        )
+    app.clientside_callback(
+        ClientsideFunction(namespace="fireRisk", function_name="equipmentMapTitle"),
+        Output("equipment-map-modal-title", "children"),
+        Input("block-camp-dropdown", "value"),
+        Input("block-block-dropdown", "value"),
+    )
 
     # -------------------------------------------------------------------
     # BLOCK CAMP → BLOCK DROPDOWN OPTIONS
@@ -85,14 +58,8 @@ def register_callbacks(app):
         if not selected_camp:
             return [], None
 
-        blocks = (
-            cleaned_data.loc[cleaned_data["CampName"] == selected_camp, "Block"]
-            .dropna()
-            .astype(str)
-            .unique()
-        )
-
-        block_options = [{"label": b, "value": b} for b in sorted(blocks)]
+        blocks = current_data().hierarchy.blocks_for_camp(selected_camp)
+        block_options = [{"label": b, "value": b} for b in blocks]
         return block_options, None
 
     # -------------------------------------------------------------------
@@ -106,149 +73,104 @@ def register_callbacks(app):
         Output("equipment-map", "zoom"),
         Input("block-camp-dropdown", "value"),
         Input("block-block-dropdown", "value"),
+        Input("equipment-match-mode", "value"),
     )
-    def update_equipment_map(selected_camp, selected_block):
-        dff = equipment_df.copy()
-
-        if selected_camp:
-            dff = dff[dff["camp_key"] == str(selected_camp).strip().upper()]
-
-        if selected_block:
-            dff = dff[dff["block_key"] == str(selected_block).strip().upper()]
+    def update_equipment_map(selected_camp, selected_block, match_mode):
+        match_mode = match_mode if match_mode in MATCH_MODES else "recorded"
+        stats = get_equipment_aggregates(by=match_mode).lookup(selected_camp or None, selected_block or None)
 
-        markers = []
         boundary_layers = []
-        lats = []
-        lons = []
-
-        if not dff.empty:
-            for _, row in dff.iterrows():
-                lat = row.get("_LATITUDE")
-                lon = row.get("_LONGITUDE")
-
-                if pd.isna(lat) or pd.isna(lon):
-                    continue
-
-                lat = float(lat)
-                lon = float(lon)
-
-                lats.append(lat)
-                lons.append(lon)
-
-                markers.append(
-                    dl.CircleMarker(
-                        center=[lat, lon],
-                        radius=6,
-                        color=get_equipment_color(row.get("status_group")),
-                        fill=True,
-                        fillOpacity=0.8,
-                        children=[make_equipment_popup(row)],
-                    )
-                )
+        markers = [
+            dl.GeoJSON(
+                url=equipment_layer_url(selected_camp, selected_block, match_mode),
+                cluster=True,
+                zoomToBoundsOnClick=True,
+                superClusterOptions={"radius": 60, "maxZoom": 17},
+                pointToLayer={"variable": "fireRisk.equipment.pointToLayer"},
+                clusterToLayer={"variable": "fireRisk.equipment.clusterToLayer"},
+                hideout={"colors": STATUS_COLORS, "popupUrl": popup_url_prefix()},
+            )
+        ]
 
-        if geojson_data is not None and selected_camp:
-            camp_features = [
-                feat
-                for feat in geojson_data["features"]
-                if str(feat.get("properties", {}).get("CampName", "")).strip().upper()
-                == str(selected_camp).strip().upper()
-            ]
+        if selected_block:
+            zoom = 17
+        elif selected_camp:
+            zoom = 15
+        else:
+            zoom = 14
 
-            if camp_features:
-                boundary_layers.append(
-                    dl.GeoJSON(
-                        data={"type": "FeatureCollection", "features": camp_features},
-                        options={"style": {"color": "#0033A0", "weight": 2, "fillOpacity": 0.05}},
-                    )
+        outlines = index_for_zoom(LITE_OUTLINE_ZOOM if is_lite() else zoom)
+        camp_entry = outlines.camp(selected_camp) if selected_camp else None
+        if camp_entry is not None:
+            boundary_layers.append(
+                dl.GeoJSON(
+                    data=camp_entry["collection"],
+                    options={"style": {"color": "#0033A0", "weight": 2, "fillOpacity": 0.05}},
                 )
+            )
 
-        if block_geojson is not None and selected_camp and selected_block:
-            block_features = []
-
-            for feat in block_geojson["features"]:
-                props = feat.get("properties", {})
-                camp_name = str(props.get("CampName_1") or props.get("CampName") or "").strip().upper()
-                block_name = str(props.get("BlockLabel") or props.get("BlockName") or "").strip().upper()
-
-                if (
-                    camp_name == str(selected_camp).strip().upper()
-                    and block_name == str(selected_block).strip().upper()
-                ):
-                    block_features.append(feat)
-
-            if block_features:
-                boundary_layers.append(
-                    dl.GeoJSON(
-                        data={"type": "FeatureCollection", "features": block_features},
-                        options={"style": {"color": "red", "weight": 3, "fillOpacity": 0.08}},
-                    )
+        block_entry = outlines.block(selected_camp, selected_block) if selected_camp and selected_block else None
+        if block_entry is not None:
+            boundary_layers.append(
+                dl.GeoJSON(
+                    data=block_entry["collection"],
+                    options={"style": {"color": "red", "weight": 3, "fillOpacity": 0.08}},
                 )
+            )
 
-        if dff.empty:
+        if stats is None:
             summary = dbc.Alert("No equipment found for the selected camp/block.", color="warning")
             return [], boundary_layers, summary, [21.2, 92.15], 14
 
-        total_count = len(dff)
-        functional_count = int((dff["status_group"] == "Functional").sum())
-        non_functional_count = int((dff["status_group"] == "Non-functional").sum())
-        top_types = dff["Type_of facility"].value_counts().head(3).to_dict()
+        top_types = stats["top_types"]
         top_types_text = " | ".join([f"{k}: {v}" for k, v in top_types.items()]) if top_types else "N/A"
 
         summary = dbc.Row(
             [
-                dbc.Col(dbc.Card(dbc.CardBody([html.H6("Total Equipment"), html.H4(total_count)])), md=3),
-                dbc.Col(dbc.Card(dbc.CardBody([html.H6("Functional"), html.H4(functional_count)])), md=3),
-                dbc.Col(dbc.Card(dbc.CardBody([html.H6("Non-functional"), html.H4(non_functional_count)])), md=3),
+                dbc.Col(dbc.Card(dbc.CardBody([html.H6("Total Equipment"), html.H4(stats["total"])])), md=3),
+                dbc.Col(dbc.Card(dbc.CardBody([html.H6("Functional"), html.H4(stats["functional"])])), md=3),
+                dbc.Col(dbc.Card(dbc.CardBody([html.H6("Non-functional"), html.H4(stats["non_functional"])])), md=3),
                 dbc.Col(dbc.Card(dbc.CardBody([html.H6("Top Types"), html.P(top_types_text)])), md=3),
             ],
             className="g-2",
         )
+        if selected_camp and selected_block:
+            coverage = get_coverage_index().block(selected_camp, selected_block)
+            check = get_equipment_join().check(selected_camp, selected_block)
+            summary = html.Div([
+                summary,
+                html.P(
+                    f"Response coverage from the block centroid: {format_coverage(coverage)}",
+                    className="text-muted small mt-2 mb-0",
+                ),
+                html.P(
+                    f"Location check: {check['located_elsewhere']} recorded here lie in another block, "
+                    f"{check['outside_outlines']} outside every block outline; "
+                    f"{check['recorded_elsewhere']} inside this block are recorded under another.",
+                    className="text-muted small mb-0",
+                ),
+            ])
 
-        center = [float(dff["_LATITUDE"].mean()), float(dff["_LONGITUDE"].mean())]
-
-        if selected_block:
-            zoom = 17
-        elif selected_camp:
-            zoom = 15
-        else:
-            zoom = 14
-
-        return markers, boundary_layers, summary, center, zoom
+        return markers, boundary_layers, summary, stats["center"], zoom
 
     # -------------------------------------------------------------------
     # EQUIPMENT MODAL TOGGLE
     # -------------------------------------------------------------------
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction(namespace="fireRisk", function_name="toggleEquipmentModal"),
         Output("equipment-map-modal", "is_open"),
         Input("btn-open-equipment-map", "n_clicks"),
         Input("close-equipment-map", "n_clicks"),
     )
-    def toggle_equipment_modal(open_clicks, close_clicks):
-        open_clicks = open_clicks or 0
-        close_clicks = close_clicks or 0
-        return open_clicks > close_clicks
 
     # -------------------------------------------------------------------
     # NAV FILTERS TOGGLE
     # -------------------------------------------------------------------
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction(namespace="fireRisk", function_name="toggleNavFilters"),
         [Output("camp-dropdown-container", "style"), Output("block-filter-container", "style")],
         Input("url", "pathname"),
     )
-    def toggle_nav_filters(pathname):
-        base_style = {"alignItems": "center", "justifyContent": "flex-end"}
-
-        if pathname == "/":
-            camp_style = {"display": "flex", **base_style}
-            block_style = {"display": "none", **base_style}
-        elif pathname == "/block":
-            camp_style = {"display": "none", **base_style}
-            block_style = {"display": "flex", **base_style}
-        else:
-            camp_style = {"display": "none", **base_style}
-            block_style = {"display": "none", **base_style}
-
-        return camp_style, block_style
 
     # -------------------------------------------------------------------
     # MULTI-PAGE NAVIGATION
@@ -258,19 +180,13 @@ def register_callbacks(app):
         Input("url", "pathname"),
     )
     def display_page(pathname):
-        if pathname == "/overview":
-            return overview_layout()
-        elif pathname == "/about":
-            return about_layout()
-        elif pathname == "/block":
-            return block_level_layout()
-        else:
-            return site_level_layout()
+        return page_layout(pathname)
 
     # -------------------------------------------------------------------
     # INDICATOR MODAL TOGGLE
     # -------------------------------------------------------------------
-    @app.callback(
+    app.clientside_callback(
+        ClientsideFunction(namespace="fireRisk", function_name="toggleIndicatorModal"),
         Output("indicator-modal", "is_open"),
         [
             Input("indicator-definition-link", "n_clicks"),
@@ -279,19 +195,6 @@ def register_callbacks(app):
         State("indicator-modal", "is_open"),
         prevent_initial_call=True,
     )
-    def toggle_indicator_modal(open_clicks, close_clicks, is_open):
-        trigger = ctx.triggered_id
-
-        if trigger is None:
-            return is_open
-
-        if trigger == "indicator-definition-link" and (open_clicks or 0) > 0:
-            return True
-
-        if trigger == "close-indicator-modal" and (close_clicks or 0) > 0:
-            return False
-
-        return is_open
 
     # -------------------------------------------------------------------
     # INDICATOR DEFINITIONS CONTENT
@@ -302,7 +205,8 @@ def register_callbacks(app):
         prevent_initial_call=True,
     )
     def populate_definitions(n):
-        if INDICATOR_DEFINITIONS_DF.empty:
+        definitions = get_indicator_definitions()
+        if definitions.empty:
             return html.Div(
                 [
                     html.P("The definitions file was found, but no usable rows were loaded."),
@@ -313,7 +217,7 @@ def register_callbacks(app):
                 ]
             )
 
-        df = INDICATOR_DEFINITIONS_DF.copy()
+        df = definitions.copy()
 
         parent_codes = list(INDICATOR_GROUPS.keys())
         df = df[
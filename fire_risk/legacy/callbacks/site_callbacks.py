@@ -3,11 +3,9 @@ import math
 
 import dash
 import numpy as np
-import pandas as pd
-import plotly.express as px
-from dash import Input, Output, dcc, html
+from dash import Input, Output, Patch, ctx, dcc, html
 
-from fire_risk.legacy.data import cleaned_data, geojson_data
+from fire_risk.legacy.data import current_data
 from fire_risk.legacy.fwi_fri import (
     build_current_risk_narrative,
     build_current_weather_narrative,
@@ -16,18 +14,196 @@ from fire_risk.legacy.fwi_fri import (
     categorize_fwi,
     classify_fsi,
     compute_fri,
-    get_14day_fire_forecast,
 )
-from fire_risk.services.common import OUTLOOK_YEAR, current_camp_summary
+from fire_risk.services import figures
+from fire_risk.services.common import OUTLOOK_YEAR, summary_from_snapshot
+from fire_risk.services.figure_cache import cached_figures, cached_forecast, frame_fingerprint
+from fire_risk.services.geometry import index_for_zoom
+from fire_risk.services.hierarchy import format_date_range, format_population
+from fire_risk.services.lite import is_lite, lite_table, sparkline_row
 from fire_risk.services.outlook_helpers import (
     build_fire_risk_outlook_calendar,
     build_monthly_fri_narrative,
     build_monthly_fwi_narrative,
     build_monthly_outlook_df,
 )
+from fire_risk.services.repository import get_repository
+from fire_risk.services.tiles import outline_layers
 
 MONTH_ORDER = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+SITE_MAP_ZOOM = 11
+
+
+def _is_refresh(*trigger_ids) -> bool:
+    """True when a figure from the same layout is already on the page."""
+    return ctx.triggered_id in trigger_ids
+
+
+def _patch_current_bar(x, y, text, colors, text_colors, title):
+    """Patch for a dcc.Graph child holding a single-trace ranking bar chart."""
+    patch = Patch()
+    figure = patch["props"]["figure"]
+    figure["data"][0]["x"] = list(x)
+    figure["data"][0]["y"] = [int(v) for v in y]
+    figure["data"][0]["text"] = list(text)
+    figure["data"][0]["marker"]["color"] = list(colors)
+    figure["data"][0]["textfont"]["color"] = list(text_colors)
+    figure["layout"]["title"]["text"] = title
+    figure["layout"]["yaxis"]["range"] = [0, max(100, float(max(y, default=0)) + 10)]
+    return patch
+
+
+def build_site_map(selected_camp, camp_entry, fri_value, hovertemplate):
+    if camp_entry is None:
+        return {}
+    return figures.choropleth_mapbox(
+        camp_entry["collection"],
+        [selected_camp],
+        [fri_value],
+        featureidkey="properties.CampName",
+        range_color=(0, max(100, float(fri_value) + 5)),
+        colorscale="OrRd",
+        colorbar_title="FRI",
+        center=camp_entry["centre"],
+        zoom=SITE_MAP_ZOOM,
+        opacity=0.6,
+        hovertemplate=hovertemplate,
+        layout={
+            "margin": {"l": 0, "r": 0, "t": 30, "b": 0},
+            "uirevision": selected_camp,
+            "mapbox": {"layers": outline_layers()},
+        },
+    )
+
+
+# -------------------------------------------------------------------
+# SITE-LEVEL OUTLOOK FIGURES (shared with the worker warm-up)
+# -------------------------------------------------------------------
+def site_fwi_monthly_figures(selected_camp, outlook_df):
+    def build():
+        fig = figures.bar(
+            outlook_df,
+            x="Month",
+            y="FWI",
+            color="FWI_Risk",
+            text="FWI_Risk",
+            title=f"Projected Monthly Fire Weather Outlook – {selected_camp} ({OUTLOOK_YEAR})",
+            labels={"FWI": "Fire Weather Index"},
+            category_orders={"Month": MONTH_ORDER},
+            color_discrete_map={
+                "Low fire danger": "green",
+                "Moderate fire danger": "goldenrod",
+                "High fire danger": "orange",
+                "Severe fire danger": "red",
+            },
+            template_name="plotly_white",
+            trace={"textposition": "outside"},
+            layout={"yaxis": {"range": [0, max(100, float(outlook_df["FWI"].max()) + 10)]}},
+        )
+        return [fig]
+
+    return cached_figures("site-fwi-monthly", build, camp=selected_camp)
+
+
+def site_fwi_forecast_figures(selected_camp, forecast_df):
+    def build():
+        fig = figures.line(
+            forecast_df,
+            x="Date",
+            y="FWI",
+            color="FWI_Risk",
+            markers=True,
+            title=f"14-Day Stateful Fire Weather Index Forecast for {selected_camp}",
+            labels={"FWI": "Fire Weather Index", "FWI_Risk": "Danger Level"},
+            color_discrete_map={
+                "Low fire danger": "green",
+                "Moderate fire danger": "goldenrod",
+                "High fire danger": "orange",
+                "Severe fire danger": "red",
+            },
+            layout={"yaxis": {"range": [0, max(100, float(forecast_df["FWI"].max()) + 10)]}},
+        )
+
+        calendar_fig = build_fire_risk_outlook_calendar(
+            forecast_df,
+            value_col="FWI",
+            risk_col="FWI_Risk",
+            title=f"14-Day Fire Weather Outlook Calendar – {selected_camp}",
+        )
+        return [fig, calendar_fig]
+
+    return cached_figures("site-fwi-forecast", build, camp=selected_camp, forecast=frame_fingerprint(forecast_df))
+
+
+def site_fri_monthly_figures(selected_camp, outlook_df):
+    def build():
+        fri_bar = figures.bar(
+            outlook_df,
+            x="Month",
+            y="FRI",
+            color="FRI_Risk",
+            text="FRI_Risk",
+            title=f"Projected Monthly Fire Risk Outlook – {selected_camp} ({OUTLOOK_YEAR})",
+            labels={"FRI": "Projected Fire Risk Index"},
+            category_orders={"Month": MONTH_ORDER},
+            color_discrete_map={
+                "Low risk": "green",
+                "Moderate risk": "orange",
+                "High risk": "red",
+                "Extreme risk": "purple",
+            },
+            template_name="plotly_white",
+            trace={"textposition": "outside"},
+            layout={"yaxis": {"range": [0, max(100, float(outlook_df["FRI"].max()) + 10)]}},
+        )
+        return [fri_bar]
+
+    return cached_figures("site-fri-monthly", build, camp=selected_camp)
+
+
+def site_fri_forecast_figures(selected_camp, forecast_df):
+    def build():
+        fig = figures.line(
+            forecast_df,
+            x="Date",
+            y="FRI",
+            color="FRI_Risk",
+            markers=True,
+            title=f"14-Day Projected FRI Forecast for {selected_camp}",
+            labels={"FRI": "Projected Fire Risk Index", "FRI_Risk": "Severity"},
+            color_discrete_map={
+                "Low risk": "green",
+                "Moderate risk": "orange",
+                "High risk": "red",
+                "Extreme risk": "purple",
+            },
+            layout={"yaxis": {"range": [0, max(100, float(forecast_df["FRI"].max()) + 10)]}},
+        )
+
+        calendar_fig = build_fire_risk_outlook_calendar(
+            forecast_df,
+            value_col="FRI",
+            risk_col="FRI_Risk",
+            title=f"14-Day Fire Risk Outlook Calendar – {selected_camp}",
+        )
+        return [fig, calendar_fig]
+
+    return cached_figures("site-fri-forecast", build, camp=selected_camp, forecast=frame_fingerprint(forecast_df))
+
+
+def warm_site_figures(selected_camp, lat, lon, fsi) -> None:
+    """Fill the forecast and the site-level outlook figures for one camp, as the FWI/FRI tabs would."""
+    forecast_df = cached_forecast(lat, lon, fsi)
+    if not forecast_df.empty:
+        site_fwi_forecast_figures(selected_camp, forecast_df)
+        site_fri_forecast_figures(selected_camp, forecast_df)
+
+    outlook_df = build_monthly_outlook_df(lat, lon, base_fsi=fsi, year=OUTLOOK_YEAR)
+    outlook_df = outlook_df.sort_values("MonthNum").reset_index(drop=True)
+    if not outlook_df.empty:
+        site_fwi_monthly_figures(selected_camp, outlook_df)
+        site_fri_monthly_figures(selected_camp, outlook_df)
 
 
 def register_callbacks(app):
@@ -36,10 +212,10 @@ def register_callbacks(app):
     # -------------------------------------------------------------------
     @app.callback(
         [Output("site-fwi-content", "children"), Output("site-fwi-narrative", "children")],
-        [Input("camp-dropdown", "value"), Input("site-fwi-tabs", "value"), Input("weather-refresh-interval", "n_intervals")],
+        [Input("camp-dropdown", "value"), Input("site-fwi-tabs", "value"), Input("camp-summary-store", "data")],
     )
-    def render_fwi_tab(selected_camp, active_tab, _n_intervals):
-        camp_df = current_camp_summary()
+    def render_fwi_tab(selected_camp, active_tab, summary_data):
+        camp_df = summary_from_snapshot(summary_data)
         row = camp_df[camp_df["CampName"] == selected_camp]
         if row.empty:
             return dash.no_update, dash.no_update
@@ -55,25 +231,7 @@ def register_callbacks(app):
             if outlook_df.empty:
                 return html.P("Seasonal outlook data is unavailable.", style={"color": "red"}), dash.no_update
 
-            fig = px.bar(
-                outlook_df,
-                x="Month",
-                y="FWI",
-                color="FWI_Risk",
-                text="FWI_Risk",
-                title=f"Projected Monthly Fire Weather Outlook – {selected_camp} ({OUTLOOK_YEAR})",
-                labels={"FWI": "Fire Weather Index"},
-                category_orders={"Month": MONTH_ORDER},
-                color_discrete_map={
-                    "Low fire danger": "green",
-                    "Moderate fire danger": "goldenrod",
-                    "High fire danger": "orange",
-                    "Severe fire danger": "red",
-                },
-                template="plotly_white",
-            )
-            fig.update_traces(textposition="outside")
-            fig.update_yaxes(range=[0, max(100, float(outlook_df["FWI"].max()) + 10)])
+            fig = site_fwi_monthly_figures(selected_camp, outlook_df)[0]
 
             narrative = build_monthly_fwi_narrative(selected_camp, outlook_df, year=OUTLOOK_YEAR)
             return dcc.Graph(figure=fig, config={"displayModeBar": False}), narrative
@@ -97,52 +255,45 @@ def register_callbacks(app):
                 "Severe fire danger": "red",
             }
             text_colors = df["Risk"].map(risk_to_color)
+            title = f"Current Fire Weather Index (Rank {rank}/{total})"
+            narrative = build_current_weather_narrative(selected_camp, df.copy())
 
-            fig = px.bar(
+            if _is_refresh("camp-dropdown", "camp-summary-store"):
+                # Same chart already shown: only the highlight, rank and
+                # values can differ.
+                patch = _patch_current_bar(df["CampName"], df["FWI"], df["Risk"], colors, text_colors, title)
+                return patch, narrative
+
+            fig = figures.bar(
                 df,
                 x="CampName",
                 y="FWI",
                 text="Risk",
                 labels={"CampName": "Camp", "FWI": "Fire Weather Index"},
-                title=f"Current Fire Weather Index (Rank {rank}/{total})",
-                template="plotly_white",
+                title=title,
+                template_name="plotly_white",
+                trace={
+                    "marker": {"color": colors},
+                    "textposition": "outside",
+                    "textfont": {"color": text_colors.tolist(), "size": 12},
+                    "showlegend": False,
+                },
+                layout={
+                    "xaxis": {"tickangle": -45},
+                    "yaxis": {"range": [0, max(100, float(df["FWI"].max()) + 10)]},
+                    "plot_bgcolor": "white",
+                    "margin": {"l": 40, "r": 20, "t": 60, "b": 120},
+                },
             )
-            fig.update_traces(marker_color=colors, textposition="outside", textfont=dict(color=text_colors, size=12), showlegend=False)
-            fig.update_layout(xaxis_tickangle=-45, plot_bgcolor="white", margin=dict(l=40, r=20, t=60, b=120))
-            fig.update_yaxes(range=[0, max(100, float(df["FWI"].max()) + 10)])
 
-            narrative = build_current_weather_narrative(selected_camp, df.copy())
             return dcc.Graph(figure=fig, config={"displayModeBar": False}), narrative
 
         else:
-            forecast_df = get_14day_fire_forecast(lat, lon, base_fsi=camp_fsi)
+            forecast_df = cached_forecast(lat, lon, camp_fsi)
             if forecast_df.empty:
                 return html.P("Forecast data is currently unavailable.", style={"color": "red"}), dash.no_update
 
-            fig = px.line(
-                forecast_df,
-                x="Date",
-                y="FWI",
-                color="FWI_Risk",
-                markers=True,
-                title=f"14-Day Stateful Fire Weather Index Forecast for {selected_camp}",
-                labels={"FWI": "Fire Weather Index", "FWI_Risk": "Danger Level"},
-                color_discrete_map={
-                    "Low fire danger": "green",
-                    "Moderate fire danger": "goldenrod",
-                    "High fire danger": "orange",
-                    "Severe fire danger": "red",
-                },
-            )
-            fig.update_traces(mode="lines+markers")
-            fig.update_yaxes(range=[0, max(100, float(forecast_df["FWI"].max()) + 10)], title="Fire Weather Index")
-
-            calendar_fig = build_fire_risk_outlook_calendar(
-                forecast_df,
-                value_col="FWI",
-                risk_col="FWI_Risk",
-                title=f"14-Day Fire Weather Outlook Calendar – {selected_camp}",
-            )
+            fig, calendar_fig = site_fwi_forecast_figures(selected_camp, forecast_df)
 
             forecast_df_narr = forecast_df.copy()
             forecast_df_narr["Risk"] = forecast_df_narr["FWI_Risk"]
@@ -162,11 +313,11 @@ def register_callbacks(app):
         [
             Input("camp-dropdown", "value"),
             Input("site-fri-tabs", "value"),
-            Input("weather-refresh-interval", "n_intervals"),
+            Input("camp-summary-store", "data"),
         ],
     )
-    def render_fri_tab(selected_camp, active_tab, _n_intervals):
-        camp_df = current_camp_summary()
+    def render_fri_tab(selected_camp, active_tab, summary_data):
+        camp_df = summary_from_snapshot(summary_data)
         row = camp_df[camp_df["CampName"] == selected_camp]
 
         if row.empty:
@@ -192,25 +343,7 @@ def register_callbacks(app):
                     dash.no_update,
                 )
 
-            fri_bar = px.bar(
-                outlook_df,
-                x="Month",
-                y="FRI",
-                color="FRI_Risk",
-                text="FRI_Risk",
-                title=f"Projected Monthly Fire Risk Outlook – {selected_camp} ({OUTLOOK_YEAR})",
-                labels={"FRI": "Projected Fire Risk Index"},
-                category_orders={"Month": MONTH_ORDER},
-                color_discrete_map={
-                    "Low risk": "green",
-                    "Moderate risk": "orange",
-                    "High risk": "red",
-                    "Extreme risk": "purple",
-                },
-                template="plotly_white",
-            )
-            fri_bar.update_traces(textposition="outside")
-            fri_bar.update_yaxes(range=[0, max(100, float(outlook_df["FRI"].max()) + 10)])
+            fri_bar = site_fri_monthly_figures(selected_camp, outlook_df)[0]
 
             narrative = build_monthly_fri_narrative(
                 selected_camp,
@@ -240,34 +373,39 @@ def register_callbacks(app):
                 "Low risk": "green",
             }
             text_colors = [risk_to_color[c] for c in df["FRI_Class"]]
+            title = f"Current FRI Comparison (Rank {rank}/{total})"
+            narrative = build_current_risk_narrative(selected_camp, df.copy())
+
+            if _is_refresh("camp-dropdown", "camp-summary-store"):
+                patch = _patch_current_bar(df["CampName"], df["FRI"], df["FRI_Class"], colors, text_colors, title)
+                return patch, narrative
 
-            fig = px.bar(
+            fig = figures.bar(
                 df,
                 x="CampName",
                 y="FRI",
                 text="FRI_Class",
-                title=f"Current FRI Comparison (Rank {rank}/{total})",
+                title=title,
                 labels={"CampName": "Camp", "FRI": "Fire Risk Index"},
-                template="plotly_white",
-            )
-            fig.update_traces(
-                marker_color=colors,
-                textposition="outside",
-                textfont=dict(color=text_colors, size=12),
-                showlegend=False,
-            )
-            fig.update_layout(
-                xaxis_tickangle=-45,
-                plot_bgcolor="white",
-                margin=dict(l=40, r=20, t=60, b=120),
+                template_name="plotly_white",
+                trace={
+                    "marker": {"color": colors},
+                    "textposition": "outside",
+                    "textfont": {"color": text_colors, "size": 12},
+                    "showlegend": False,
+                },
+                layout={
+                    "xaxis": {"tickangle": -45},
+                    "yaxis": {"range": [0, max(100, float(df["FRI"].max()) + 10)]},
+                    "plot_bgcolor": "white",
+                    "margin": {"l": 40, "r": 20, "t": 60, "b": 120},
+                },
             )
-            fig.update_yaxes(range=[0, max(100, float(df["FRI"].max()) + 10)])
 
-            narrative = build_current_risk_narrative(selected_camp, df.copy())
             return dcc.Graph(figure=fig, config={"displayModeBar": False}), narrative
 
         else:  # forecasted
-            forecast_df = get_14day_fire_forecast(lat, lon, base_fsi=fsi_val)
+            forecast_df = cached_forecast(lat, lon, fsi_val)
 
             if forecast_df.empty:
                 return (
@@ -275,30 +413,7 @@ def register_callbacks(app):
                     dash.no_update,
                 )
 
-            fig = px.line(
-                forecast_df,
-                x="Date",
-                y="FRI",
-                color="FRI_Risk",
-                markers=True,
-                title=f"14-Day Projected FRI Forecast for {selected_camp}",
-                labels={"FRI": "Projected Fire Risk Index", "FRI_Risk": "Severity"},
-                color_discrete_map={
-                    "Low risk": "green",
-                    "Moderate risk": "orange",
-                    "High risk": "red",
-                    "Extreme risk": "purple",
-                },
-            )
-            fig.update_traces(mode="lines+markers")
-            fig.update_yaxes(range=[0, max(100, float(forecast_df["FRI"].max()) + 10)], title="Projected Fire Risk Index")
-
-            calendar_fig = build_fire_risk_outlook_calendar(
-                forecast_df,
-                value_col="FRI",
-                risk_col="FRI_Risk",
-                title=f"14-Day Fire Risk Outlook Calendar – {selected_camp}",
-            )
+            fig, calendar_fig = site_fri_forecast_figures(selected_camp, forecast_df)
 
             forecast_df_narr = forecast_df.copy()
             forecast_df_narr["Risk"] = forecast_df_narr["FRI_Risk"]
@@ -332,33 +447,23 @@ def register_callbacks(app):
             Output("fire-risk-map", "figure"),
             Output("susceptibility-table", "data"),
         ],
-        [Input("camp-dropdown", "value"), Input("weather-refresh-interval", "n_intervals")],
+        [Input("camp-dropdown", "value"), Input("camp-summary-store", "data")],
     )
-    def update_dashboard(selected_camp, _n_intervals):
-        camp_data = cleaned_data[cleaned_data["CampName"] == selected_camp]
-        if camp_data.empty:
+    def update_dashboard(selected_camp, summary_data):
+        hierarchy = current_data().hierarchy
+        camp_totals = hierarchy.camp(selected_camp)
+        if camp_totals is None:
             return "No data available", "-", "-", "-", {}, {}, []
 
-        live_camp_summary = current_camp_summary()
+        live_camp_summary = summary_from_snapshot(summary_data)
         camp_row = live_camp_summary.loc[live_camp_summary["CampName"] == selected_camp]
         if camp_row.empty:
             return "No summary data", "-", "-", "-", {}, {}, []
 
         camp = camp_row.iloc[0]
 
-        assessment_text = "N/A"
-        if "assessment_date" in camp_data.columns:
-            assessment_series = pd.to_datetime(camp_data["assessment_date"], errors="coerce").dropna()
-            if not assessment_series.empty:
-                min_date = assessment_series.min().date().isoformat()
-                max_date = assessment_series.max().date().isoformat()
-                assessment_text = min_date if min_date == max_date else f"{min_date} to {max_date}"
-
-        population_text = "N/A"
-        pop_col = "ENV_003a"
-        if pop_col in camp_data.columns:
-            site_pop = pd.to_numeric(camp_data[pop_col], errors="coerce").fillna(0).sum()
-            population_text = f"{site_pop:,.0f}"
+        assessment_text = format_date_range(camp_totals["assessment_start"], camp_totals["assessment_end"])
+        population_text = format_population(camp_totals["population"])
 
         site_container = html.Div([
             html.P([html.Strong("Site name: "), selected_camp]),
@@ -388,49 +493,42 @@ def register_callbacks(app):
             html.P(f"FRI Severity: {fri_severity}", style={"fontSize": "14px", "margin": "0", "color": "#555"}),
         ])
 
-        block_means = camp_data.groupby("Block")[["Environment", "Fuel", "Behaviour", "Response"]].mean().reset_index()
+        block_means = hierarchy.camp_block_table(selected_camp)[["Block", "Environment", "Fuel", "Behaviour", "Response"]]
         melted = block_means.melt(id_vars="Block", var_name="Dimension", value_name="Score")
         melted["Score"] = melted["Score"].round(0).astype(int)
 
-        block_bar_fig = px.bar(melted, x="Block", y="Score", color="Dimension", barmode="group", text="Score", template="plotly_white")
-        block_bar_fig.update_traces(texttemplate="%{text}", textposition="outside")
-
-        selected_features = []
-        if geojson_data is not None:
-            selected_features = [feat for feat in geojson_data["features"] if feat.get("properties", {}).get("CampName") == selected_camp]
-
-        if selected_features:
-            selected_geojson = {"type": "FeatureCollection", "features": selected_features}
-            coords = selected_features[0]["geometry"]["coordinates"][0]
-            lons, lats = zip(*coords)
-            centre = {"lat": (max(lats) + min(lats)) / 2, "lon": (max(lons) + min(lons)) / 2}
-            df_sel = pd.DataFrame([{"CampName": selected_camp, "FRI": fri_value}])
-
-            map_fig = px.choropleth_mapbox(
-                df_sel,
-                geojson=selected_geojson,
-                locations="CampName",
-                featureidkey="properties.CampName",
-                color="FRI",
-                range_color=(0, max(100, float(fri_value) + 5)),
-                color_continuous_scale="OrRd",
-                center=centre,
-                zoom=11,
-                opacity=0.6,
-                mapbox_style="carto-positron",
-                hover_name="CampName",
-                hover_data={"FRI": False},
-            )
-            map_fig.update_traces(
-                hovertemplate=f"<b>%{{hovertext}}</b><br>FRI: {fri_value} – {fri_severity}<extra></extra>"
-            )
-            map_fig.update_layout(
-                margin={"l": 0, "r": 0, "t": 30, "b": 0},
-                uirevision=selected_camp
-            )
+        camp_entry = index_for_zoom(SITE_MAP_ZOOM).camp(selected_camp)
+        map_hover = f"<b>%{{hovertext}}</b><br>FRI: {fri_value} – {fri_severity}<extra></extra>"
+
+        if _is_refresh("camp-summary-store") and camp_entry is not None:
+            # Periodic refresh of the same camp: both figures are on the page,
+            # so only their values are sent.
+            block_bar_fig = Patch()
+            for i, (_, dim) in enumerate(melted.groupby("Dimension", sort=False)):
+                block_bar_fig["data"][i]["x"] = dim["Block"].astype(str).tolist()
+                block_bar_fig["data"][i]["y"] = dim["Score"].tolist()
+                block_bar_fig["data"][i]["text"] = dim["Score"].tolist()
+            map_fig = Patch()
+            map_fig["data"][0]["z"] = [fri_value]
+            map_fig["data"][0]["hovertemplate"] = map_hover
+            map_fig["layout"]["coloraxis"]["cmax"] = max(100, float(fri_value) + 5)
         else:
-            map_fig = {}
+            block_bar_fig = figures.bar(
+                melted,
+                x="Block",
+                y="Score",
+                color="Dimension",
+                barmode="group",
+                text="Score",
+                template_name="plotly_white",
+                trace={"texttemplate": "%{text}", "textposition": "outside"},
+            )
+            map_fig = build_site_map(selected_camp, camp_entry, fri_value, map_hover)
+        if is_lite():
+            # The low-bandwidth page shows render_site_map_lite instead.
+            map_fig = dash.no_update
 
+        camp_data = get_repository().assessments(selected_camp)
         table_df = camp_data[["Block", "FSI_Calculated", "FSI_Class"]].copy()
         table_df["FSI_Calculated"] = table_df["FSI_Calculated"].round(0).astype(int)
         table_df = table_df.rename(columns={"Block": "Site Block", "FSI_Calculated": "FSI Score"})
@@ -438,13 +536,50 @@ def register_callbacks(app):
 
         return site_container, fsi_text, fwi_text, fri_text, block_bar_fig, map_fig, table_data
 
+    # -------------------------------------------------------------------
+    # BLOCK TABLE AND SPARKLINES (LOW-BANDWIDTH SITE PAGE)
+    # -------------------------------------------------------------------
+    @app.callback(
+        Output("site-map-lite", "children"),
+        [Input("camp-dropdown", "value"), Input("camp-summary-store", "data")],
+    )
+    def render_site_map_lite(selected_camp, summary_data):
+        live_camp_summary = summary_from_snapshot(summary_data)
+        camp_row = live_camp_summary.loc[live_camp_summary["CampName"] == selected_camp]
+        if camp_row.empty:
+            return html.P("No summary data", className="text-muted")
+        camp = camp_row.iloc[0]
+
+        fwi_value = float(camp["FWI"])
+        blocks = current_data().hierarchy.camp_block_table(selected_camp)[["Block", "FSI_Score", "FSI_Class", "FSI"]].copy()
+        blocks["FRI"] = compute_fri(blocks["FSI"], fwi_value).round(0).astype(int)
+        blocks["FRI_Class"] = blocks["FRI"].apply(categorize_fri)
+        blocks = blocks.sort_values("FRI", ascending=False)
+
+        forecast_df = cached_forecast(camp["Latitude"], camp["Longitude"], float(camp["FSI_Calculated"]))
+        if forecast_df.empty:
+            sparklines = [html.P("Forecast data is currently unavailable.", className="text-muted small mb-1")]
+        else:
+            sparklines = [
+                sparkline_row("FRI, next 14 days", forecast_df["FRI"]),
+                sparkline_row("FWI, next 14 days", forecast_df["FWI"]),
+            ]
+
+        return html.Div([
+            *sparklines,
+            lite_table(
+                blocks,
+                {"Block": "Block", "FSI_Score": "FSI", "FSI_Class": "FSI Class", "FRI": "FRI", "FRI_Class": "FRI Severity"},
+            ),
+        ], className="mt-2")
+
     # -------------------------------------------------------------------
     # WINDY IFRAME (SITE-LEVEL)
     # -------------------------------------------------------------------
     @app.callback(Output("windy-iframe", "src"), Input("camp-dropdown", "value"))
     def update_windy_src(selected_camp):
-        row = cleaned_data[cleaned_data["CampName"] == selected_camp]
-        if row.empty:
+        row = get_repository().assessments(selected_camp)
+        if row.empty or is_lite():
             return dash.no_update
 
         lat = row.iloc[0]["Latitude"]
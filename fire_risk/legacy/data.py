@@ -1,6 +1,7 @@
 # data.py
-import json
+import hashlib
 import math
+import threading
 from datetime import date
 from pathlib import Path
 
@@ -9,6 +10,10 @@ import pandas as pd
 
 from fire_risk.legacy.fwi_fri import get_fwi_xclim, categorize_fri, classify_fsi, compute_fri
 from fire_risk.services.cache import cache
+from fire_risk.services.geostore import load_outlines
+from fire_risk.services.hierarchy import AssessmentHierarchy
+from fire_risk.services.indicator_definitions import INDICATOR_GROUPS
+from fire_risk.services.memory import MEMORY_REPORT, frame_stats, report_compaction, rss_bytes
 
 
 # -------------------------------------------------------------------
@@ -24,6 +29,10 @@ def _norm(s):
     return str(s).strip().upper() if pd.notna(s) else ""
 
 
+def _norm_series(values: pd.Series) -> pd.Series:
+    return values.astype(str).str.strip().str.upper().where(values.notna(), "")
+
+
 def normalize_status(x):
     x = str(x).strip().upper()
     if "FUNCTIONAL" in x and "NON" not in x:
@@ -53,76 +62,90 @@ def load_equipment_data(base_dir: Path) -> pd.DataFrame:
     return equipment
 
 
-# -------------------------------------------------------------------
-# LOAD RAW DATA
-# -------------------------------------------------------------------
-equipment_df = load_equipment_data(BASE_DIR)
-aor_data = pd.read_excel(BASE_DIR / "AOR.xlsx")
-aor_data.rename(columns={"New_Camp_Name": "CampName"}, inplace=True)
-response_details = pd.read_excel(BASE_DIR / "CampResponseDetails.xlsx")
-fire_data = pd.read_csv(BASE_DIR / "Fire Susceptability Data Block.csv")
+def load_fire_data(base_dir: Path) -> pd.DataFrame:
+    return pd.read_csv(base_dir / "Fire Susceptability Data Block.csv")
 
 
 # -------------------------------------------------------------------
-# CAMP OUTLINE GEOJSON
+# MEMORY COMPACTION
 # -------------------------------------------------------------------
-try:
-    with open(BASE_DIR / "Camp_Outline.json", "r", encoding="utf-8") as f:
-        geojson_data = json.load(f)
-except FileNotFoundError:
-    geojson_data = None
+SCORE_COLUMNS = ["Environment", "Fuel", "Behaviour", "Response", "FSI_Calculated"]
+INDICATOR_COLUMNS = [c for cols in INDICATOR_GROUPS.values() for c in cols]
+ASSESSMENT_COLUMNS = (
+    ["CampName", "Block", "assessment_date", "FSI_Class", "Latitude", "Longitude"]
+    + SCORE_COLUMNS
+    + INDICATOR_COLUMNS
+)
+EQUIPMENT_COLUMNS = [
+    "_ID", "_LATITUDE", "_LONGITUDE",
+    "Camp", "Sub_block", "Majhee_section", "Landmark", "Type_of facility", "Overall status",
+    "Source_of water", "Distance from water source", "Material",
+    "Facility focal name", "DMU", "Warden_name", "Remarks",
+    "camp_key", "block_key", "facility_key", "status_key", "status_group",
+]
+EQUIPMENT_CATEGORIES = [
+    "Camp", "Sub_block", "Type_of facility", "Overall status",
+    "camp_key", "block_key", "facility_key", "status_key", "status_group",
+]
+
+
+def compact_frame(df, columns, categories=(), integers=()) -> pd.DataFrame:
+    """
+    Keep only `columns` (those present) and shrink their dtypes. Integer
+    columns are downcast losslessly. Scores and coordinates stay float64:
+    block means of float32 scores can land on the other side of an integer
+    when ceil-ed, and FWI cache keys are built from the coordinates.
+    """
+    out = df[[c for c in columns if c in df.columns]].copy()
+    for col in categories:
+        if col in out.columns:
+            out[col] = out[col].astype("category")
+    for col in integers:
+        if col in out.columns and pd.api.types.is_integer_dtype(out[col]):
+            out[col] = pd.to_numeric(out[col], downcast="integer")
+    return out
+
+
+def compact_assessments(cleaned: pd.DataFrame) -> pd.DataFrame:
+    return compact_frame(
+        cleaned,
+        ASSESSMENT_COLUMNS,
+        categories=["CampName", "Block"],
+        integers=INDICATOR_COLUMNS,
+    )
 
-if geojson_data is not None:
-    for feat in geojson_data["features"]:
-        feat["geometry"] = {
-            "type": "Polygon",
-            "coordinates": feat["geometry"]["rings"],
-        }
-        feat["properties"] = feat.pop("attributes")
+
+def compact_equipment(equipment: pd.DataFrame) -> pd.DataFrame:
+    return compact_frame(equipment, EQUIPMENT_COLUMNS, categories=EQUIPMENT_CATEGORIES)
 
 
 # -------------------------------------------------------------------
-# MERGE FIRE DATA + AOR, FSI CALC
+# LOAD RAW DATA
 # -------------------------------------------------------------------
-merged_data = pd.merge(fire_data, aor_data, on="CampName", how="left")
-if "Block" not in merged_data.columns:
-    raise ValueError("❌ 'Block' column not found in dataset! Please check the data.")
+ASSESSMENT_FILE = BASE_DIR / "Fire Susceptability Data Block.csv"
+EQUIPMENT_FILE = BASE_DIR / "Fire_Equipment_Map.csv"
 
-merged_data["FSI_Calculated"] = (
-    merged_data["Environment"].fillna(0)
-    + merged_data["Fuel"].fillna(0)
-    + merged_data["Behaviour"].fillna(0)
-    + merged_data["Response"].fillna(0)
-) / 4
-cleaned_data = merged_data.dropna(subset=["Latitude", "Longitude"]).copy()
-cleaned_data["FSI_Class"] = cleaned_data["FSI_Calculated"].apply(classify_fsi)
+_raw_equipment = load_equipment_data(BASE_DIR)
+aor_data = pd.read_excel(BASE_DIR / "AOR.xlsx")
+aor_data.rename(columns={"New_Camp_Name": "CampName"}, inplace=True)
+response_details = pd.read_excel(BASE_DIR / "CampResponseDetails.xlsx")
+_raw_fire_data = load_fire_data(BASE_DIR)
 
 
 # -------------------------------------------------------------------
-# BLOCK OUTLINE GEOJSON + CENTROIDS
+# CAMP OUTLINE GEOMETRY
 # -------------------------------------------------------------------
-try:
-    with open(BASE_DIR / "Block_Outline.json", "r", encoding="utf-8") as f:
-        block_geo_raw = json.load(f)
-except FileNotFoundError:
-    block_geo_raw = None
+camp_outline_store = load_outlines(BASE_DIR / "Camp_Outline.json")
 
-block_geojson = None
-if block_geo_raw is not None:
-    for feat in block_geo_raw["features"]:
-        feat["geometry"] = {
-            "type": "Polygon",
-            "coordinates": feat["geometry"]["rings"],
-        }
-        feat["properties"] = feat.pop("attributes")
-    block_geojson = block_geo_raw
 
-block_centroids = {}
-if block_geojson is not None:
-    for feat in block_geojson["features"]:
-        props = feat.get("properties", {})
-        geom = feat.get("geometry", {})
+# -------------------------------------------------------------------
+# BLOCK OUTLINE GEOMETRY + CENTROIDS
+# -------------------------------------------------------------------
+block_outline_store = load_outlines(BASE_DIR / "Block_Outline.json")
 
+block_centroids = {}
+if block_outline_store is not None:
+    for i, props in enumerate(block_outline_store.properties):
         camp_name = props.get("CampName_1") or props.get("CampName") or ""
         block_label = props.get("BlockLabel") or props.get("BlockName") or ""
 
@@ -130,47 +153,143 @@ if block_geojson is not None:
         block_key = _norm(block_label)
         if not camp_key or not block_key:
             continue
-        if geom.get("type") != "Polygon":
-            continue
-        coords = geom.get("coordinates", [])
-        if not coords or not coords[0]:
+        rings = block_outline_store.rings(i)
+        if not rings or not len(rings[0]):
             continue
 
-        ring = coords[0]
-        lons, lats = zip(*ring)
-        centroid_lon = float(sum(lons) / len(lons))
-        centroid_lat = float(sum(lats) / len(lats))
-        block_centroids[(camp_key, block_key)] = (centroid_lat, centroid_lon)
+        centroid_lon, centroid_lat = rings[0].mean(axis=0)
+        block_centroids[(camp_key, block_key)] = (float(centroid_lat), float(centroid_lon))
 
 
-def attach_block_centroid(row):
-    camp_key = _norm(row["CampName"])
-    block_key = _norm(row["Block"])
-    key = (camp_key, block_key)
-    if key in block_centroids:
-        lat, lon = block_centroids[key]
-        return pd.Series({"Latitude": lat, "Longitude": lon})
-    return pd.Series({"Latitude": row["Latitude"], "Longitude": row["Longitude"]})
+block_centroid_table = pd.DataFrame(
+    [(camp, block, lat, lon) for (camp, block), (lat, lon) in block_centroids.items()],
+    columns=["camp_key", "block_key", "centroid_lat", "centroid_lon"],
+)
 
 
-cleaned_data[["Latitude", "Longitude"]] = cleaned_data.apply(attach_block_centroid, axis=1)
+def attach_block_centroids(cleaned: pd.DataFrame) -> pd.DataFrame:
+    """Replace each row's camp coordinates with its block outline centroid where one exists."""
+    keys = pd.DataFrame({
+        "camp_key": _norm_series(cleaned["CampName"]).to_numpy(),
+        "block_key": _norm_series(cleaned["Block"]).to_numpy(),
+    })
+    located = keys.merge(block_centroid_table, on=["camp_key", "block_key"], how="left", validate="many_to_one")
+    found = located["centroid_lat"].notna().to_numpy()
+    return cleaned.assign(
+        Latitude=np.where(found, located["centroid_lat"].to_numpy(), cleaned["Latitude"].to_numpy(dtype=float)),
+        Longitude=np.where(found, located["centroid_lon"].to_numpy(), cleaned["Longitude"].to_numpy(dtype=float)),
+    )
+
+
+# -------------------------------------------------------------------
+# MERGE FIRE DATA + AOR, FSI CALC
+# -------------------------------------------------------------------
+def prepare_assessments(fire_df: pd.DataFrame) -> pd.DataFrame:
+    merged = pd.merge(fire_df, aor_data, on="CampName", how="left")
+    if "Block" not in merged.columns:
+        raise ValueError("❌ 'Block' column not found in dataset! Please check the data.")
+
+    merged["FSI_Calculated"] = (
+        merged["Environment"].fillna(0)
+        + merged["Fuel"].fillna(0)
+        + merged["Behaviour"].fillna(0)
+        + merged["Response"].fillna(0)
+    ) / 4
+    cleaned = merged.dropna(subset=["Latitude", "Longitude"]).copy()
+    cleaned["FSI_Class"] = cleaned["FSI_Calculated"].apply(classify_fsi)
+    return attach_block_centroids(cleaned)
+
+
+# -------------------------------------------------------------------
+# DATA SNAPSHOT (HOT-SWAPPABLE)
+# -------------------------------------------------------------------
+def _group_fingerprints(df: pd.DataFrame, keys: list[str]) -> dict:
+    """Content hash per group, so a reload can tell which groups changed."""
+    if df.empty:
+        return {}
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    groups = df[keys].astype(str).groupby(keys, sort=False).indices
+    return {
+        key: hashlib.sha1(row_hashes[idx].tobytes()).hexdigest()[:16]
+        for key, idx in groups.items()
+    }
+
+
+def _combine_fingerprints(fingerprints: dict) -> str:
+    digest = hashlib.sha1()
+    for key in sorted(fingerprints):
+        digest.update(repr((key, fingerprints[key])).encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+class DataSnapshot:
+    """
+    One consistent generation of the reloadable datasets.
+
+    Snapshots are built off to the side and swapped in as a whole, so a
+    callback that grabs `current_data()` once sees matching frames even if a
+    reload lands while it is running. Only the compacted frames and the
+    camp/block tables aggregated from them are kept; treat them as read-only.
+    """
+
+    def __init__(self, cleaned: pd.DataFrame, equipment: pd.DataFrame, hierarchy: AssessmentHierarchy | None = None):
+        self.cleaned_data = cleaned
+        self.equipment_df = equipment
+        self.hierarchy = hierarchy if hierarchy is not None else AssessmentHierarchy(cleaned)
+        self.block_fingerprints = _group_fingerprints(cleaned, ["CampName", "Block"])
+        self.equipment_fingerprints = _group_fingerprints(equipment, ["camp_key", "block_key"])
+        self.assessment_version = _combine_fingerprints(self.block_fingerprints)
+        self.equipment_version = _combine_fingerprints(self.equipment_fingerprints)
+        self.version = f"{self.assessment_version}-{self.equipment_version}"
+
+
+def _changed_keys(old: dict, new: dict) -> set:
+    return {k for k in set(old) | set(new) if old.get(k) != new.get(k)}
+
+
+def diff_snapshots(old: DataSnapshot, new: DataSnapshot) -> dict:
+    changed_blocks = _changed_keys(old.block_fingerprints, new.block_fingerprints)
+    changed_equipment = _changed_keys(old.equipment_fingerprints, new.equipment_fingerprints)
+    return {
+        "blocks": changed_blocks,
+        "camps": {camp for camp, _ in changed_blocks},
+        "equipment_blocks": changed_equipment,
+        "equipment_camps": {camp for camp, _ in changed_equipment},
+    }
+
+
+_rss_raw = rss_bytes() if MEMORY_REPORT else 0
+_prepared = prepare_assessments(_raw_fire_data)
+_cleaned = compact_assessments(_prepared)
+_equipment = compact_equipment(_raw_equipment)
+if MEMORY_REPORT:
+    _before = {"cleaned_data": frame_stats(_prepared), "equipment_df": frame_stats(_raw_equipment)}
+    _after = {"cleaned_data": frame_stats(_cleaned), "equipment_df": frame_stats(_equipment)}
+del _raw_fire_data, _prepared, _raw_equipment
+if MEMORY_REPORT:
+    report_compaction(_before, _after, _rss_raw)
+
+# Only the snapshot holds the frames, so every reader goes through
+# current_data() and sees the latest generation after a reload.
+_snapshot = DataSnapshot(_cleaned, _equipment)
+del _cleaned, _equipment
+_swap_lock = threading.Lock()
+
+
+def current_data() -> DataSnapshot:
+    return _snapshot
 
 
 # -------------------------------------------------------------------
 # CAMP-LEVEL SUMMARY BASE
 # -------------------------------------------------------------------
-def build_camp_summary_base() -> pd.DataFrame:
+def build_camp_summary_base(snapshot: DataSnapshot | None = None) -> pd.DataFrame:
+    snapshot = snapshot or current_data()
     summary = (
-        cleaned_data.groupby("CampName")[["Environment", "Fuel", "Behaviour", "Response"]]
-        .mean()
+        snapshot.hierarchy.camps[["Environment", "Fuel", "Behaviour", "Response", "FSI"]]
+        .rename(columns={"FSI": "FSI_Calculated"})
         .reset_index()
     )
-    summary["FSI_Calculated"] = (
-        summary["Environment"]
-        + summary["Fuel"]
-        + summary["Behaviour"]
-        + summary["Response"]
-    ) / 4
     summary = summary.merge(
         aor_data[["CampName", "Latitude", "Longitude"]].drop_duplicates("CampName"),
         on="CampName",
@@ -183,15 +302,20 @@ def build_camp_summary_base() -> pd.DataFrame:
     return summary
 
 
+def _camp_summary_key(today_iso: str, snapshot: DataSnapshot) -> str:
+    return f"camp_summary_live|date={today_iso}|data={snapshot.assessment_version}"
+
+
 def build_current_camp_summary(force_refresh: bool = False) -> pd.DataFrame:
+    snapshot = current_data()
     today_iso = date.today().isoformat()
-    cache_key = f"camp_summary_live|date={today_iso}"
+    cache_key = _camp_summary_key(today_iso, snapshot)
     if not force_refresh:
         cached = cache.get(cache_key)
         if cached is not None:
-            return cached.copy()
+            return cached
 
-    summary = build_camp_summary_base()
+    summary = build_camp_summary_base(snapshot)
     summary["FWI"] = summary.apply(
         lambda row: round(get_fwi_xclim(row["Latitude"], row["Longitude"], date_for=today_iso), 1),
         axis=1,
@@ -199,11 +323,80 @@ def build_current_camp_summary(force_refresh: bool = False) -> pd.DataFrame:
     summary["FRI"] = compute_fri(summary["FSI_Calculated"], summary["FWI"])
     summary["FRI_Class"] = summary["FRI"].apply(categorize_fri)
     cache.set(cache_key, summary, ttl_seconds=15 * 60)
-    return summary.copy()
+    return summary
 
 
 def get_live_camp_summary(force_refresh: bool = False) -> pd.DataFrame:
     return build_current_camp_summary(force_refresh=force_refresh)
 
 
-camp_summary = build_camp_summary_base()
+def cached_camp_summary() -> pd.DataFrame | None:
+    """Today's camp summary if some worker has already built it, without building it."""
+    return cache.get(_camp_summary_key(date.today().isoformat(), current_data()))
+
+
+def _carry_camp_summary(old: DataSnapshot, new: DataSnapshot, changed_camps: set) -> None:
+    """
+    Seed the new generation's camp summary from the previous one.
+
+    Only camps whose assessments changed get their FSI/FRI recomputed; FWI
+    depends on the AOR location rather than the survey, so it is reused and
+    fetched only for camps that did not exist before.
+    """
+    today_iso = date.today().isoformat()
+    previous = cache.get(_camp_summary_key(today_iso, old))
+    if previous is None:
+        return
+
+    summary = build_camp_summary_base(new)
+    previous = previous.set_index("CampName")
+    for col in ["FWI", "FRI", "FRI_Class"]:
+        summary[col] = summary["CampName"].map(previous[col])
+
+    missing_fwi = summary["FWI"].isna()
+    if missing_fwi.any():
+        summary.loc[missing_fwi, "FWI"] = summary.loc[missing_fwi].apply(
+            lambda row: round(get_fwi_xclim(row["Latitude"], row["Longitude"], date_for=today_iso), 1),
+            axis=1,
+        )
+
+    stale = summary["CampName"].isin(changed_camps) | summary["FRI"].isna()
+    if stale.any():
+        summary.loc[stale, "FRI"] = compute_fri(summary.loc[stale, "FSI_Calculated"], summary.loc[stale, "FWI"])
+        summary.loc[stale, "FRI_Class"] = summary.loc[stale, "FRI"].apply(categorize_fri)
+    cache.set(_camp_summary_key(today_iso, new), summary, ttl_seconds=15 * 60)
+
+
+# -------------------------------------------------------------------
+# RELOAD
+# -------------------------------------------------------------------
+def reload_data(assessments: bool = True, equipment: bool = True) -> dict:
+    """
+    Re-read the changed source files, build a new snapshot and swap it in.
+
+    Returns the camps/blocks whose content changed. Parse errors propagate and
+    leave the current snapshot untouched.
+    """
+    global _snapshot
+    with _swap_lock:
+        old = _snapshot
+        hierarchy = None
+        if assessments:
+            cleaned = compact_assessments(prepare_assessments(load_fire_data(BASE_DIR)))
+        else:
+            cleaned, hierarchy = old.cleaned_data, old.hierarchy
+        if equipment:
+            equipment_frame = compact_equipment(load_equipment_data(BASE_DIR))
+        else:
+            equipment_frame = old.equipment_df
+
+        new = DataSnapshot(cleaned, equipment_frame, hierarchy)
+        changes = diff_snapshots(old, new)
+        if new.version == old.version:
+            return changes
+
+        if changes["camps"]:
+            _carry_camp_summary(old, new, changes["camps"])
+        _snapshot = new
+    return changes
+
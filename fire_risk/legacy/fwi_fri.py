@@ -1,15 +1,14 @@
 from __future__ import annotations
 
+import os
 import time
 from datetime import date, timedelta
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
 import requests
-import xarray as xr
-import xclim
 from dash import html
-from xclim.indices.fire._cffwis import cffwis_indices
 
 from fire_risk.legacy.config import (
     FRI_HIGH_MAX,
@@ -22,7 +21,42 @@ from fire_risk.legacy.config import (
     FWI_MODERATE_MAX,
 )
 
-xclim.set_options(data_validation="log")
+
+@lru_cache(maxsize=None)
+def load_cffwis():
+    # xclim (with xarray, scipy and numba) is more than half of the app's
+    # import time, so it is loaded by the first FWI computation (or by the
+    # server preload) instead.
+    import xclim
+    from xclim.indices.fire._cffwis import cffwis_indices
+
+    xclim.set_options(data_validation="log")
+    return cffwis_indices
+
+
+# -------------------------------------------------------------------
+# WEATHER API ENDPOINTS
+# -------------------------------------------------------------------
+# FIRE_RISK_WEATHER_BASE_URL points all three at one server, e.g. the local
+# stand-in (python -m fire_risk.services.weather_stub); the per-API
+# variables override it.
+WEATHER_BASE_URL = os.environ.get("FIRE_RISK_WEATHER_BASE_URL", "").strip().rstrip("/")
+OPEN_METEO_FORECAST_URL = os.environ.get("FIRE_RISK_OPEN_METEO_URL", WEATHER_BASE_URL or "https://api.open-meteo.com").rstrip("/")
+OPEN_METEO_ARCHIVE_URL = os.environ.get("FIRE_RISK_OPEN_METEO_ARCHIVE_URL", WEATHER_BASE_URL or "https://archive-api.open-meteo.com").rstrip("/")
+NASA_POWER_URL = os.environ.get("FIRE_RISK_NASA_POWER_URL", WEATHER_BASE_URL or "https://power.larc.nasa.gov").rstrip("/")
+
+
+def _open_meteo_url(base_url, endpoint, lat, lon, start_date, end_date):
+    return (
+        f"{base_url}/v1/{endpoint}"
+        f"?latitude={lat}&longitude={lon}"
+        f"&start_date={start_date}&end_date={end_date}"
+        f"&hourly=temperature_2m,relative_humidity_2m,wind_speed_10m,wind_direction_10m"
+        f"&daily=precipitation_sum"
+        f"&wind_speed_unit=kmh"
+        f"&timezone=auto"
+    )
+
 
 # -------------------------------------------------------------------
 # CACHES
@@ -180,15 +214,7 @@ def get_historical_daily_weather(lat, lon, start_date, end_date):
     if isinstance(end_date, str):
         end_date = pd.to_datetime(end_date).date()
 
-    url = (
-        f"https://archive-api.open-meteo.com/v1/archive"
-        f"?latitude={lat}&longitude={lon}"
-        f"&start_date={start_date.isoformat()}&end_date={end_date.isoformat()}"
-        f"&hourly=temperature_2m,relative_humidity_2m,wind_speed_10m,wind_direction_10m"
-        f"&daily=precipitation_sum"
-        f"&wind_speed_unit=kmh"
-        f"&timezone=auto"
-    )
+    url = _open_meteo_url(OPEN_METEO_ARCHIVE_URL, "archive", lat, lon, start_date.isoformat(), end_date.isoformat())
 
     try:
         resp = requests.get(url, timeout=30)
@@ -207,15 +233,7 @@ def get_weather_noon(lat, lon, iso_date):
     Return local 13:00 temperature, RH, wind speed, wind direction,
     and daily precipitation using Open-Meteo.
     """
-    url = (
-        f"https://api.open-meteo.com/v1/forecast"
-        f"?latitude={lat}&longitude={lon}"
-        f"&start_date={iso_date}&end_date={iso_date}"
-        f"&hourly=temperature_2m,relative_humidity_2m,wind_speed_10m,wind_direction_10m"
-        f"&daily=precipitation_sum"
-        f"&wind_speed_unit=kmh"
-        f"&timezone=auto"
-    )
+    url = _open_meteo_url(OPEN_METEO_FORECAST_URL, "forecast", lat, lon, iso_date, iso_date)
 
     last_error = None
     for _ in range(3):
@@ -341,7 +359,7 @@ def _safe_power_year(year: int | None = None) -> int:
 
 def _power_monthly_url(lat, lon, year):
     return (
-        f"https://power.larc.nasa.gov/api/temporal/monthly/point"
+        f"{NASA_POWER_URL}/api/temporal/monthly/point"
         f"?start={year}&end={year}"
         f"&latitude={lat}&longitude={lon}"
         f"&community=sb"
@@ -354,7 +372,7 @@ def _power_monthly_url(lat, lon, year):
 
 def _power_climatology_url(lat, lon):
     return (
-        f"https://power.larc.nasa.gov/api/temporal/climatology/point"
+        f"{NASA_POWER_URL}/api/temporal/climatology/point"
         f"?start=1991&end=2020"
         f"&latitude={lat}&longitude={lon}"
         f"&community=sb"
@@ -630,15 +648,7 @@ def get_openmeteo_14day_weather(lat, lon, start_date=None, horizon=14):
         start_date = date.today() + timedelta(days=1)
     end_date = start_date + timedelta(days=horizon - 1)
 
-    url = (
-        f"https://api.open-meteo.com/v1/forecast"
-        f"?latitude={lat}&longitude={lon}"
-        f"&start_date={start_date.isoformat()}&end_date={end_date.isoformat()}"
-        f"&hourly=temperature_2m,relative_humidity_2m,wind_speed_10m,wind_direction_10m"
-        f"&daily=precipitation_sum"
-        f"&wind_speed_unit=kmh"
-        f"&timezone=auto"
-    )
+    url = _open_meteo_url(OPEN_METEO_FORECAST_URL, "forecast", lat, lon, start_date.isoformat(), end_date.isoformat())
 
     try:
         resp = requests.get(url, timeout=20)
@@ -727,6 +737,9 @@ def compute_fwi_sequence_xclim(weather_df, lat, ffmc0=85.0, dmc0=6.0, dc0=15.0):
         out["FWI_Risk"] = None
         return out
 
+    import xarray as xr
+
+    cffwis_indices = load_cffwis()
     times = pd.to_datetime(work["date"])
 
     da_tas = xr.DataArray(work["temp"].to_numpy(), dims=("time",), coords={"time": times}, name="tas", attrs={"units": "degC"})
@@ -1,8 +1,12 @@
 # layouts.py
+from functools import lru_cache
+
 from dash import html, dcc, dash_table
 import dash_bootstrap_components as dbc
 
-from fire_risk.legacy.data import cleaned_data
+from fire_risk.legacy.data import current_data
+from fire_risk.services.lite import is_lite
+from fire_risk.services.overview import build_overview_map, build_severity_donut
 
 FA_URL = "https://use.fontawesome.com/releases/v5.15.4/css/all.css"
 
@@ -37,189 +41,224 @@ def section_card(title, body, body_bg=None, icon=None, **card_kwargs):
     )
 
 
-navbar = dbc.Navbar(
-    dbc.Container(
-        fluid=True,
-        children=[
-            dbc.Row(
-                [
-                    dbc.Col(
-                        dbc.NavbarBrand(
-                            [
-                                html.Img(
-                                    src="https://upload.wikimedia.org/wikipedia/commons/9/99/FireIcon.svg",
-                                    style={
-                                        "height": "30px",
-                                        "marginRight": "10px",
-                                    },
-                                ),
-                                "Fire Risk Analysis",
-                            ],
-                            className="text-white",
-                            style={"fontSize": "28px", "fontWeight": "bold"},
+def build_navbar(lite=False):
+    # Built per page load so camps added by a data reload show up.
+    camp_names = current_data().hierarchy.camp_names()
+    if lite:
+        logo = html.Span("🔥", style={"marginRight": "10px"})
+    else:
+        logo = html.Img(
+            src="https://upload.wikimedia.org/wikipedia/commons/9/99/FireIcon.svg",
+            style={
+                "height": "30px",
+                "marginRight": "10px",
+            },
+        )
+    return dbc.Navbar(
+        dbc.Container(
+            fluid=True,
+            children=[
+                dbc.Row(
+                    [
+                        dbc.Col(
+                            dbc.NavbarBrand(
+                                [logo, "Fire Risk Analysis"],
+                                className="text-white",
+                                style={"fontSize": "28px", "fontWeight": "bold"},
+                            ),
+                            width="auto",
+                            style={"paddingLeft": 0},
                         ),
-                        width="auto",
-                        style={"paddingLeft": 0},
-                    ),
-                    dbc.Col(
-                        dbc.Nav(
-                            [
-                                dbc.NavItem(
-                                    dbc.NavLink(
-                                        "Site Level",
-                                        href="/",
-                                        active="exact",
-                                    )
-                                ),
-                                dbc.NavItem(
-                                    dbc.NavLink(
-                                        "Block Level",
-                                        href="/block",
-                                        active="exact",
-                                    )
-                                ),
-                                dbc.NavItem(
-                                    dbc.NavLink(
-                                        "Overview",
-                                        href="/overview",
-                                        active="exact",
-                                    )
-                                ),
-                                dbc.NavItem(
-                                    dbc.NavLink(
-                                        "About",
-                                        href="/about",
-                                        active="exact",
-                                    )
-                                ),
-                            ],
-                            navbar=True,
+                        dbc.Col(
+                            dbc.Nav(
+                                [
+                                    dbc.NavItem(
+                                        dbc.NavLink(
+                                            "Site Level",
+                                            href="/",
+                                            active="exact",
+                                        )
+                                    ),
+                                    dbc.NavItem(
+                                        dbc.NavLink(
+                                            "Block Level",
+                                            href="/block",
+                                            active="exact",
+                                        )
+                                    ),
+                                    dbc.NavItem(
+                                        dbc.NavLink(
+                                            "Overview",
+                                            href="/overview",
+                                            active="exact",
+                                        )
+                                    ),
+                                    dbc.NavItem(
+                                        dbc.NavLink(
+                                            "About",
+                                            href="/about",
+                                            active="exact",
+                                        )
+                                    ),
+                                ],
+                                navbar=True,
+                            ),
+                            width="auto",
+                            style={"marginLeft": "2rem"},
                         ),
-                        width="auto",
-                        style={"marginLeft": "2rem"},
-                    ),
-                    dbc.Col(
-                        html.Div(
-                            [
-                                html.Div(
-                                    id="camp-dropdown-container",
-                                    children=[
-                                        html.Span(
-                                            "Select a camp:",
-                                            style={
-                                                "color": "white",
-                                                "marginRight": "8px",
-                                            },
-                                        ),
-                                        dcc.Dropdown(
-                                            id="camp-dropdown",
-                                            options=[
-                                                {
-                                                    "label": c,
-                                                    "value": c,
-                                                }
-                                                for c in sorted(
-                                                    cleaned_data[
-                                                        "CampName"
-                                                    ].unique()
-                                                )
-                                            ],
-                                            value=(
-                                                sorted(
-                                                    cleaned_data[
-                                                        "CampName"
-                                                    ].unique()
-                                                )[0]
-                                                if not cleaned_data.empty
-                                                else None
+                        dbc.Col(
+                            html.Div(
+                                [
+                                    html.Div(
+                                        id="camp-dropdown-container",
+                                        children=[
+                                            html.Span(
+                                                "Select a camp:",
+                                                style={
+                                                    "color": "white",
+                                                    "marginRight": "8px",
+                                                },
                                             ),
-                                            clearable=False,
-                                            style={
-                                                "width": "200px",
-                                                "fontSize": "14px",
-                                            },
-                                        ),
-                                    ],
-                                    style={
-                                        "display": "flex",
-                                        "alignItems": "center",
-                                        "justifyContent": "flex-end",
-                                    },
-                                ),
-                                html.Div(
-                                    id="block-filter-container",
-                                    children=[
-                                        html.Span(
-                                            "Camp / Block:",
-                                            style={
-                                                "color": "white",
-                                                "marginRight": "8px",
-                                            },
-                                        ),
-                                        dcc.Dropdown(
-                                            id="block-camp-dropdown",
-                                            options=[
-                                                {
-                                                    "label": c,
-                                                    "value": c,
-                                                }
-                                                for c in sorted(
-                                                    cleaned_data[
-                                                        "CampName"
-                                                    ]
-                                                    .dropna()
-                                                    .unique()
-                                                )
-                                            ],
-                                            value=None,
-                                            placeholder="Select camp",
-                                            clearable=True,
-                                            style={
-                                                "width": "190px",
-                                                "fontSize": "14px",
-                                                "marginRight": "6px",
-                                            },
-                                        ),
-                                        dcc.Dropdown(
-                                            id="block-block-dropdown",
-                                            options=[],
-                                            value=None,
-                                            placeholder="Select block",
-                                            clearable=True,
-                                            style={
-                                                "width": "190px",
-                                                "fontSize": "14px",
-                                            },
-                                        ),
-                                    ],
-                                    style={
-                                        "display": "none",
-                                        "alignItems": "center",
-                                        "justifyContent": "flex-end",
-                                    },
-                                ),
-                            ],
+                                            dcc.Dropdown(
+                                                id="camp-dropdown",
+                                                options=[
+                                                    {
+                                                        "label": c,
+                                                        "value": c,
+                                                    }
+                                                    for c in camp_names
+                                                ],
+                                                value=camp_names[0] if camp_names else None,
+                                                clearable=False,
+                                                style={
+                                                    "width": "200px",
+                                                    "fontSize": "14px",
+                                                },
+                                            ),
+                                        ],
+                                        style={
+                                            "display": "flex",
+                                            "alignItems": "center",
+                                            "justifyContent": "flex-end",
+                                        },
+                                    ),
+                                    html.Div(
+                                        id="block-filter-container",
+                                        children=[
+                                            html.Span(
+                                                "Camp / Block:",
+                                                style={
+                                                    "color": "white",
+                                                    "marginRight": "8px",
+                                                },
+                                            ),
+                                            dcc.Dropdown(
+                                                id="block-camp-dropdown",
+                                                options=[
+                                                    {
+                                                        "label": c,
+                                                        "value": c,
+                                                    }
+                                                    for c in camp_names
+                                                ],
+                                                value=None,
+                                                placeholder="Select camp",
+                                                clearable=True,
+                                                style={
+                                                    "width": "190px",
+                                                    "fontSize": "14px",
+                                                    "marginRight": "6px",
+                                                },
+                                            ),
+                                            dcc.Dropdown(
+                                                id="block-block-dropdown",
+                                                options=[],
+                                                value=None,
+                                                placeholder="Select block",
+                                                clearable=True,
+                                                style={
+                                                    "width": "190px",
+                                                    "fontSize": "14px",
+                                                },
+                                            ),
+                                        ],
+                                        style={
+                                            "display": "none",
+                                            "alignItems": "center",
+                                            "justifyContent": "flex-end",
+                                        },
+                                    ),
+                                ],
+                                style={
+                                    "display": "flex",
+                                    "alignItems": "center",
+                                    "gap": "12px",
+                                },
+                            ),
+                            width="auto",
+                            style={"marginLeft": "auto"},
+                        ),
+                    ],
+                    align="center",
+                    className="w-100",
+                )
+            ],
+        ),
+        color="#0033A0",
+        dark=True,
+    )
+
+
+def site_level_layout(lite=False):
+    if lite:
+        # Low-bandwidth mode: block table and forecast sparklines instead of
+        # the map, and no Windy embed. The hidden components keep the outputs
+        # of the map and Windy callbacks, which send nothing in this mode.
+        maps_row = dbc.Row(
+            dbc.Col(
+                section_card(
+                    "Camp Fire Risk by Block",
+                    html.Div([
+                        html.Div(id="site-map-lite"),
+                        dcc.Graph(id="fire-risk-map", style={"display": "none"}),
+                        html.Iframe(id="windy-iframe", style={"display": "none"}),
+                    ]),
+                ),
+                width=12,
+            ),
+            className="g-3",
+        )
+    else:
+        maps_row = dbc.Row(
+            [
+                dbc.Col(
+                    section_card(
+                        "Camp Boundary FRI Heatmap",
+                        dcc.Graph(
+                            id="fire-risk-map",
+                            config={"displayModeBar": False},
+                        ),
+                    ),
+                    width=6,
+                ),
+                dbc.Col(
+                    section_card(
+                        "Live Wind Map",
+                        html.Iframe(
+                            id="windy-iframe",
                             style={
-                                "display": "flex",
-                                "alignItems": "center",
-                                "gap": "12px",
+                                "width": "100%",
+                                "height": "400px",
+                                "border": "none",
                             },
                         ),
-                        width="auto",
-                        style={"marginLeft": "auto"},
                     ),
-                ],
-                align="center",
-                className="w-100",
-            )
-        ],
-    ),
-    color="#0033A0",
-    dark=True,
-)
-
+                    width=6,
+                ),
+            ],
+            className="g-3",
+        )
 
-def site_level_layout():
     return dbc.Container(
         [
             html.Br(),
@@ -383,35 +422,7 @@ def site_level_layout():
                 ],
                 className="g-3",
             ),
-            dbc.Row(
-                [
-                    dbc.Col(
-                        section_card(
-                            "Camp Boundary FRI Heatmap",
-                            dcc.Graph(
-                                id="fire-risk-map",
-                                config={"displayModeBar": False},
-                            ),
-                        ),
-                        width=6,
-                    ),
-                    dbc.Col(
-                        section_card(
-                            "Live Wind Map",
-                            html.Iframe(
-                                id="windy-iframe",
-                                style={
-                                    "width": "100%",
-                                    "height": "400px",
-                                    "border": "none",
-                                },
-                            ),
-                        ),
-                        width=6,
-                    ),
-                ],
-                className="g-3",
-            ),
+            maps_row,
             dbc.Row(
                 [
                     dbc.Col(
@@ -472,7 +483,24 @@ def block_level_layout():
     )
 
 
-def overview_layout():
+def overview_layout(lite=False):
+    if lite:
+        # The ranking table already lists every camp; the hidden graph keeps
+        # the filter's map output, which is skipped without a figure.
+        risk_map = [
+            html.H5("Camp Fire Risk Map", className="mb-3"),
+            html.P(
+                "The map is not loaded in low-bandwidth mode; see the ranking table below.",
+                className="text-muted small mb-0",
+            ),
+            dcc.Graph(id="overview-heatmap", style={"display": "none"}),
+        ]
+    else:
+        risk_map = [
+            html.H5("Camp Fire Risk Map", className="mb-3"),
+            dcc.Graph(id="overview-heatmap", figure=build_overview_map(), config={"displayModeBar": False}),
+        ]
+
     return dbc.Container(
         [
             dbc.Row(
@@ -627,12 +655,7 @@ def overview_layout():
                 [
                     dbc.Col(
                         dbc.Card(
-                            dbc.CardBody(
-                                [
-                                    html.H5("Camp Fire Risk Map", className="mb-3"),
-                                    dcc.Graph(id="overview-heatmap", config={"displayModeBar": False}),
-                                ]
-                            )
+                            dbc.CardBody(risk_map)
                         ),
                         width=8,
                     ),
@@ -641,7 +664,7 @@ def overview_layout():
                             dbc.CardBody(
                                 [
                                     html.H5("Severity Distribution", className="mb-3"),
-                                    dcc.Graph(id="overview-severity-donut", config={"displayModeBar": False}),
+                                    dcc.Graph(id="overview-severity-donut", figure=build_severity_donut(), config={"displayModeBar": False}),
                                     html.Hr(),
                                     html.H5("Top 5 Highest-Risk Camps", className="mb-3"),
                                     html.Div(id="overview-top5"),
@@ -930,4 +953,34 @@ def about_layout():
             page_footer(),
         ],
     fluid=True,
-)
\ No newline at end of file
+)
+
+
+# ------ PAGE CACHE ------
+PAGES = {
+    "/overview": overview_layout,
+    "/about": about_layout,
+    "/block": block_level_layout,
+}
+
+
+# Pages with a low-bandwidth variant (`lite=True`).
+LITE_PAGES = ("/", "/overview")
+
+
+@lru_cache(maxsize=16)
+def _page_layout(pathname, data_version, lite):
+    build = PAGES.get(pathname, site_level_layout)
+    return build(lite=True) if lite and pathname in LITE_PAGES else build()
+
+
+def page_layout(pathname):
+    """
+    Page body for `pathname`, built once per data version and shared by every
+    navigation; unknown paths get the site page. Dash only serialises the
+    tree, so a cached layout is never modified. Low-bandwidth requests get
+    the lite variant where the page has one.
+    """
+    if pathname not in PAGES:
+        pathname = "/"
+    return _page_layout(pathname, current_data().version, is_lite())
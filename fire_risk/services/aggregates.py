@@ -0,0 +1,124 @@
+"""Equipment aggregates per camp and per (camp, block), built once per data version."""
+from __future__ import annotations
+
+import threading
+
+import pandas as pd
+
+from fire_risk.legacy.data import DataSnapshot, current_data
+from fire_risk.services.spatial_join import get_equipment_join
+
+TOP_TYPES = 3
+ALL = "*"
+CUBE_KEYS = ["camp_key", "block_key"]
+
+
+def _key(value) -> str:
+    return str(value).strip().upper()
+
+
+def _top_types(equipment: pd.DataFrame, keys: list[str]) -> dict:
+    """Top facility types per group, most common first (ties in category order)."""
+    counts = equipment.groupby(keys + ["Type_of facility"], observed=True).size().rename("count").reset_index()
+    counts = counts.sort_values(keys + ["count"], ascending=[True] * len(keys) + [False], kind="stable")
+    result = {}
+    for row in counts.groupby(keys, observed=True).head(TOP_TYPES).itertuples(index=False):
+        result.setdefault(tuple(row[:len(keys)]), {})[str(row[-2])] = int(row[-1])
+    return result
+
+
+def _aggregate(equipment: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    status = equipment["status_group"]
+    frame = equipment[keys + ["_LATITUDE", "_LONGITUDE"]].assign(
+        functional=(status == "Functional").to_numpy(dtype="int64"),
+        non_functional=(status == "Non-functional").to_numpy(dtype="int64"),
+    )
+    out = frame.groupby(keys, observed=True).agg(
+        total=("functional", "size"),
+        functional=("functional", "sum"),
+        non_functional=("non_functional", "sum"),
+        lat=("_LATITUDE", "mean"),
+        lon=("_LONGITUDE", "mean"),
+    )
+    out["unknown"] = out["total"] - out["functional"] - out["non_functional"]
+    out.index = pd.MultiIndex.from_arrays(
+        [out.index.get_level_values(k).astype(str) if k in keys else [ALL] * len(out) for k in CUBE_KEYS],
+        names=CUBE_KEYS,
+    )
+    return out[["total", "functional", "non_functional", "unknown", "lat", "lon"]]
+
+
+class EquipmentAggregates:
+    """
+    Status counts, top facility types and centre point for every camp and
+    (camp, block) in one equipment snapshot. `cube` holds the same numbers as
+    a frame indexed by (camp_key, block_key), with `*` as the block of the
+    camp-level rows and ("*", "*") for the whole dataset.
+    """
+
+    def __init__(self, equipment: pd.DataFrame, version: str):
+        self.version = version
+        self._equipment = equipment
+
+        # The whole dataset is grouped under a constant camp/block key.
+        everything = equipment.assign(camp_key=ALL, block_key=ALL)
+        self.cube = pd.concat([
+            _aggregate(everything, CUBE_KEYS),
+            _aggregate(equipment, ["camp_key"]),
+            _aggregate(equipment, CUBE_KEYS),
+        ])
+
+        top = _top_types(everything, CUBE_KEYS)
+        top.update({(c, ALL): t for (c,), t in _top_types(equipment, ["camp_key"]).items()})
+        top.update(_top_types(equipment, CUBE_KEYS))
+
+        self._entries = {
+            key: {
+                "total": int(row.total),
+                "functional": int(row.functional),
+                "non_functional": int(row.non_functional),
+                "unknown": int(row.unknown),
+                "top_types": top.get(key, {}),
+                "center": [float(row.lat), float(row.lon)],
+            }
+            for key, row in zip(self.cube.index, self.cube.itertuples(index=False))
+        }
+
+    def lookup(self, camp: str | None = None, block: str | None = None) -> dict | None:
+        """Aggregates for a selection, or None when it has no equipment."""
+        if camp is None and block is not None:
+            # Block label without a camp (not offered by the UI): rare enough
+            # to aggregate on the fly.
+            rows = self._equipment[self._equipment["block_key"] == _key(block)]
+            if rows.empty:
+                return None
+            return EquipmentAggregates(rows, self.version).lookup()
+        return self._entries.get((_key(camp) if camp else ALL, _key(block) if block else ALL))
+
+
+MATCH_MODES = ("recorded", "location")
+
+_aggregates: dict[str, EquipmentAggregates] = {}
+_aggregates_lock = threading.Lock()
+
+
+def get_equipment_aggregates(snapshot: DataSnapshot | None = None, by: str = "recorded") -> EquipmentAggregates:
+    """
+    Aggregates for the active equipment data. Built at startup and again by
+    the reload watcher, so callbacks only ever do a dict lookup. `by`
+    groups rows by their recorded Camp/Sub_block ("recorded") or by the
+    block outline they lie in ("location").
+    """
+    snapshot = snapshot or current_data()
+    aggregates = _aggregates.get(by)
+    if aggregates is not None and aggregates.version == snapshot.equipment_version:
+        return aggregates
+
+    with _aggregates_lock:
+        aggregates = _aggregates.get(by)
+        if aggregates is None or aggregates.version != snapshot.equipment_version:
+            equipment = snapshot.equipment_df
+            if by == "location":
+                equipment = get_equipment_join(snapshot).located_keys(equipment)
+            aggregates = _aggregates[by] = EquipmentAggregates(equipment, snapshot.equipment_version)
+        return aggregates
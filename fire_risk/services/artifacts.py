@@ -0,0 +1,42 @@
+"""Clean-up of the per-version files (databases, tile stores, packed outlines) under `.cache/`."""
+from __future__ import annotations
+
+import re
+import shutil
+from pathlib import Path
+
+KEEP_VERSIONS = 2
+
+
+def prune_versions(current: Path, pattern: str, keep: int = KEEP_VERSIONS) -> list[Path]:
+    """
+    Delete older versions of `current`: the entries in its directory whose
+    name fully matches `pattern`, apart from `current` itself and the most
+    recent `keep - 1` others. The previous version is kept because other
+    workers may still be serving it until they reload. Returns what was
+    removed.
+    """
+    regex = re.compile(pattern)
+    current = Path(current)
+    try:
+        others = [
+            p for p in current.parent.iterdir()
+            if p.name != current.name and regex.fullmatch(p.name)
+        ]
+        others.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    except OSError:
+        return []
+
+    removed = []
+    for path in others[max(keep - 1, 0):]:
+        try:
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+            removed.append(path)
+        except OSError as e:
+            print(f"[WARN] Could not remove old cache file {path}: {repr(e)}")
+    if removed:
+        print(f"[INFO] Removed {len(removed)} old version(s) of {current.name}: {', '.join(p.name for p in removed)}")
+    return removed
@@ -0,0 +1,83 @@
+"""Per-block scores, centroid and camp block table shared by the block page callbacks."""
+from __future__ import annotations
+
+import math
+from datetime import date
+from functools import cached_property, lru_cache
+
+import pandas as pd
+
+from fire_risk.legacy.data import current_data
+from fire_risk.legacy.fwi_fri import get_fwi_xclim
+from fire_risk.services.hierarchy import DIMENSIONS, format_date_range, format_population
+from fire_risk.services.repository import get_repository
+
+
+class BlockContext:
+    """
+    What every block page callback derives from a (camp, block) selection.
+
+    The block's dimension means, ceiled FSI/dimension scores, centroid,
+    population and assessment dates come from the snapshot's block table;
+    the block's survey rows and the per-block FWI lookups are fetched on
+    first use and then shared, so the page body, both tab callbacks and the
+    action plan never repeat them. Callers must not modify the frames; use
+    `.assign()` to add columns.
+    """
+
+    def __init__(self, camp: str, block: str, version: str, today_iso: str):
+        self.camp = camp
+        self.block = block
+        self.version = version
+        self.today_iso = today_iso
+        self._hierarchy = current_data().hierarchy
+        self.summary = self._hierarchy.block(camp, block)
+        self.empty = self.summary is None
+        if self.empty:
+            return
+
+        self.dims_mean = self.summary[DIMENSIONS]
+        self.fsi_value = int(self.summary["FSI_Score"])
+        self.fsi_class = self.summary["FSI_Class"]
+        self.scores = {d: math.ceil(self.dims_mean[d]) for d in DIMENSIONS}
+        self.lat = self.summary["Latitude"]
+        self.lon = self.summary["Longitude"]
+        self.population_text = format_population(self.summary["population"])
+        self.assessment_text = format_date_range(self.summary["assessment_start"], self.summary["assessment_end"])
+
+    @cached_property
+    def block_data(self) -> pd.DataFrame:
+        return get_repository().assessments(self.camp, self.block)
+
+    @cached_property
+    def fwi_value(self) -> int:
+        """Today's FWI at the block centroid, ceiled."""
+        return math.ceil(get_fwi_xclim(self.lat, self.lon, date_for=self.today_iso))
+
+    @cached_property
+    def camp_blocks(self) -> pd.DataFrame:
+        """Block table rows of every block in the camp, with Block as a column."""
+        return self._hierarchy.camp_block_table(self.camp)
+
+    @cached_property
+    def camp_block_fwi(self) -> pd.Series:
+        """Today's unrounded FWI at each camp block's centroid, aligned with `camp_blocks`."""
+        blocks = self.camp_blocks
+        return pd.Series(
+            [
+                get_fwi_xclim(lat, lon, date_for=self.today_iso)
+                for lat, lon in zip(blocks["Latitude"], blocks["Longitude"])
+            ],
+            index=blocks.index,
+            dtype=float,
+        )
+
+
+@lru_cache(maxsize=128)
+def _block_context(camp: str, block: str, version: str, today_iso: str) -> BlockContext:
+    return BlockContext(camp, block, version, today_iso)
+
+
+def get_block_context(camp: str, block: str) -> BlockContext:
+    """Context for a selection, cached per (camp, block, assessment version, date)."""
+    return _block_context(camp, block, current_data().assessment_version, date.today().isoformat())
@@ -36,6 +36,16 @@ class TTLCache:
         with sqlite3.connect(self.db_path) as c:
             c.execute("INSERT OR REPLACE INTO cache(key,value,exp) VALUES(?,?,?)", (key, blob, exp))
 
+    def add(self, key: str, value: Any, ttl_seconds: int | None = None) -> bool:
+        """Set `key` only if it is missing or expired; True if this call set it (a lock shared by all workers)."""
+        now = int(time.time())
+        exp = now + int(ttl_seconds) if ttl_seconds is not None else None
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with sqlite3.connect(self.db_path) as c:
+            c.execute("DELETE FROM cache WHERE key=? AND exp IS NOT NULL AND exp < ?", (key, now))
+            inserted = c.execute("INSERT OR IGNORE INTO cache(key,value,exp) VALUES(?,?,?)", (key, blob, exp))
+            return inserted.rowcount == 1
+
     def purge_expired(self) -> None:
         now = int(time.time())
         with sqlite3.connect(self.db_path) as c:
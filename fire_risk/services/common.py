@@ -1,10 +1,39 @@
+import hashlib
 from datetime import date
 
-from fire_risk.legacy.data import get_live_camp_summary
+import pandas as pd
+
+from fire_risk.legacy.data import current_data, get_live_camp_summary
 
 OUTLOOK_YEAR = date.today().year
 OUTLOOK_LABEL = f"Seasonal Outlook {OUTLOOK_YEAR}"
 
+# Columns of the live summary that the site page reads.
+SNAPSHOT_COLUMNS = ["CampName", "Latitude", "Longitude", "FSI_Calculated", "FWI", "FRI", "FRI_Class"]
+
 
 def current_camp_summary(force_refresh: bool = False):
     return get_live_camp_summary(force_refresh=force_refresh)
+
+
+def camp_summary_snapshot() -> dict:
+    """
+    Live camp summary for the `camp-summary-store`: the site page columns
+    plus a version id that only changes when the assessments or the values
+    do.
+    """
+    summary = current_camp_summary()[SNAPSHOT_COLUMNS]
+    digest = hashlib.sha1(pd.util.hash_pandas_object(summary, index=False).to_numpy().tobytes()).hexdigest()[:16]
+    rows = summary.astype(object).where(summary.notna(), None).to_numpy().tolist()
+    return {
+        "version": f"{current_data().assessment_version}-{digest}",
+        "columns": SNAPSHOT_COLUMNS,
+        "rows": rows,
+    }
+
+
+def summary_from_snapshot(data: dict | None) -> pd.DataFrame:
+    """Camp summary frame from the store, or read directly before it is filled."""
+    if not data:
+        return current_camp_summary()
+    return pd.DataFrame(data["rows"], columns=data["columns"])
@@ -0,0 +1,131 @@
+"""Compact equipment GeoJSON and popup endpoints for the equipment map."""
+from __future__ import annotations
+
+import gzip
+import json
+from functools import lru_cache
+from urllib.parse import urlencode
+
+import dash
+import pandas as pd
+from flask import Response, abort, request
+
+from fire_risk.legacy.data import current_data
+from fire_risk.services.repository import get_repository
+from fire_risk.services.spatial_join import get_equipment_join
+
+# Status groups are sent as small integer codes and coloured in the browser
+# (assets/equipment_map.js); the order matches STATUS_COLORS.
+STATUS_CODES = {"Functional": 0, "Non-functional": 1}
+UNKNOWN_STATUS_CODE = 2
+STATUS_COLORS = ["green", "red", "orange"]
+
+POPUP_FIELDS = [
+    ("Camp", "Camp"),
+    ("Sub-block", "Sub_block"),
+    ("Majhee Section", "Majhee_section"),
+    ("Landmark", "Landmark"),
+    ("Status", "Overall status"),
+    ("Water Source", "Source_of water"),
+    ("Distance from water", "Distance from water source"),
+    ("Material", "Material"),
+    ("Facility focal", "Facility focal name"),
+    ("DMU", "DMU"),
+    ("Warden", "Warden_name"),
+    ("Remarks", "Remarks"),
+]
+
+
+def _text(value) -> str:
+    return "N/A" if value is None or pd.isna(value) else str(value)
+
+
+def _selection(camp: str | None, block: str | None, by: str) -> pd.DataFrame:
+    if by == "location" and camp:
+        return current_data().equipment_df.take(get_equipment_join().rows(camp, block))
+    return get_repository().equipment(camp, block)
+
+
+@lru_cache(maxsize=256)
+def _equipment_geojson(version: str, camp: str | None, block: str | None, by: str = "recorded") -> bytes:
+    """Gzipped point layer for a selection: one feature per row, {id, s} only."""
+    dff = _selection(camp, block, by)
+    codes = dff["status_group"].map(STATUS_CODES).fillna(UNKNOWN_STATUS_CODE).astype(int)
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [round(lon, 6), round(lat, 6)]},
+            "properties": {"id": int(row_id), "s": int(code)},
+        }
+        for row_id, lon, lat, code in zip(
+            dff["_ID"].to_numpy(), dff["_LONGITUDE"].to_numpy(), dff["_LATITUDE"].to_numpy(), codes.to_numpy()
+        )
+    ]
+    body = json.dumps({"type": "FeatureCollection", "features": features}, separators=(",", ":"))
+    return gzip.compress(body.encode("utf-8"), mtime=0)
+
+
+@lru_cache(maxsize=4)
+def _rows_by_id(version: str) -> dict:
+    equipment = current_data().equipment_df
+    return dict(zip(equipment["_ID"].to_numpy().tolist(), range(len(equipment))))
+
+
+def equipment_popup(row_id: int) -> dict | None:
+    snapshot = current_data()
+    pos = _rows_by_id(snapshot.version).get(row_id)
+    if pos is None:
+        return None
+    row = snapshot.equipment_df.iloc[pos]
+    return {
+        "title": _text(row.get("Type_of facility", "Equipment")),
+        "fields": [[label, _text(row.get(col))] for label, col in POPUP_FIELDS],
+    }
+
+
+def equipment_layer_url(camp: str | None, block: str | None, by: str = "recorded") -> str:
+    """Versioned URL of the point layer for a camp/block selection (call inside a callback)."""
+    params = {"v": current_data().equipment_version}
+    if camp:
+        params["camp"] = camp
+    if block:
+        params["block"] = block
+    if by == "location":
+        params["by"] = by
+    return dash.get_relative_path(f"/api/equipment.geojson?{urlencode(params)}")
+
+
+def popup_url_prefix() -> str:
+    return dash.get_relative_path("/api/equipment/")
+
+
+def register_equipment_routes(server) -> None:
+    @server.route("/api/equipment.geojson")
+    def equipment_points():
+        snapshot = current_data()
+        body = _equipment_geojson(
+            snapshot.version,
+            request.args.get("camp") or None,
+            request.args.get("block") or None,
+            "location" if request.args.get("by") == "location" else "recorded",
+        )
+        # URLs carry the equipment version, so a stale copy is never reused
+        # after a reload.
+        immutable = request.args.get("v") == snapshot.equipment_version
+        headers = {"Cache-Control": "public, max-age=31536000, immutable" if immutable else "no-cache"}
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+        else:
+            body = gzip.decompress(body)
+        return Response(body, mimetype="application/geo+json", headers=headers)
+
+    @server.route("/api/equipment/<int:row_id>")
+    def equipment_details(row_id):
+        popup = equipment_popup(row_id)
+        if popup is None:
+            abort(404)
+        return Response(
+            json.dumps(popup),
+            mimetype="application/json",
+            headers={"Cache-Control": "public, max-age=300"},
+        )
@@ -0,0 +1,66 @@
+"""Rendered figures and forecast frames shared by every session and worker through the TTL cache."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import date
+
+import pandas as pd
+import plotly.io as pio
+
+from fire_risk.legacy.data import current_data
+from fire_risk.legacy.fwi_fri import get_14day_fire_forecast
+from fire_risk.services.cache import cache
+
+# Matches the weather refresh interval: a figure is built at most once per
+# refresh for each key.
+FIGURE_TTL_SECONDS = int(os.environ.get("FIRE_RISK_FIGURE_TTL", 15 * 60))
+
+
+def _cache_key(prefix: str, key: dict) -> str:
+    return cache.make_key(
+        prefix,
+        data=current_data().assessment_version,
+        date=date.today().isoformat(),
+        **key,
+    )
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Short content hash of `df`, for keying figures built from a cached frame:
+    the frame and its figures expire separately, so without it a figure could
+    outlive the forecast it was drawn from and disagree with the narrative.
+    """
+    digest = hashlib.sha1("|".join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def cached_figures(kind: str, build, ttl: int = FIGURE_TTL_SECONDS, **key) -> list[dict]:
+    """
+    Figures of type `kind` for `key` (camp, block, ...) as plain figure dicts.
+
+    On a miss `build()` returns the figures (dicts or go.Figure); their JSON
+    is stored under (kind, key, assessment data version, date), so every
+    session and worker serves the same serialized figures until the TTL runs
+    out.
+    """
+    cache_key = _cache_key(f"figure:{kind}", key)
+    bodies = cache.get(cache_key)
+    if bodies is None:
+        bodies = [pio.to_json(fig, validate=False) for fig in build()]
+        cache.set(cache_key, bodies, ttl_seconds=ttl)
+    return [json.loads(body) for body in bodies]
+
+
+def cached_forecast(lat: float, lon: float, base_fsi: float, ttl: int = FIGURE_TTL_SECONDS) -> pd.DataFrame:
+    """14-day forecast frame behind the cached forecast figures; failed fetches are not cached."""
+    cache_key = _cache_key("forecast", {"lat": round(lat, 4), "lon": round(lon, 4), "fsi": base_fsi})
+    forecast_df = cache.get(cache_key)
+    if forecast_df is None:
+        forecast_df = get_14day_fire_forecast(lat, lon, base_fsi=base_fsi)
+        if not forecast_df.empty:
+            cache.set(cache_key, forecast_df, ttl_seconds=ttl)
+    return forecast_df
@@ -0,0 +1,387 @@
+"""Multi-resolution camp and block outlines for the map callbacks."""
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from fire_risk.legacy.data import block_outline_store, camp_outline_store
+from fire_risk.services.geostore import PackedOutlines
+
+# Zoom levels a simplified copy is kept for. A level is simplified to half a
+# screen pixel at its zoom, so it is indistinguishable from the full outline
+# there and at any lower zoom.
+SIMPLIFY_ZOOMS = (10, 12, 14, 16)
+FULL_RESOLUTION_ZOOM = 18
+
+
+def pixel_size_deg(zoom: float) -> float:
+    """Width of one 256px-tile screen pixel in degrees at `zoom`."""
+    return 360.0 / (256 * 2 ** zoom)
+
+
+def tolerance_for_zoom(zoom: float) -> float:
+    return pixel_size_deg(zoom) / 2
+
+
+def level_for_zoom(zoom: float | None) -> int | None:
+    """Coarsest stored level that is still faithful at `zoom`; None means full resolution."""
+    if zoom is None or zoom >= FULL_RESOLUTION_ZOOM:
+        return None
+    for level in reversed(SIMPLIFY_ZOOMS):
+        if level <= zoom:
+            return level
+    return SIMPLIFY_ZOOMS[0]
+
+
+# -------------------------------------------------------------------
+# ARC DECOMPOSITION
+# -------------------------------------------------------------------
+def _open_ring(ring) -> list[tuple]:
+    pts = [tuple(p) for p in ring]
+    if len(pts) > 1 and pts[0] == pts[-1]:
+        pts = pts[:-1]
+    return pts
+
+
+def _junctions(rings: list[list[tuple]]) -> set:
+    """
+    Vertices where a shared boundary starts or ends: the point is used with
+    different neighbours by different rings (or twice by one ring).
+    """
+    neighbours = {}
+    for pts in rings:
+        n = len(pts)
+        for i, p in enumerate(pts):
+            pair = frozenset((pts[i - 1], pts[(i + 1) % n]))
+            neighbours.setdefault(p, set()).add(pair)
+    return {p for p, pairs in neighbours.items() if len(pairs) > 1}
+
+
+def _split_ring(pts: list[tuple], junctions: set) -> list[list[tuple]]:
+    cuts = [i for i, p in enumerate(pts) if p in junctions]
+    if not cuts:
+        return [pts + [pts[0]]]
+    start = cuts[0]
+    rotated = pts[start:] + pts[:start]
+    cuts = [i - start for i in cuts]
+    cuts.append(len(rotated))
+    closed = rotated + [rotated[0]]
+    return [closed[a:b + 1] for a, b in zip(cuts, cuts[1:])]
+
+
+class ArcTopology:
+    """
+    Rings of a polygon layer expressed as shared arcs.
+
+    Each boundary between two neighbouring polygons is stored once, so
+    simplifying arcs (not rings) moves a shared edge identically for both
+    sides and never opens gaps or overlaps between blocks.
+    """
+
+    def __init__(self, outlines: PackedOutlines):
+        rings = []
+        self.ring_index = []  # (feature, ring) for each ring
+        for fi in range(len(outlines)):
+            for ri, ring in enumerate(outlines.rings(fi)):
+                pts = _open_ring(ring.tolist())
+                if len(pts) >= 3:
+                    rings.append(pts)
+                    self.ring_index.append((fi, ri))
+
+        junctions = _junctions(rings)
+        self.arcs: list[np.ndarray] = []
+        arc_ids = {}
+        self.ring_arcs = []  # per ring: list of (arc id, reversed)
+        for pts in rings:
+            refs = []
+            for arc in _split_ring(pts, junctions):
+                key = tuple(arc)
+                rkey = key[::-1]
+                if key in arc_ids:
+                    refs.append((arc_ids[key], False))
+                elif rkey in arc_ids:
+                    refs.append((arc_ids[rkey], True))
+                else:
+                    arc_ids[key] = len(self.arcs)
+                    self.arcs.append(np.asarray(arc, dtype=np.float64))
+                    refs.append((arc_ids[key], False))
+            self.ring_arcs.append(refs)
+
+    def simplify(self, tolerance: float) -> list[np.ndarray]:
+        keep = [_douglas_peucker(arc, tolerance) for arc in self.arcs]
+        # A ring made of a few arcs can collapse below a triangle; retry its
+        # arcs with a finer tolerance (shared arcs stay shared).
+        for refs in self.ring_arcs:
+            tol = tolerance
+            while tol > 1e-12 and sum(int(keep[a].sum()) - 1 for a, _ in refs) < 3:
+                tol /= 4
+                for a, _ in refs:
+                    keep[a] = _douglas_peucker(self.arcs[a], tol)
+        return [arc[mask] for arc, mask in zip(self.arcs, keep)]
+
+    def rings(self, arcs: list[np.ndarray]) -> list[np.ndarray]:
+        out = []
+        for refs in self.ring_arcs:
+            parts = []
+            for a, rev in refs:
+                arc = arcs[a][::-1] if rev else arcs[a]
+                parts.append(arc[:-1])
+            ring = np.concatenate(parts)
+            out.append(np.vstack([ring, ring[:1]]))
+        return out
+
+
+def _douglas_peucker(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Keep-mask for `points`; endpoints are always kept."""
+    n = len(points)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    if n < 3 or tolerance <= 0:
+        keep[:] = True
+        return keep
+
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        a, b = points[first], points[last]
+        inner = points[first + 1:last]
+        ab = b - a
+        seg_len2 = float(ab @ ab)
+        if seg_len2 == 0.0:
+            # Closed arc: measure from the shared endpoint.
+            dist = np.hypot(inner[:, 0] - a[0], inner[:, 1] - a[1])
+        else:
+            dist = np.abs(ab[0] * (inner[:, 1] - a[1]) - ab[1] * (inner[:, 0] - a[0])) / np.sqrt(seg_len2)
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance or seg_len2 == 0.0:
+            split = first + 1 + i
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return keep
+
+
+# -------------------------------------------------------------------
+# SIMPLIFIED LAYERS
+# -------------------------------------------------------------------
+# 1e-6 degrees is ~0.1 m, well below the finest tolerance; rounding shared
+# vertices the same way on both sides keeps neighbouring outlines aligned.
+COORD_DECIMALS = 6
+# Simplified layers only carry the properties the maps key on.
+MAP_PROPERTIES = ("CampName", "CampName_1", "BlockLabel", "BlockName")
+
+_SOURCES = {"camp": camp_outline_store, "block": block_outline_store}
+
+
+@lru_cache(maxsize=None)
+def _topology(kind: str) -> ArcTopology:
+    return ArcTopology(_SOURCES[kind])
+
+
+@lru_cache(maxsize=None)
+def _simplified(kind: str, level: int) -> PackedOutlines:
+    source = _SOURCES[kind]
+    topo = _topology(kind)
+    arcs = [np.round(arc, COORD_DECIMALS) for arc in topo.simplify(tolerance_for_zoom(level))]
+    rings = [[] for _ in range(len(source))]
+    for (fi, _), ring in zip(topo.ring_index, topo.rings(arcs)):
+        rings[fi].append(ring)
+    properties = [{k: v for k, v in props.items() if k in MAP_PROPERTIES} for props in source.properties]
+    return PackedOutlines.from_rings(properties, rings)
+
+
+def outline_store(kind: str, level: int | None) -> PackedOutlines | None:
+    """Packed outlines for a level: the memory-mapped originals for None, else a simplified copy."""
+    if _SOURCES[kind] is None or level is None:
+        return _SOURCES[kind]
+    return _simplified(kind, level)
+
+
+@lru_cache(maxsize=None)
+def _simplified_collection(kind: str, level: int) -> dict:
+    return _simplified(kind, level).collection()
+
+
+def _outlines(kind: str, zoom: float | None) -> dict | None:
+    level = level_for_zoom(zoom)
+    if _SOURCES[kind] is None:
+        return None
+    if level is None:
+        # Full resolution is materialized per call rather than kept around.
+        return _SOURCES[kind].collection()
+    return _simplified_collection(kind, level)
+
+
+def camp_outlines(zoom: float | None = None) -> dict | None:
+    """Camp FeatureCollection simplified for `zoom` (full resolution when None)."""
+    return _outlines("camp", zoom)
+
+
+def block_outlines(zoom: float | None = None) -> dict | None:
+    """Block FeatureCollection simplified for `zoom` (full resolution when None)."""
+    return _outlines("block", zoom)
+
+
+# -------------------------------------------------------------------
+# KEYED INDEX
+# -------------------------------------------------------------------
+def _key(value) -> str:
+    return str(value or "").strip().upper()
+
+
+def camp_key_of(props: dict) -> str:
+    return _key(props.get("CampName_1") or props.get("CampName"))
+
+
+def block_keys_of(props: dict) -> set:
+    return {k for k in (_key(props.get("BlockLabel")), _key(props.get("BlockName"))) if k}
+
+
+def _ring_stats(ring: np.ndarray) -> tuple[float, float, float]:
+    """Signed shoelace area and centroid (lon, lat) of a closed ring."""
+    x, y = ring[:, 0], ring[:, 1]
+    cross = x[:-1] * y[1:] - x[1:] * y[:-1]
+    area = cross.sum() / 2
+    if area == 0:
+        return 0.0, float(x.mean()), float(y.mean())
+    cx = ((x[:-1] + x[1:]) * cross).sum() / (6 * area)
+    cy = ((y[:-1] + y[1:]) * cross).sum() / (6 * area)
+    return float(area), float(cx), float(cy)
+
+
+def ring_shape(rings: list[np.ndarray]) -> dict:
+    """
+    Bounding box, bbox centre and area-weighted centroid of a set of rings.
+
+    Outer rings and holes have opposite winding, so summing signed ring
+    areas subtracts holes from the centroid without classifying rings.
+    """
+    rings = [r for r in rings if len(r) >= 4]
+    if not rings:
+        return {}
+    pts = np.concatenate(rings)
+    min_lon, min_lat = pts.min(axis=0)
+    max_lon, max_lat = pts.max(axis=0)
+
+    stats = np.array([_ring_stats(r) for r in rings])
+    total = stats[:, 0].sum()
+    if total != 0:
+        c_lon = float((stats[:, 0] * stats[:, 1]).sum() / total)
+        c_lat = float((stats[:, 0] * stats[:, 2]).sum() / total)
+    else:
+        c_lon, c_lat = float(pts[:, 0].mean()), float(pts[:, 1].mean())
+
+    return {
+        "bbox": [float(min_lon), float(min_lat), float(max_lon), float(max_lat)],
+        "centre": {"lat": float(min_lat + max_lat) / 2, "lon": float(min_lon + max_lon) / 2},
+        "centroid": {"lat": c_lat, "lon": c_lon},
+    }
+
+
+def _group_features(outlines: PackedOutlines | None) -> tuple[dict, dict, dict]:
+    """Feature positions per camp key, per camp key (block layer) and per (camp, block) key."""
+    camps, camp_blocks, blocks = {}, {}, {}
+    if outlines is None:
+        return camps, camp_blocks, blocks
+    for i, props in enumerate(outlines.properties):
+        camp = camp_key_of(props)
+        if not camp:
+            continue
+        camps.setdefault(camp, []).append(i)
+        camp_blocks.setdefault(camp, []).append(i)
+        for block in block_keys_of(props):
+            blocks.setdefault((camp, block), []).append(i)
+    return camps, camp_blocks, blocks
+
+
+@lru_cache(maxsize=None)
+def _feature_groups() -> dict:
+    camps, _, _ = _group_features(camp_outline_store)
+    _, camp_blocks, blocks = _group_features(block_outline_store)
+    return {"camp": camps, "camp_blocks": camp_blocks, "block": blocks}
+
+
+@lru_cache(maxsize=None)
+def _shapes(kind: str) -> dict:
+    """Shape stats per key from the full-resolution rings; identical at every level."""
+    source = _SOURCES["camp" if kind == "camp" else "block"]
+    return {
+        key: ring_shape([r for i in idx for r in source.rings(i)])
+        for key, idx in _feature_groups()[kind].items()
+    }
+
+
+class GeometryIndex:
+    """
+    Camp and (camp, block) lookups over one simplification level.
+
+    Keys are normalized once here, so callbacks pass the dropdown values
+    as-is. An entry holds a FeatureCollection plus its bbox, centre and
+    centroid (from the full-resolution outlines, so the same at every
+    level). Collections are built from the packed arrays on first lookup.
+    """
+
+    def __init__(self, camps: PackedOutlines | None, blocks: PackedOutlines | None):
+        self._camps = camps
+        self._blocks = blocks
+        self._entries = {}
+
+    def _entry(self, kind: str, key) -> dict | None:
+        cache_key = (kind, key)
+        if cache_key in self._entries:
+            return self._entries[cache_key]
+        idx = _feature_groups()[kind].get(key)
+        outlines = self._camps if kind == "camp" else self._blocks
+        if idx is None or outlines is None:
+            return None
+        entry = {"collection": outlines.collection(idx)}
+        entry.update(_shapes(kind).get(key, {}))
+        self._entries[cache_key] = entry
+        return entry
+
+    def camp(self, camp) -> dict | None:
+        return self._entry("camp", _key(camp))
+
+    def block(self, camp, block) -> dict | None:
+        return self._entry("block", (_key(camp), _key(block)))
+
+    def blocks_in_camp(self, camp) -> dict | None:
+        """All block outlines of a camp as one FeatureCollection."""
+        entry = self._entry("camp_blocks", _key(camp))
+        return entry["collection"] if entry else None
+
+
+@lru_cache(maxsize=None)
+def geometry_index(level: int | None = None) -> GeometryIndex:
+    return GeometryIndex(outline_store("camp", level), outline_store("block", level))
+
+
+def index_for_zoom(zoom: float | None = None) -> GeometryIndex:
+    """Keyed outlines simplified for `zoom` (full resolution when None)."""
+    return geometry_index(level_for_zoom(zoom))
+
+
+def block_area_centroids() -> dict:
+    """Area-weighted centroid {"lat", "lon"} per (camp, block) key."""
+    return {key: shape["centroid"] for key, shape in _shapes("block").items() if shape}
+
+
+def vertex_count(outlines: PackedOutlines) -> int:
+    return len(outlines.coords)
+
+
+if __name__ == "__main__":
+    import json
+
+    for kind in _SOURCES:
+        for level in (None, *SIMPLIFY_ZOOMS):
+            outlines = outline_store(kind, level)
+            if outlines is None:
+                continue
+            label = "full" if level is None else f"z{level}"
+            collection = outlines.collection(properties=None if level is None else MAP_PROPERTIES)
+            size_kb = len(json.dumps(collection, separators=(",", ":"))) / 1024
+            print(f"{kind:6s} {label:5s} {vertex_count(outlines):7d} vertices {size_kb:8.1f} KB")
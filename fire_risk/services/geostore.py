@@ -0,0 +1,124 @@
+"""Packed, memory-mapped coordinate store for the camp and block outlines."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from fire_risk.services.artifacts import prune_versions
+
+GEOSTORE_DIR = Path(os.environ.get("FIRE_RISK_GEOSTORE_DIR", ".cache"))
+
+
+class PackedOutlines:
+    """
+    Polygon features as three flat arrays plus a property list.
+
+    `coords` is (n_vertices, 2) float64 lon/lat with every ring closed,
+    `ring_offsets[r]:ring_offsets[r + 1]` slices ring r out of it, and
+    `feature_offsets[f]:feature_offsets[f + 1]` lists the rings of feature f.
+    Loaded from disk the arrays are memory-mapped, so workers share the
+    pages; GeoJSON is only built for the features a caller asks for.
+    """
+
+    def __init__(self, coords, ring_offsets, feature_offsets, properties: list[dict]):
+        self.coords = coords
+        self.ring_offsets = ring_offsets
+        self.feature_offsets = feature_offsets
+        self.properties = properties
+
+    def __len__(self) -> int:
+        return len(self.properties)
+
+    @classmethod
+    def from_rings(cls, properties: list[dict], rings: list[list]) -> "PackedOutlines":
+        """Pack `rings[f]` (a list of closed rings per feature) into flat arrays."""
+        flat = [np.asarray(r, dtype=np.float64).reshape(-1, 2) for feat_rings in rings for r in feat_rings]
+        ring_sizes = [len(r) for r in flat]
+        coords = np.concatenate(flat) if flat else np.empty((0, 2), dtype=np.float64)
+        ring_offsets = np.concatenate([[0], np.cumsum(ring_sizes)]).astype(np.int64)
+        feature_offsets = np.concatenate([[0], np.cumsum([len(r) for r in rings])]).astype(np.int64)
+        return cls(coords, ring_offsets, feature_offsets, properties)
+
+    @classmethod
+    def from_esri_json(cls, path: Path) -> "PackedOutlines":
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        features = raw.get("features", [])
+        return cls.from_rings(
+            [feat.get("attributes", {}) for feat in features],
+            [feat.get("geometry", {}).get("rings", []) for feat in features],
+        )
+
+    def save(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "coords.npy", np.ascontiguousarray(self.coords))
+        np.save(directory / "ring_offsets.npy", self.ring_offsets)
+        np.save(directory / "feature_offsets.npy", self.feature_offsets)
+        with open(directory / "properties.json", "w", encoding="utf-8") as f:
+            json.dump(self.properties, f)
+
+    @classmethod
+    def load(cls, directory: Path) -> "PackedOutlines":
+        with open(directory / "properties.json", "r", encoding="utf-8") as f:
+            properties = json.load(f)
+        return cls(
+            np.load(directory / "coords.npy", mmap_mode="r"),
+            np.load(directory / "ring_offsets.npy", mmap_mode="r"),
+            np.load(directory / "feature_offsets.npy", mmap_mode="r"),
+            properties,
+        )
+
+    # ------ access ------
+    def ring_range(self, i: int) -> range:
+        return range(int(self.feature_offsets[i]), int(self.feature_offsets[i + 1]))
+
+    def rings(self, i: int) -> list[np.ndarray]:
+        """Closed rings of feature i as (n, 2) array views."""
+        offs = self.ring_offsets
+        return [self.coords[offs[r]:offs[r + 1]] for r in self.ring_range(i)]
+
+    def feature(self, i: int, properties: tuple | None = None) -> dict:
+        props = self.properties[i]
+        if properties is not None:
+            props = {k: v for k, v in props.items() if k in properties}
+        return {
+            "type": "Feature",
+            "properties": props,
+            "geometry": {"type": "Polygon", "coordinates": [r.tolist() for r in self.rings(i)]},
+        }
+
+    def collection(self, indices=None, properties: tuple | None = None) -> dict:
+        if indices is None:
+            indices = range(len(self))
+        return {"type": "FeatureCollection", "features": [self.feature(i, properties) for i in indices]}
+
+
+def load_outlines(source: Path, store_dir: Path = GEOSTORE_DIR) -> PackedOutlines | None:
+    """
+    Memory-mapped store for an Esri JSON outline file, packed on first use.
+    The store is keyed by the source file's content hash, so an updated
+    outline file is repacked automatically.
+    """
+    if not source.exists():
+        return None
+    version = hashlib.sha1(source.read_bytes()).hexdigest()[:12]
+    target = store_dir / f"{source.stem}_{version}"
+    if not (target / "properties.json").exists():
+        # Pack under a private name and rename, so concurrent workers never
+        # map a half-written store.
+        tmp = store_dir / f"{target.name}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        PackedOutlines.from_esri_json(source).save(tmp)
+        try:
+            os.replace(tmp, target)
+        except OSError:
+            # Another worker won the race; use its copy.
+            shutil.rmtree(tmp, ignore_errors=True)
+        prune_versions(target, rf"{re.escape(source.stem)}_[0-9a-f]{{12}}")
+    return PackedOutlines.load(target)
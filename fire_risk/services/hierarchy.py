@@ -0,0 +1,98 @@
+"""Camp and block tables aggregated once per assessments load."""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from fire_risk.legacy.fwi_fri import classify_fsi
+
+DIMENSIONS = ["Environment", "Fuel", "Behaviour", "Response"]
+POPULATION_COLUMN = "ENV_003a"
+
+
+def _aggregate(cleaned: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    """Dimension means, FSI, centroid, population and assessment date range per group."""
+    frame = cleaned[keys + DIMENSIONS + ["Latitude", "Longitude"]].assign(
+        population=(
+            pd.to_numeric(cleaned[POPULATION_COLUMN], errors="coerce").fillna(0)
+            if POPULATION_COLUMN in cleaned.columns else np.nan
+        ),
+        assessed=(
+            pd.to_datetime(cleaned["assessment_date"], errors="coerce")
+            if "assessment_date" in cleaned.columns else pd.NaT
+        ),
+    )
+    grouped = frame.groupby(keys, observed=True)
+    table = grouped[DIMENSIONS + ["Latitude", "Longitude"]].mean()
+    table["population"] = grouped["population"].sum(min_count=1)
+    table["assessment_start"] = grouped["assessed"].min()
+    table["assessment_end"] = grouped["assessed"].max()
+    table["rows"] = grouped.size()
+
+    table["FSI"] = (table["Environment"] + table["Fuel"] + table["Behaviour"] + table["Response"]) / 4
+    table["FSI_Score"] = [math.ceil(v) for v in table["FSI"]]
+    table["FSI_Class"] = table["FSI_Score"].map(classify_fsi)
+    table.index = (
+        pd.MultiIndex.from_arrays([table.index.get_level_values(k).astype(str) for k in keys], names=keys)
+        if len(keys) > 1 else table.index.astype(str).rename(keys[0])
+    )
+    return table
+
+
+def format_date_range(start, end) -> str:
+    if pd.isna(start) or pd.isna(end):
+        return "N/A"
+    start, end = start.date().isoformat(), end.date().isoformat()
+    return start if start == end else f"{start} to {end}"
+
+
+def format_population(population) -> str:
+    return "N/A" if pd.isna(population) else f"{population:,.0f}"
+
+
+class AssessmentHierarchy:
+    """
+    Immutable camp and block tables for one assessments frame.
+
+    `camps` is indexed by CampName and `blocks` by (CampName, Block), both
+    in the frame's category order. Each row holds the dimension means, the
+    unrounded FSI with its ceiled score and class, the mean coordinates,
+    summed site population and first/last assessment date. Built together
+    with each data snapshot, so callbacks look these up instead of
+    regrouping the survey rows. Treat the frames as read-only.
+    """
+
+    def __init__(self, cleaned: pd.DataFrame):
+        self.camps = _aggregate(cleaned, ["CampName"])
+        self.blocks = _aggregate(cleaned, ["CampName", "Block"])
+        self._camp_blocks = {
+            camp: tuple(sorted(blocks))
+            for camp, blocks in pd.Series(self.blocks.index.get_level_values("Block"))
+            .groupby(self.blocks.index.get_level_values("CampName"), sort=False)
+            .agg(list)
+            .items()
+        }
+
+    def camp_names(self) -> list[str]:
+        return sorted(self.camps.index)
+
+    def blocks_for_camp(self, camp: str) -> tuple[str, ...]:
+        return self._camp_blocks.get(camp, ())
+
+    def camp(self, camp: str) -> pd.Series | None:
+        if camp not in self.camps.index:
+            return None
+        return self.camps.loc[camp]
+
+    def block(self, camp: str, block: str) -> pd.Series | None:
+        if (camp, block) not in self.blocks.index:
+            return None
+        return self.blocks.loc[(camp, block)]
+
+    def camp_block_table(self, camp: str) -> pd.DataFrame:
+        """The camp's rows of `blocks` with Block as a column."""
+        if camp not in self._camp_blocks:
+            return self.blocks.iloc[:0].reset_index(level="CampName", drop=True).reset_index()
+        return self.blocks.xs(camp, level="CampName").reset_index()
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
@@ -7,25 +8,17 @@ DEFINITIONS_FILE = APP_BASE_DIR / "fire_indicator_definitions.csv"
 
 
 def load_indicator_definitions_df():
-    print("Looking for definitions file at:", DEFINITIONS_FILE)
-    print("File exists:", DEFINITIONS_FILE.exists())
-
     try:
         df = pd.read_csv(DEFINITIONS_FILE, encoding="utf-8")
     except UnicodeDecodeError:
         df = pd.read_csv(DEFINITIONS_FILE, encoding="latin1")
     except Exception as e:
-        print("ERROR reading definitions CSV:", repr(e))
+        print(f"[WARN] Could not read indicator definitions {DEFINITIONS_FILE}: {e!r}")
         return pd.DataFrame(
             columns=["code", "section", "parent_code", "question", "description", "rationale", "status"]
         )
 
-    print("Definitions CSV loaded successfully.")
-    print("Original columns:", list(df.columns))
-    print("Row count before cleaning:", len(df))
-
     df.columns = [str(c).strip().lower() for c in df.columns]
-    print("Normalized columns:", list(df.columns))
 
     expected = ["code", "section", "parent_code", "question", "description", "rationale", "status"]
     for col in expected:
@@ -37,13 +30,14 @@ def load_indicator_definitions_df():
 
     df = df[df["code"] != ""].copy()
 
-    print("Row count after keeping nonblank code:", len(df))
-    print("Sample codes:", df["code"].head(10).tolist())
-
     return df
 
 
-INDICATOR_DEFINITIONS_DF = load_indicator_definitions_df()
+@lru_cache(maxsize=1)
+def get_indicator_definitions():
+    """Definitions table, read when the definitions modal is first opened."""
+    return load_indicator_definitions_df()
+
 
 INDICATOR_GROUPS = {
     "ENV_001": ["ENV_001"],
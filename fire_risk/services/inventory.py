@@ -0,0 +1,188 @@
+"""Server-side paging, sorting and filtering for the equipment inventory table."""
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from fire_risk.legacy.data import DataSnapshot, current_data
+
+INVENTORY_COLUMNS = [
+    "Camp",
+    "Sub_block",
+    "Type_of facility",
+    "Overall status",
+    "Majhee_section",
+    "Landmark",
+    "Source_of water",
+    "Material",
+]
+# Columns with a value -> row positions index; equality filters on them never
+# scan the frame.
+INDEXED_COLUMNS = ["Camp", "Sub_block", "Overall status", "Type_of facility"]
+
+FILTER_OPERATORS = [
+    ["ge ", ">="],
+    ["le ", "<="],
+    ["lt ", "<"],
+    ["gt ", ">"],
+    ["ne ", "!="],
+    ["eq ", "="],
+    ["icontains "],
+    ["contains "],
+    ["datestartswith "],
+]
+
+
+def split_filter_part(filter_part: str):
+    """Parse one `{column} op value` clause of a DataTable filter_query."""
+    for operator_type in FILTER_OPERATORS:
+        for operator in operator_type:
+            if operator in filter_part:
+                name_part, value_part = filter_part.split(operator, 1)
+                name = name_part[name_part.find("{") + 1: name_part.rfind("}")]
+
+                value_part = value_part.strip()
+                v0 = value_part[:1]
+                if v0 and v0 == value_part[-1] and v0 in ("'", '"', "`"):
+                    value = value_part[1:-1].replace("\\" + v0, v0)
+                else:
+                    try:
+                        value = float(value_part)
+                    except ValueError:
+                        value = value_part
+
+                return name, operator_type[0].strip(), value
+    return [None] * 3
+
+
+def _text(value) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class EquipmentInventory:
+    """
+    Equipment rows with precomputed indexes for the inventory table.
+
+    For every column the dense rank of each row's value is computed once, so
+    sorting a filtered selection is a lexsort of small integer arrays,
+    and the camp, block, status and facility columns keep value -> row
+    position lookups for equality filters. Only the rows of the requested
+    page are ever materialised.
+    """
+
+    def __init__(self, equipment: pd.DataFrame, version: str):
+        self.version = version
+        self._frame = equipment[[c for c in INVENTORY_COLUMNS if c in equipment.columns]].reset_index(drop=True)
+        self._camp_key = equipment["camp_key"].astype(str).to_numpy()
+        self._block_key = equipment["block_key"].astype(str).to_numpy()
+        self._all_rows = np.arange(len(self._frame))
+
+        self._ranks = {}
+        for col in self._frame.columns:
+            values = self._frame[col]
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.astype("string")
+            codes, uniques = pd.factorize(values, sort=True)
+            self._ranks[col] = np.where(codes < 0, len(uniques), codes)
+
+        self._positions = {
+            col: {str(v): rows for v, rows in self._frame.groupby(col, observed=True).indices.items()}
+            for col in INDEXED_COLUMNS
+            if col in self._frame.columns
+        }
+        self._scopes = pd.DataFrame({"c": self._camp_key, "b": self._block_key}).groupby(["c", "b"]).indices
+        self._camp_scopes = pd.Series(self._camp_key).groupby(self._camp_key).indices
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._frame.columns)
+
+    def _scope_rows(self, camp: str | None, block: str | None) -> np.ndarray:
+        if camp is None:
+            return self._all_rows
+        camp_key = str(camp).strip().upper()
+        if block is None:
+            return self._camp_scopes.get(camp_key, self._all_rows[:0])
+        return self._scopes.get((camp_key, str(block).strip().upper()), self._all_rows[:0])
+
+    def _filter(self, rows: np.ndarray, filter_query: str) -> np.ndarray:
+        for part in (filter_query or "").split(" && "):
+            col, operator, value = split_filter_part(part)
+            if col not in self._ranks:
+                continue
+            text_value = _text(value)
+            if operator == "eq" and col in self._positions:
+                rows = np.intersect1d(rows, self._positions[col].get(text_value, rows[:0]), assume_unique=True)
+                continue
+
+            # Everything else is evaluated on the rows still in play only.
+            values = self._frame[col].take(rows)
+            text = values.astype(str)
+            if operator == "eq":
+                mask = text == text_value
+            elif operator == "ne":
+                mask = text != text_value
+            elif operator == "contains":
+                mask = text.str.contains(text_value, regex=False)
+            elif operator == "icontains":
+                mask = text.str.lower().str.contains(text_value.lower(), regex=False)
+            elif operator == "datestartswith":
+                mask = text.str.startswith(text_value)
+            elif isinstance(value, float):
+                numbers = pd.to_numeric(values, errors="coerce")
+                mask = {"lt": numbers.lt, "le": numbers.le, "gt": numbers.gt, "ge": numbers.ge}[operator](value)
+            else:
+                mask = pd.Series(False, index=values.index)
+            rows = rows[mask.to_numpy(dtype=bool) & values.notna().to_numpy()]
+        return rows
+
+    def _sort(self, rows: np.ndarray, sort_by: list | None) -> np.ndarray:
+        keys = []
+        for spec in reversed(sort_by or []):
+            ranks = self._ranks.get(spec.get("column_id"))
+            if ranks is not None:
+                keys.append(-ranks[rows] if spec.get("direction") == "desc" else ranks[rows])
+        # Rows that tie on every key keep their file order.
+        if not keys:
+            return rows
+        return rows[np.lexsort(keys)]
+
+    def page(
+        self,
+        camp: str | None = None,
+        block: str | None = None,
+        page_current: int = 0,
+        page_size: int = 15,
+        sort_by: list | None = None,
+        filter_query: str = "",
+    ) -> tuple[list[dict], int, int]:
+        """Rows of one table page, the page count and the number of matching rows."""
+        rows = self._sort(self._filter(self._scope_rows(camp, block), filter_query), sort_by)
+        total = len(rows)
+        page_count = max(1, -(-total // page_size))
+        start = page_current * page_size
+        page_rows = self._frame.take(rows[start:start + page_size])
+        records = page_rows.astype(object).where(page_rows.notna(), None).to_dict("records")
+        return records, page_count, total
+
+
+_inventory: EquipmentInventory | None = None
+_inventory_lock = threading.Lock()
+
+
+def get_equipment_inventory(snapshot: DataSnapshot | None = None) -> EquipmentInventory:
+    """Inventory indexes for the active equipment data, rebuilt after a reload."""
+    global _inventory
+    snapshot = snapshot or current_data()
+    inventory = _inventory
+    if inventory is not None and inventory.version == snapshot.equipment_version:
+        return inventory
+
+    with _inventory_lock:
+        if _inventory is None or _inventory.version != snapshot.equipment_version:
+            _inventory = EquipmentInventory(snapshot.equipment_df, snapshot.equipment_version)
+        return _inventory
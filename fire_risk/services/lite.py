@@ -0,0 +1,378 @@
+"""
+Low-bandwidth mode for field staff on slow mobile links.
+
+A page load opts in with `?lite=1` (and back out with `?lite=0`); the choice is
+kept in a cookie so the callback requests that follow carry it. Without
+either, the mode follows the browser's network hints (`Save-Data: on`, an
+`ECT` of 3g or slower, or a `Downlink` under 1 Mbps). `FIRE_RISK_LITE=1`/`0`
+forces it on or off for every request.
+
+In lite mode the page uses the bundled `assets/lite.css` instead of the
+Bootstrap and Font Awesome CDNs, maps are replaced by tables and text
+sparklines, the Windy embed is dropped, outlines use the coarsest
+simplification and numbers in figure JSON are rounded.
+
+Every response is counted against the page view it belongs to, and
+`GET /payloadz` reports the bytes per view (per worker) against
+`FIRE_RISK_PAYLOAD_BUDGET_KB`. `python -m fire_risk.services.lite` loads each
+page shell in both modes and prints the same report.
+"""
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import os
+import re
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+import numpy as np
+from dash import html
+from flask import has_request_context, jsonify, request
+
+from fire_risk.services.geometry import SIMPLIFY_ZOOMS
+
+LITE_MODE = os.environ.get("FIRE_RISK_LITE", "auto").strip().lower()
+LITE_PARAM = "lite"
+LITE_COOKIE = "fire_risk_lite"
+VIEW_COOKIE = "fire_risk_view"
+LITE_STYLESHEET = "lite.css"
+
+SLOW_CONNECTIONS = ("slow-2g", "2g", "3g")
+SLOW_DOWNLINK_MBPS = 1.0
+CLIENT_HINTS = "ECT, Downlink, Save-Data"
+
+# Outlines simplified for the widest zoom, whatever zoom the map is at.
+LITE_OUTLINE_ZOOM = SIMPLIFY_ZOOMS[0]
+FIGURE_DECIMALS = 1
+PAYLOAD_BUDGET_KB = float(os.environ.get("FIRE_RISK_PAYLOAD_BUDGET_KB", 600))
+MAX_TRACKED_VIEWS = 500
+
+SPARK_BARS = "▁▂▃▄▅▆▇█"
+_JSON_ROUTES = ("/_dash-update-component", "/_dash-layout")
+_BUNDLE_PREFIX = "/_dash-component-suites/"
+COMPRESSIBLE = ("text/html", "text/css", "application/json", "application/javascript", "text/javascript")
+MIN_COMPRESS_BYTES = 1024
+_CDN_STYLESHEET = re.compile(r'<link rel="stylesheet" href="https?://[^"]*">\s*')
+_EXTERNAL_URL = re.compile(r'(?:href|src)="https?://')
+
+
+def _choice(value) -> bool | None:
+    value = (value or "").strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("0", "false", "no", "off"):
+        return False
+    return None
+
+
+def slow_connection(headers) -> bool:
+    """True when the browser's network hints ask for less data."""
+    if headers.get("Save-Data", "").strip().lower() == "on":
+        return True
+    if headers.get("ECT", "").strip().lower() in SLOW_CONNECTIONS:
+        return True
+    try:
+        return float(headers.get("Downlink", "")) < SLOW_DOWNLINK_MBPS
+    except ValueError:
+        return False
+
+
+def is_lite() -> bool:
+    """Whether the current request is served in low-bandwidth mode."""
+    forced = _choice(LITE_MODE)
+    if forced is not None:
+        return forced
+    if not has_request_context():
+        return False
+    for value in (request.args.get(LITE_PARAM), request.cookies.get(LITE_COOKIE)):
+        choice = _choice(value)
+        if choice is not None:
+            return choice
+    return slow_connection(request.headers)
+
+
+# -------------------------------------------------------------------
+# FIGURE JSON
+# -------------------------------------------------------------------
+# Trace keys holding data values; everything else in a trace (geojson,
+# colorscale, hole, marker settings) is styling and must stay exact. Map
+# coordinates (lat/lon) are not rounded either: at FIGURE_DECIMALS a point
+# would move by up to ~11 km.
+FIGURE_DATA_KEYS = ("x", "y", "z", "values", "customdata")
+
+
+def _round_array(value, decimals: int):
+    if isinstance(value, dict) and "bdata" in value and "dtype" in value:
+        array = np.frombuffer(base64.b64decode(value["bdata"]), dtype=value["dtype"])
+        if "shape" in value:
+            array = array.reshape([int(n) for n in str(value["shape"]).split(",")])
+        if array.dtype.kind == "f":
+            array = np.round(array, decimals)
+        return array.tolist()
+    if isinstance(value, float):
+        return round(value, decimals)
+    if isinstance(value, list):
+        return [_round_array(v, decimals) for v in value]
+    return value
+
+
+def _round_trace(trace, decimals: int):
+    if not isinstance(trace, dict):
+        return trace
+    return {k: _round_array(v, decimals) if k in FIGURE_DATA_KEYS else v for k, v in trace.items()}
+
+
+def round_figures(value, decimals: int = FIGURE_DECIMALS):
+    """
+    Copy of a callback response or layout with the data arrays of every
+    figure trace (`FIGURE_DATA_KEYS`) rounded to `decimals`; typed arrays
+    (`bdata`) are decoded so they compress as short decimals. Trace styling
+    and the layout (map centres, axis ranges) are left alone.
+    """
+    if isinstance(value, dict):
+        if isinstance(value.get("data"), list) and isinstance(value.get("layout"), dict):
+            return {**value, "data": [_round_trace(trace, decimals) for trace in value["data"]]}
+        return {k: round_figures(v, decimals) for k, v in value.items()}
+    if isinstance(value, list):
+        return [round_figures(v, decimals) for v in value]
+    return value
+
+
+# -------------------------------------------------------------------
+# TABLES AND SPARKLINES
+# -------------------------------------------------------------------
+def sparkline(values) -> str:
+    """Unicode bar sparkline of `values` (blank for missing ones)."""
+    values = np.asarray(values, dtype=float)
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return ""
+    low, high = finite.min(), finite.max()
+    span = (high - low) or 1.0
+    return "".join(
+        " " if not np.isfinite(v) else SPARK_BARS[int((v - low) / span * (len(SPARK_BARS) - 1))]
+        for v in values
+    )
+
+
+def sparkline_row(label: str, values, unit: str = ""):
+    """One line: label, sparkline, then the first, lowest and highest values."""
+    values = [float(v) for v in values]
+    if not values:
+        return html.P(f"{label}: not available", className="text-muted small mb-1")
+    return html.P(
+        [
+            html.Span(f"{label} ", className="fw-semibold"),
+            html.Span(sparkline(values), className="sparkline"),
+            html.Span(
+                f" {values[0]:.0f}{unit} now, {min(values):.0f}–{max(values):.0f}{unit}",
+                className="text-muted",
+            ),
+        ],
+        className="small mb-1",
+    )
+
+
+def lite_table(df, columns: dict, highlight=None):
+    """Plain HTML table of `df[columns]` with headers `columns.values()`; rows where `highlight` is true are bold."""
+    highlight = np.zeros(len(df), dtype=bool) if highlight is None else np.asarray(highlight)
+    rows = [
+        html.Tr([html.Td(v) for v in values], className="fw-bold" if selected else None)
+        for values, selected in zip(df[list(columns)].itertuples(index=False), highlight)
+    ]
+    return html.Table(
+        [html.Thead(html.Tr([html.Th(name) for name in columns.values()])), html.Tbody(rows)],
+        className="lite-table",
+    )
+
+
+# -------------------------------------------------------------------
+# PAYLOAD PER PAGE VIEW
+# -------------------------------------------------------------------
+class PayloadMeter:
+    """Bytes sent per page view (view cookie + page path), most recent views kept."""
+
+    def __init__(self, budget_kb: float = PAYLOAD_BUDGET_KB, max_views: int = MAX_TRACKED_VIEWS):
+        self.budget_kb = budget_kb
+        self.max_views = max_views
+        self._views: OrderedDict[tuple[str, str], dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, view_id: str, path: str, nbytes: int, lite: bool, external: int = 0) -> None:
+        key = (view_id, path)
+        with self._lock:
+            view = self._views.get(key)
+            if view is None:
+                view = {"path": path, "lite": lite, "bytes": 0, "requests": 0, "external": 0, "started": time.time()}
+                self._views[key] = view
+                while len(self._views) > self.max_views:
+                    self._views.popitem(last=False)
+            over_before = view["bytes"] > self.budget_kb * 1024
+            view["bytes"] += nbytes
+            view["requests"] += 1
+            view["external"] += external
+            crossed = not over_before and view["bytes"] > self.budget_kb * 1024
+        if crossed:
+            mode = "lite" if view["lite"] else "full"
+            print(f"[WARN] Page view of {path} ({mode}) is over the {self.budget_kb:.0f} KB payload budget")
+
+    def report(self, recent: int = 20) -> dict:
+        with self._lock:
+            views = [dict(v) for v in self._views.values()]
+        modes = {}
+        for mode, lite in (("lite", True), ("full", False)):
+            kb = np.array([v["bytes"] / 1024 for v in views if v["lite"] == lite])
+            modes[mode] = {
+                "views": int(kb.size),
+                "median_kb": round(float(np.median(kb)), 1) if kb.size else None,
+                "p90_kb": round(float(np.percentile(kb, 90)), 1) if kb.size else None,
+                "max_kb": round(float(kb.max()), 1) if kb.size else None,
+                "over_budget": int((kb > self.budget_kb).sum()),
+            }
+        return {
+            "budget_kb": self.budget_kb,
+            "pid": os.getpid(),
+            "modes": modes,
+            "recent": [
+                {
+                    "path": v["path"],
+                    "mode": "lite" if v["lite"] else "full",
+                    "kb": round(v["bytes"] / 1024, 1),
+                    "requests": v["requests"],
+                    "external": v["external"],
+                    "started": time.strftime("%H:%M:%S", time.localtime(v["started"])),
+                }
+                for v in views[-recent:]
+            ] if recent else [],
+        }
+
+
+payload_meter = PayloadMeter()
+
+
+# -------------------------------------------------------------------
+# REGISTRATION
+# -------------------------------------------------------------------
+def register_lite_mode(app) -> None:
+    server = app.server
+    interpolate_index = app.interpolate_index
+
+    def lite_interpolate_index(**kwargs):
+        if is_lite():
+            stylesheet = f'<link rel="stylesheet" href="{app.get_asset_url(LITE_STYLESHEET)}">'
+            kwargs["css"] = stylesheet + "\n" + _CDN_STYLESHEET.sub("", kwargs["css"])
+        return interpolate_index(**kwargs)
+
+    app.interpolate_index = lite_interpolate_index
+
+    @server.after_request
+    def lite_response(response):
+        lite = is_lite()
+        if lite and request.path.endswith(_JSON_ROUTES) and response.mimetype == "application/json" and response.status_code == 200:
+            body = round_figures(json.loads(response.get_data()))
+            response.set_data(json.dumps(body, separators=(",", ":")))
+        if lite:
+            _compress(response)
+
+        choice = request.args.get(LITE_PARAM)
+        if _choice(choice) is not None:
+            response.set_cookie(LITE_COOKIE, "1" if _choice(choice) else "0", max_age=30 * 24 * 3600, samesite="Lax")
+
+        # Page loads count against their own path, everything else against the referring page.
+        view_id = request.cookies.get(VIEW_COOKIE)
+        page = urlsplit(request.referrer or "").path or request.path
+        external = 0
+        if response.mimetype == "text/html":
+            page = request.path
+            # A page load starts a new view; ask for network hints for the next one.
+            view_id = secrets.token_hex(8)
+            response.set_cookie(VIEW_COOKIE, view_id, samesite="Lax")
+            response.headers["Accept-CH"] = CLIENT_HINTS
+            response.vary.update(("Cookie", *CLIENT_HINTS.replace(" ", "").split(",")))
+            external = len(_EXTERNAL_URL.findall(_html_text(response)))
+        if view_id:
+            payload_meter.add(view_id, page, response.calculate_content_length() or 0, lite, external)
+        return response
+
+    @server.route("/payloadz")
+    def payloadz():
+        return jsonify(payload_meter.report())
+
+
+def _html_text(response) -> str:
+    if response.direct_passthrough:
+        return ""
+    data = response.get_data()
+    if response.content_encoding == "gzip":
+        data = gzip.decompress(data)
+    return data.decode("utf-8", errors="replace")
+
+
+@lru_cache(maxsize=64)
+def _gzip_bundle(path: str, body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def _compress(response) -> None:
+    """Gzip a text response in place when the browser accepts it."""
+    if (
+        response.direct_passthrough
+        or response.status_code != 200
+        or response.content_encoding
+        or response.mimetype not in COMPRESSIBLE
+        or "gzip" not in request.headers.get("Accept-Encoding", "")
+    ):
+        return
+    body = response.get_data()
+    if len(body) < MIN_COMPRESS_BYTES:
+        return
+    if request.path.startswith(_BUNDLE_PREFIX):
+        # Fingerprinted component bundles never change: compress each once.
+        data = _gzip_bundle(request.path, body)
+    else:
+        data = gzip.compress(body, mtime=0)
+    response.set_data(data)
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+
+
+if __name__ == "__main__":
+    from fire_risk.app import app
+
+    client = app.server.test_client()
+    resource = re.compile(r'<(?:script|link)[^>]*(?:src|href)="(/[^"]+)"')
+    budget = PAYLOAD_BUDGET_KB
+    print(
+        "Bytes on the wire to open each page (gzip accepted). 'data' is the page, layout and\n"
+        "callback graph, fetched on every view; 'static' is the scripts and stylesheets the\n"
+        "browser caches after the first visit. Callback responses come on top and are counted\n"
+        "per view at runtime (GET /payloadz).\n"
+    )
+    print(f"{'page':<12}{'mode':<6}{'data KB':>9}{'static KB':>11}{'first KB':>10}{'external':>10}  budget {budget:.0f} KB")
+    for page in ("/", "/overview", "/block", "/about"):
+        for lite in (False, True):
+            client.delete_cookie(LITE_COOKIE)
+            headers = {"Accept": "text/html", "Accept-Encoding": "gzip"}
+            index = client.get(page, query_string={LITE_PARAM: int(lite)}, headers=headers)
+            html_text = _html_text(index)
+            data_kb = static_kb = 0.0
+            data_kb += len(index.get_data()) / 1024
+            for url in ["/_dash-layout", "/_dash-dependencies", *resource.findall(html_text)]:
+                sub = client.get(url, headers={"Referer": f"http://localhost{page}", "Accept-Encoding": "gzip"})
+                size = len(sub.get_data()) / 1024
+                if url.startswith("/_dash-layout") or url.startswith("/_dash-dependencies"):
+                    data_kb += size
+                else:
+                    static_kb += size
+            first = data_kb + static_kb
+            status = "OK" if first <= budget else "OVER"
+            print(
+                f"{page:<12}{'lite' if lite else 'full':<6}{data_kb:>9.1f}{static_kb:>11.1f}{first:>10.1f}"
+                f"{len(_EXTERNAL_URL.findall(html_text)):>10}  {status}"
+            )
@@ -0,0 +1,65 @@
+"""Per-process memory reporting for the loaded data frames."""
+from __future__ import annotations
+
+import gc
+import os
+import resource
+
+import pandas as pd
+
+MEMORY_REPORT = os.environ.get("FIRE_RISK_MEMORY_REPORT", "0").strip().lower() in ("1", "true", "yes")
+
+
+def rss_bytes() -> int:
+    """Current resident set size of this process."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # No procfs (macOS): fall back to peak RSS, reported in bytes there.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def frame_stats(df: pd.DataFrame) -> dict:
+    return {
+        "rows": len(df),
+        "columns": len(df.columns),
+        "bytes": int(df.memory_usage(deep=True).sum()),
+    }
+
+
+def _mb(n: int) -> str:
+    if n < 1024 * 1024:
+        return f"{n / 1024:.0f} KB"
+    return f"{n / (1024 * 1024):.1f} MB"
+
+
+def log_rss(label: str) -> int:
+    rss = rss_bytes()
+    print(f"[INFO] pid={os.getpid()} RSS {label}: {_mb(rss)}")
+    return rss
+
+
+def report_compaction(before: dict, after: dict, rss_before: int) -> None:
+    """
+    Print frame sizes and process RSS before/after compaction. `before` and
+    `after` map frame names to `frame_stats` results.
+    """
+    gc.collect()
+    pid = os.getpid()
+    for name, old in before.items():
+        new = after[name]
+        print(
+            f"[INFO] pid={pid} {name}: {old['columns']} cols, {_mb(old['bytes'])} "
+            f"-> {new['columns']} cols, {_mb(new['bytes'])}"
+        )
+    print(f"[INFO] pid={pid} RSS before compaction {_mb(rss_before)}, after {_mb(rss_bytes())}")
+
+
+if __name__ == "__main__":
+    # data imports this module afresh, so the flag has to go through the env.
+    os.environ["FIRE_RISK_MEMORY_REPORT"] = "1"
+    from fire_risk.legacy import data  # noqa: F401  (import prints the report)
+
+    log_rss("after data load")
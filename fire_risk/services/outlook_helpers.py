@@ -1,47 +1,32 @@
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 from dash import html
 
 from fire_risk.legacy.fwi_fri import categorize_fri, categorize_fwi, compute_fri, get_monthly_fwi_xclim
+from fire_risk.services import figures
 
 MONTH_LABELS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
 
 
 def build_fire_risk_outlook_calendar(df_fc, value_col="FRI", risk_col="FRI_Risk", title="14-Day Fire Risk Outlook Calendar"):
     if df_fc.empty:
-        return go.Figure()
-
-    cal_df = df_fc.copy()
-    cal_df["DayLabel"] = cal_df["Date"]
-    cal_df["Row"] = ["Outlook"] * len(cal_df)
-
-    risk_score_map = {
-        "Low risk": 1,
-        "Moderate risk": 2,
-        "High risk": 3,
-        "Extreme risk": 4,
-        "Low fire danger": 1,
-        "Moderate fire danger": 2,
-        "High fire danger": 3,
-        "Severe fire danger": 4,
-    }
-
-    cal_df["RiskScore"] = cal_df[risk_col].map(risk_score_map).fillna(0)
-
-    fig = go.Figure(data=go.Heatmap(
-        z=[cal_df["RiskScore"].tolist()],
-        x=cal_df["DayLabel"].tolist(),
-        y=["Outlook"],
-        text=[[f"{row['Date']}<br>{value_col}: {row[value_col]}<br>{risk_col}: {row[risk_col]}" for _, row in cal_df.iterrows()]],
-        hoverinfo="text",
-        colorscale=[[0.00, "#22c55e"], [0.25, "#facc15"], [0.50, "#f97316"], [0.75, "#dc2626"], [1.00, "#7e22ce"]],
-        zmin=1,
-        zmax=4,
-        showscale=False,
-    ))
-    fig.update_layout(title=title, height=180, margin=dict(l=20, r=20, t=50, b=20), xaxis=dict(title="", side="top"), yaxis=dict(title="", showticklabels=False), plot_bgcolor="white", paper_bgcolor="white")
-    return fig
+        return figures.empty()
+
+    hover_text = (
+        df_fc["Date"].astype(str)
+        + f"<br>{value_col}: " + df_fc[value_col].astype(str)
+        + f"<br>{risk_col}: " + df_fc[risk_col].astype(str)
+    )
+    return figures.risk_strip(
+        df_fc["Date"],
+        df_fc[risk_col],
+        hover_text,
+        row_label="Outlook",
+        title=title,
+        height=180,
+        margin_t=50,
+        show_row_label=False,
+    )
 
 
 def build_monthly_outlook_df(lat, lon, base_fsi, year=2026):
@@ -56,34 +41,23 @@ def build_monthly_outlook_df(lat, lon, base_fsi, year=2026):
 
 def build_monthly_outlook_heatmap(df_monthly, value_col, risk_col, title):
     if df_monthly.empty:
-        return go.Figure()
-
-    risk_score_map = {
-        "Low risk": 1,
-        "Moderate risk": 2,
-        "High risk": 3,
-        "Extreme risk": 4,
-        "Low fire danger": 1,
-        "Moderate fire danger": 2,
-        "High fire danger": 3,
-        "Severe fire danger": 4,
-    }
-
-    z_vals = [df_monthly[risk_col].map(risk_score_map).fillna(0).tolist()]
-    text_vals = [[f"{row['Month']} {value_col}: {row[value_col]}<br>{risk_col}: {row[risk_col]}" for _, row in df_monthly.iterrows()]]
-    fig = go.Figure(data=go.Heatmap(
-        z=z_vals,
-        x=df_monthly["Month"].tolist(),
-        y=[value_col],
-        text=text_vals,
-        hoverinfo="text",
-        colorscale=[[0.00, "#22c55e"], [0.25, "#facc15"], [0.50, "#f97316"], [0.75, "#dc2626"], [1.00, "#7e22ce"]],
-        zmin=1,
-        zmax=4,
-        showscale=False,
-    ))
-    fig.update_layout(title=title, height=170, margin=dict(l=20, r=20, t=45, b=20), xaxis=dict(title="", side="top"), yaxis=dict(title="", showticklabels=True), plot_bgcolor="white", paper_bgcolor="white")
-    return fig
+        return figures.empty()
+
+    hover_text = (
+        df_monthly["Month"].astype(str)
+        + f" {value_col}: " + df_monthly[value_col].astype(str)
+        + f"<br>{risk_col}: " + df_monthly[risk_col].astype(str)
+    )
+    return figures.risk_strip(
+        df_monthly["Month"],
+        df_monthly[risk_col],
+        hover_text,
+        row_label=value_col,
+        title=title,
+        height=170,
+        margin_t=45,
+        show_row_label=True,
+    )
 
 
 def build_monthly_outlook_narrative(block_name, df_monthly, year=2026):
@@ -0,0 +1,48 @@
+"""Overview page figures; the clientside filter fills in the per-camp values."""
+from __future__ import annotations
+
+from fire_risk.services import figures
+from fire_risk.services.tiles import outline_geojson_url
+
+# The camp extent fills the overview figure at roughly this web-map zoom.
+OVERVIEW_MAP_ZOOM = 12
+
+SEVERITY_ORDER = ["Extreme risk", "High risk", "Moderate risk", "Low risk"]
+SEVERITY_COLORS = {
+    "Extreme risk": "#b91c1c",
+    "High risk": "#ea580c",
+    "Moderate risk": "#facc15",
+    "Low risk": "#22c55e",
+}
+
+
+def build_overview_map():
+    # The outlines are fetched once from a cached URL and the values are set
+    # in the browser, so the figure only carries styling.
+    return figures.choropleth(
+        outline_geojson_url("camps", OVERVIEW_MAP_ZOOM),
+        [],
+        [],
+        featureidkey="properties.CampName",
+        range_color=(0, 100),
+        colorscale="OrRd",
+        colorbar_title="FRI",
+        customdata=[],
+        hovertext=[],
+        hovertemplate="<b>%{hovertext}</b><br><br>FSI=%{customdata[0]}<br>FWI=%{customdata[1]}<br>FRI=%{z}<extra></extra>",
+        trace={"marker": {"line": {"color": "black", "width": 0.5}}},
+        layout={"margin": {"t": 10, "b": 0, "l": 0, "r": 0}, "annotations": []},
+    )
+
+
+def build_severity_donut():
+    return figures.donut(
+        SEVERITY_ORDER,
+        [0] * len(SEVERITY_ORDER),
+        hole=0.55,
+        colors=SEVERITY_COLORS,
+        name_label="Severity",
+        value_label="Count",
+        trace={"textposition": "inside", "textinfo": "percent+label"},
+        layout={"margin": {"t": 0, "b": 0, "l": 0, "r": 0}, "showlegend": False, "annotations": []},
+    )
@@ -0,0 +1,106 @@
+"""Background watcher that hot-reloads survey and equipment files."""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+from fire_risk.legacy import data
+from fire_risk.services.aggregates import get_equipment_aggregates
+from fire_risk.services.spatial import get_coverage_index
+
+DEFAULT_RELOAD_INTERVAL = 30
+
+
+def _file_state(path: Path):
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class DataFileWatcher(threading.Thread):
+    """
+    Poll the assessment and equipment CSVs and reload them when they change.
+
+    A change is only acted on once the file has looked the same for two
+    consecutive polls, so a survey export that is still being copied in is
+    not picked up half-written.
+    """
+
+    def __init__(self, interval: float = DEFAULT_RELOAD_INTERVAL):
+        super().__init__(name="fire-risk-data-watcher", daemon=True)
+        self.interval = interval
+        self.files = {
+            "assessments": data.ASSESSMENT_FILE,
+            "equipment": data.EQUIPMENT_FILE,
+        }
+        self._loaded = {name: _file_state(path) for name, path in self.files.items()}
+        self._pending = {}
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def poll(self) -> dict | None:
+        ready = {}
+        for name, path in self.files.items():
+            state = _file_state(path)
+            if state is None or state == self._loaded[name]:
+                self._pending.pop(name, None)
+                continue
+            if self._pending.get(name) == state:
+                ready[name] = state
+            else:
+                self._pending[name] = state
+
+        if not ready:
+            return None
+
+        started = time.perf_counter()
+        try:
+            changes = data.reload_data(
+                assessments="assessments" in ready,
+                equipment="equipment" in ready,
+            )
+        except Exception as e:
+            print(f"[WARN] Data reload failed, keeping previous data: {repr(e)}")
+            return None
+
+        if changes["equipment_blocks"]:
+            get_equipment_aggregates()
+            get_equipment_aggregates(by="location")
+            get_coverage_index()
+
+        for name, state in ready.items():
+            self._loaded[name] = state
+            self._pending.pop(name, None)
+
+        print(
+            f"[INFO] Reloaded {', '.join(sorted(ready))} in {time.perf_counter() - started:.2f}s "
+            f"({len(changes['blocks'])} assessment block(s), "
+            f"{len(changes['equipment_blocks'])} equipment block(s) changed)"
+        )
+        return changes
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.poll()
+
+
+_watcher: DataFileWatcher | None = None
+
+
+def start_data_watcher(interval: float | None = None) -> DataFileWatcher | None:
+    """Start the shared watcher; FIRE_RISK_RELOAD_INTERVAL=0 disables it."""
+    global _watcher
+    if interval is None:
+        interval = float(os.environ.get("FIRE_RISK_RELOAD_INTERVAL", DEFAULT_RELOAD_INTERVAL))
+    if interval <= 0:
+        return None
+    if _watcher is None or not _watcher.is_alive():
+        _watcher = DataFileWatcher(interval=interval)
+        _watcher.start()
+    return _watcher
@@ -0,0 +1,225 @@
+"""Camp/block-indexed access to assessments, AOR, equipment and contacts."""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+from fire_risk.legacy.data import DataSnapshot, aor_data, current_data, response_details
+from fire_risk.services.artifacts import prune_versions
+
+DATA_BACKEND = os.environ.get("FIRE_RISK_DATA_BACKEND", "memory").strip().lower()
+DB_DIR = Path(os.environ.get("FIRE_RISK_DATA_DB_DIR", ".cache"))
+# Part of the database file name; bump when the stored column types change
+# so databases written by an older build are not reused.
+DB_SCHEMA = 2
+
+_TABLE_INDEXES = {
+    "assessments": [["CampName", "Block"]],
+    "aor": [["CampName"]],
+    "equipment": [["camp_key", "block_key"]],
+    "contacts": [["CampName"]],
+}
+
+
+def _key(value) -> str:
+    return str(value).strip().upper()
+
+
+@lru_cache(maxsize=None)
+def load_duckdb():
+    # Optional, and only needed by the duckdb backend: importing it with
+    # the module would cost every start-up, whichever backend is active.
+    try:
+        import duckdb
+    except ImportError as e:
+        raise RuntimeError("FIRE_RISK_DATA_BACKEND=duckdb requires the 'duckdb' package.") from e
+    return duckdb
+
+
+class FrameRepository:
+    """
+    In-memory repository. Row positions are grouped once per snapshot, so a
+    camp or block lookup is a dict hit plus a `take` of the matching rows
+    instead of a boolean mask over the whole frame.
+    """
+
+    def __init__(self, snapshot: DataSnapshot):
+        self.version = snapshot.version
+        self._assessments = snapshot.cleaned_data.reset_index(drop=True)
+        self._equipment = snapshot.equipment_df.reset_index(drop=True)
+        self._aor = aor_data
+        self._contacts = response_details
+
+        self._camp_rows = self._assessments.groupby("CampName", sort=False, observed=True).indices
+        self._block_rows = self._assessments.groupby(["CampName", "Block"], sort=False, observed=True).indices
+        self._equipment_camp_rows = self._equipment.groupby("camp_key", sort=False, observed=True).indices
+        self._equipment_block_rows = self._equipment.groupby(["camp_key", "block_key"], sort=False, observed=True).indices
+
+    def camp_names(self) -> list[str]:
+        return sorted(self._camp_rows)
+
+    def blocks_for_camp(self, camp: str) -> list[str]:
+        return sorted({str(b) for c, b in self._block_rows if c == camp})
+
+    def assessments(self, camp: str, block: str | None = None) -> pd.DataFrame:
+        if block is None:
+            rows = self._camp_rows.get(camp, [])
+        else:
+            rows = self._block_rows.get((camp, block), [])
+        return self._assessments.take(rows)
+
+    def equipment(self, camp: str | None = None, block: str | None = None) -> pd.DataFrame:
+        if camp is None:
+            if block is None:
+                # Shallow copy: a caller adding a column does not add it to
+                # the shared frame, and no data is duplicated.
+                return self._equipment.copy(deep=False)
+            return self._equipment[self._equipment["block_key"] == _key(block)]
+        if block is None:
+            rows = self._equipment_camp_rows.get(_key(camp), [])
+        else:
+            rows = self._equipment_block_rows.get((_key(camp), _key(block)), [])
+        return self._equipment.take(rows)
+
+    def aor(self, camp: str) -> pd.DataFrame:
+        return self._aor[self._aor["CampName"] == camp]
+
+    def contact(self, camp: str) -> pd.DataFrame:
+        return self._contacts[self._contacts["CampName"] == camp]
+
+
+class SQLRepository:
+    """
+    SQLite/DuckDB-backed repository with the same interface as
+    FrameRepository. The database is written once per data version to a file
+    shared by all workers, and every lookup is an indexed query returning
+    only the requested slice.
+
+    This replaces the per-snapshot row-position index, not the snapshot: the
+    full frames stay in memory in every worker, because the hierarchy, the
+    equipment aggregates, inventory, spatial join and coverage index are
+    built from them. Each query opens its own connection.
+    """
+
+    def __init__(self, snapshot: DataSnapshot, backend: str = "sqlite", db_dir: Path = DB_DIR):
+        if backend == "duckdb":
+            load_duckdb()
+        self.backend = backend
+        self.version = snapshot.version
+        suffix = "duckdb" if backend == "duckdb" else "sqlite"
+        db_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_dir / f"fire_risk_data_v{DB_SCHEMA}_{snapshot.version}.{suffix}"
+        if not self.db_path.exists():
+            self._build(snapshot)
+
+    def _connect(self, read_only: bool = True):
+        if self.backend == "duckdb":
+            return load_duckdb().connect(str(self.db_path), read_only=read_only)
+        return sqlite3.connect(self.db_path)
+
+    def _build(self, snapshot: DataSnapshot) -> None:
+        tables = {
+            "assessments": snapshot.cleaned_data,
+            "aor": aor_data,
+            "equipment": snapshot.equipment_df,
+            "contacts": response_details,
+        }
+        # Build under a private name and rename, so concurrent workers never
+        # open a half-written database.
+        tmp_path = self.db_path.with_name(f"{self.db_path.name}.{os.getpid()}.tmp")
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+        if self.backend == "duckdb":
+            con = load_duckdb().connect(str(tmp_path))
+            for name, frame in tables.items():
+                con.register("_frame", frame)
+                con.execute(f'CREATE TABLE {name} AS SELECT * FROM _frame')
+                con.unregister("_frame")
+        else:
+            con = sqlite3.connect(tmp_path)
+            for name, frame in tables.items():
+                frame.to_sql(name, con, index=False)
+
+        for name, index_sets in _TABLE_INDEXES.items():
+            for cols in index_sets:
+                quoted = ", ".join(f'"{c}"' for c in cols)
+                con.execute(f'CREATE INDEX idx_{name}_{"_".join(cols)} ON {name}({quoted})')
+        if self.backend != "duckdb":
+            con.commit()
+        con.close()
+        os.replace(tmp_path, self.db_path)
+
+    def _query(self, sql: str, params: tuple = ()) -> pd.DataFrame:
+        con = self._connect()
+        try:
+            if self.backend == "duckdb":
+                return con.execute(sql, list(params)).df()
+            return pd.read_sql_query(sql, con, params=params)
+        finally:
+            con.close()
+
+    def _rows(self, table: str, where: str = "", params: tuple = ()) -> pd.DataFrame:
+        # In file order, like the in-memory backend: an index lookup alone
+        # returns them in index order, and callers take the first row.
+        return self._query(f"SELECT * FROM {table}{where} ORDER BY rowid", params)
+
+    def camp_names(self) -> list[str]:
+        return self._query('SELECT DISTINCT "CampName" FROM assessments ORDER BY "CampName"')["CampName"].tolist()
+
+    def blocks_for_camp(self, camp: str) -> list[str]:
+        df = self._query('SELECT DISTINCT "Block" FROM assessments WHERE "CampName" = ?', (camp,))
+        return sorted(df["Block"].dropna().astype(str).unique())
+
+    def assessments(self, camp: str, block: str | None = None) -> pd.DataFrame:
+        if block is None:
+            return self._rows("assessments", ' WHERE "CampName" = ?', (camp,))
+        return self._rows("assessments", ' WHERE "CampName" = ? AND "Block" = ?', (camp, block))
+
+    def equipment(self, camp: str | None = None, block: str | None = None) -> pd.DataFrame:
+        clauses, params = [], []
+        if camp is not None:
+            clauses.append('"camp_key" = ?')
+            params.append(_key(camp))
+        if block is not None:
+            clauses.append('"block_key" = ?')
+            params.append(_key(block))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._rows("equipment", where, tuple(params))
+
+    def aor(self, camp: str) -> pd.DataFrame:
+        return self._rows("aor", ' WHERE "CampName" = ?', (camp,))
+
+    def contact(self, camp: str) -> pd.DataFrame:
+        return self._rows("contacts", ' WHERE "CampName" = ?', (camp,))
+
+
+_repository = None
+_repository_lock = threading.Lock()
+
+
+def get_repository():
+    """
+    Repository for the active data snapshot, selected by
+    FIRE_RISK_DATA_BACKEND (memory, sqlite or duckdb). Rebuilt lazily after a
+    data reload changes the snapshot version.
+    """
+    global _repository
+    snapshot = current_data()
+    repo = _repository
+    if repo is not None and repo.version == snapshot.version:
+        return repo
+
+    with _repository_lock:
+        if _repository is None or _repository.version != snapshot.version:
+            if DATA_BACKEND in ("sqlite", "duckdb"):
+                _repository = SQLRepository(snapshot, backend=DATA_BACKEND)
+                prune_versions(_repository.db_path, rf"fire_risk_data_.+\.{DATA_BACKEND}")
+            else:
+                _repository = FrameRepository(snapshot)
+        return _repository
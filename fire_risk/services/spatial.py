@@ -0,0 +1,173 @@
+"""Grid spatial index over equipment points and per-block response coverage."""
+from __future__ import annotations
+
+import math
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from fire_risk.legacy.data import DataSnapshot, current_data
+from fire_risk.services.geometry import block_area_centroids
+
+COVERAGE_RADIUS_M = float(os.environ.get("FIRE_RISK_COVERAGE_RADIUS_M", 100))
+METRES_PER_DEG_LAT = 110_574.0
+METRES_PER_DEG_LON_EQUATOR = 111_320.0
+
+
+class GridIndex:
+    """
+    Uniform grid over points projected to local metres.
+
+    Points are bucketed into square cells of `cell_m`; a radius query only
+    looks at the cells the circle overlaps, and a nearest-neighbour query
+    searches rings of cells outwards until no unvisited cell can hold a
+    closer point. The camps span a few kilometres, so an equirectangular
+    projection around the mean latitude is accurate to well under a metre.
+    """
+
+    def __init__(self, lat, lon, cell_m: float = COVERAGE_RADIUS_M):
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        self.cell_m = float(cell_m)
+        self._lat0 = float(lat.mean()) if len(lat) else 0.0
+        self._lon0 = float(lon.mean()) if len(lon) else 0.0
+        self._lon_scale = METRES_PER_DEG_LON_EQUATOR * math.cos(math.radians(self._lat0))
+        self.xy = self._project(lat, lon)
+
+        cells = np.floor(self.xy / self.cell_m).astype(np.int64)
+        self._cells = {}
+        if len(cells):
+            order = np.lexsort((cells[:, 1], cells[:, 0]))
+            keys, starts = np.unique(cells[order], axis=0, return_index=True)
+            for (cx, cy), rows in zip(keys.tolist(), np.split(order, starts[1:])):
+                self._cells[(cx, cy)] = rows
+            self._extent = int(np.abs(cells).max()) + 1
+        else:
+            self._extent = 0
+
+    def __len__(self) -> int:
+        return len(self.xy)
+
+    def _project(self, lat, lon) -> np.ndarray:
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        return np.column_stack([
+            (lon - self._lon0) * self._lon_scale,
+            (lat - self._lat0) * METRES_PER_DEG_LAT,
+        ])
+
+    def _cell_of(self, lat: float, lon: float) -> tuple[np.ndarray, int, int]:
+        point = self._project([lat], [lon])[0]
+        cx, cy = np.floor(point / self.cell_m).astype(np.int64)
+        return point, int(cx), int(cy)
+
+    def _candidates(self, cells) -> np.ndarray:
+        found = [self._cells[c] for c in cells if c in self._cells]
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+    def within(self, lat: float, lon: float, radius_m: float) -> np.ndarray:
+        """Positions of the points within `radius_m` of (lat, lon)."""
+        point, cx, cy = self._cell_of(lat, lon)
+        reach = int(math.ceil(radius_m / self.cell_m))
+        rows = self._candidates(
+            (x, y) for x in range(cx - reach, cx + reach + 1) for y in range(cy - reach, cy + reach + 1)
+        )
+        dist = np.hypot(*(self.xy[rows] - point).T)
+        return rows[dist <= radius_m]
+
+    def nearest(self, lat: float, lon: float) -> tuple[int | None, float]:
+        """Position of and distance in metres to the closest point."""
+        if not len(self):
+            return None, math.inf
+        point, cx, cy = self._cell_of(lat, lon)
+        best, best_dist = None, math.inf
+        max_ring = self._extent + max(abs(cx), abs(cy))
+        for ring in range(max_ring + 1):
+            # Every point outside rings 0..ring-1 is at least (ring - 1) cells away.
+            if best_dist <= (ring - 1) * self.cell_m:
+                break
+            if ring == 0:
+                cells = [(cx, cy)]
+            else:
+                cells = [(x, y) for x in range(cx - ring, cx + ring + 1) for y in (cy - ring, cy + ring)]
+                cells += [(x, y) for x in (cx - ring, cx + ring) for y in range(cy - ring + 1, cy + ring)]
+            rows = self._candidates(cells)
+            if len(rows):
+                dist = np.hypot(*(self.xy[rows] - point).T)
+                i = int(dist.argmin())
+                if dist[i] < best_dist:
+                    best, best_dist = int(rows[i]), float(dist[i])
+        return best, best_dist
+
+
+class CoverageIndex:
+    """
+    Functional equipment indexed for nearest/radius queries, with response
+    coverage precomputed for every block outline: distance from the block
+    centroid to the nearest functional fire point and the number of
+    functional points within COVERAGE_RADIUS_M.
+    """
+
+    def __init__(self, equipment: pd.DataFrame, version: str, radius_m: float = COVERAGE_RADIUS_M):
+        self.version = version
+        self.radius_m = radius_m
+        functional = equipment[(equipment["status_group"] == "Functional").to_numpy()]
+        functional = functional.dropna(subset=["_LATITUDE", "_LONGITUDE"])
+        self._ids = functional["_ID"].to_numpy()
+        self.grid = GridIndex(functional["_LATITUDE"].to_numpy(), functional["_LONGITUDE"].to_numpy(), radius_m)
+
+        self._blocks = {}
+        for key, centroid in block_area_centroids().items():
+            self._blocks[key] = self.coverage_at(centroid["lat"], centroid["lon"])
+
+    def coverage_at(self, lat: float, lon: float) -> dict:
+        _, nearest_m = self.grid.nearest(lat, lon)
+        return {
+            "nearest_m": None if math.isinf(nearest_m) else round(nearest_m, 1),
+            "within_radius": int(len(self.grid.within(lat, lon, self.radius_m))),
+            "radius_m": self.radius_m,
+        }
+
+    def nearest_id(self, lat: float, lon: float):
+        """`_ID` of the closest functional point, or None."""
+        pos, _ = self.grid.nearest(lat, lon)
+        return None if pos is None else self._ids[pos].item()
+
+    def block(self, camp, block) -> dict | None:
+        """Precomputed coverage for a block outline (None if it has no outline)."""
+        return self._blocks.get((str(camp or "").strip().upper(), str(block or "").strip().upper()))
+
+    def frame(self) -> pd.DataFrame:
+        """All blocks' coverage as a frame indexed by (camp_key, block_key)."""
+        frame = pd.DataFrame.from_dict(self._blocks, orient="index")
+        frame.index = pd.MultiIndex.from_tuples(frame.index, names=["camp_key", "block_key"])
+        return frame
+
+
+_coverage: CoverageIndex | None = None
+_coverage_lock = threading.Lock()
+
+
+def get_coverage_index(snapshot: DataSnapshot | None = None) -> CoverageIndex:
+    """Coverage for the active equipment data; rebuilt after a reload."""
+    global _coverage
+    snapshot = snapshot or current_data()
+    coverage = _coverage
+    if coverage is not None and coverage.version == snapshot.equipment_version:
+        return coverage
+
+    with _coverage_lock:
+        if _coverage is None or _coverage.version != snapshot.equipment_version:
+            _coverage = CoverageIndex(snapshot.equipment_df, snapshot.equipment_version)
+        return _coverage
+
+
+def format_coverage(coverage: dict | None) -> str:
+    if not coverage or coverage["nearest_m"] is None:
+        return "N/A"
+    return (
+        f"nearest functional point {coverage['nearest_m']:,.0f} m, "
+        f"{coverage['within_radius']} within {coverage['radius_m']:,.0f} m"
+    )
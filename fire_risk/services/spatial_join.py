@@ -0,0 +1,155 @@
+"""Point-in-polygon join of equipment points to the block outlines."""
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from fire_risk.legacy.data import DataSnapshot, block_outline_store, current_data
+from fire_risk.services.geometry import camp_key_of
+from fire_risk.services.geostore import PackedOutlines
+
+# Location check per equipment row.
+MATCH = "match"              # inside the outline of its recorded camp/block
+MISMATCH = "mismatch"        # inside another block's outline
+OUTSIDE = "outside"          # not inside any block outline
+NO_LOCATION = "no_location"  # missing coordinates
+
+
+def points_in_rings(px: np.ndarray, py: np.ndarray, rings: list[np.ndarray]) -> np.ndarray:
+    """
+    Even-odd ray casting of many points against a polygon's closed rings.
+
+    Every (point, edge) pair is tested at once; holes need no special
+    handling because a point inside a hole crosses an even number of edges.
+    """
+    edges = np.concatenate([np.column_stack([r[:-1], r[1:]]) for r in rings])
+    x1, y1, x2, y2 = (edges[:, i][None, :] for i in range(4))
+    py_ = py[:, None]
+    spans = (y1 > py_) != (y2 > py_)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = x1 + (py_ - y1) * (x2 - x1) / (y2 - y1)
+    crossings = spans & (px[:, None] < x_cross)
+    return (crossings.sum(axis=1) % 2).astype(bool)
+
+
+class EquipmentBlockJoin:
+    """
+    Block outline each equipment point actually falls in.
+
+    Each outline first takes the points inside its bounding box, and only
+    those are ray-cast against its rings, so the full join is a few
+    thousand small array operations. `camp_key`/`block_key` hold the
+    location-based keys ("" outside every outline) aligned with the rows of
+    the equipment frame, and `status` compares them with the recorded
+    Camp/Sub_block text.
+    """
+
+    def __init__(self, equipment: pd.DataFrame, version: str, outlines: PackedOutlines | None = None):
+        started = time.perf_counter()
+        self.version = version
+        outlines = block_outline_store if outlines is None else outlines
+        n = len(equipment)
+        lat = equipment["_LATITUDE"].to_numpy(dtype=np.float64)
+        lon = equipment["_LONGITUDE"].to_numpy(dtype=np.float64)
+        located = ~(np.isnan(lat) | np.isnan(lon))
+
+        feature_of = np.full(n, -1, dtype=np.int64)
+        if outlines is not None:
+            for i in range(len(outlines)):
+                rings = [r for r in outlines.rings(i) if len(r) >= 4]
+                if not rings:
+                    continue
+                pts = np.concatenate(rings)
+                (min_lon, min_lat), (max_lon, max_lat) = pts.min(axis=0), pts.max(axis=0)
+                candidates = np.flatnonzero(
+                    located & (feature_of < 0)
+                    & (lon >= min_lon) & (lon <= max_lon) & (lat >= min_lat) & (lat <= max_lat)
+                )
+                if len(candidates):
+                    inside = points_in_rings(lon[candidates], lat[candidates], rings)
+                    feature_of[candidates[inside]] = i
+
+        camp_keys = np.array([camp_key_of(p) for p in outlines.properties] if outlines else [], dtype=object)
+        block_keys = np.array(
+            [str(p.get("BlockLabel") or "").strip().upper() for p in outlines.properties] if outlines else [],
+            dtype=object,
+        )
+        found = feature_of >= 0
+        self.camp_key = np.full(n, "", dtype=object)
+        self.block_key = np.full(n, "", dtype=object)
+        self.camp_key[found] = camp_keys[feature_of[found]]
+        self.block_key[found] = block_keys[feature_of[found]]
+
+        recorded_camp = equipment["camp_key"].astype(str).to_numpy(dtype=object)
+        recorded_block = equipment["block_key"].astype(str).to_numpy(dtype=object)
+        agrees = (self.camp_key == recorded_camp) & (self.block_key == recorded_block)
+        self.status = np.select(
+            [~located, ~found, agrees],
+            [NO_LOCATION, OUTSIDE, MATCH],
+            default=MISMATCH,
+        ).astype(object)
+        self._recorded = pd.DataFrame({"camp_key": recorded_camp, "block_key": recorded_block})
+
+        positions = np.flatnonzero(found)
+        keys = pd.DataFrame({"camp_key": self.camp_key[found], "block_key": self.block_key[found]})
+        self._camp_rows = {k: positions[v] for k, v in keys.groupby("camp_key").indices.items()}
+        self._block_rows = {k: positions[v] for k, v in keys.groupby(["camp_key", "block_key"]).indices.items()}
+        self.seconds = time.perf_counter() - started
+
+    def rows(self, camp: str | None = None, block: str | None = None) -> np.ndarray:
+        """Row positions located inside a camp's or block's outline."""
+        camp_key = str(camp or "").strip().upper()
+        if block is None:
+            return self._camp_rows.get(camp_key, np.empty(0, dtype=np.int64))
+        return self._block_rows.get((camp_key, str(block).strip().upper()), np.empty(0, dtype=np.int64))
+
+    def located_keys(self, equipment: pd.DataFrame) -> pd.DataFrame:
+        """`equipment` with camp_key/block_key replaced by the location-based keys."""
+        return equipment.assign(camp_key=self.camp_key, block_key=self.block_key)
+
+    def check(self, camp: str, block: str) -> dict:
+        """Text/geometry disagreements for one block selection."""
+        camp_key, block_key = str(camp).strip().upper(), str(block).strip().upper()
+        recorded_here = (self._recorded["camp_key"] == camp_key).to_numpy() & (
+            self._recorded["block_key"] == block_key
+        ).to_numpy()
+        located_here = (self.camp_key == camp_key) & (self.block_key == block_key)
+        return {
+            "recorded_elsewhere": int((located_here & ~recorded_here).sum()),
+            "located_elsewhere": int((recorded_here & (self.status == MISMATCH)).sum()),
+            "outside_outlines": int((recorded_here & (self.status == OUTSIDE)).sum()),
+        }
+
+    def summary(self) -> dict:
+        return pd.Series(self.status).value_counts().to_dict()
+
+
+_join: EquipmentBlockJoin | None = None
+_join_lock = threading.Lock()
+
+
+def get_equipment_join(snapshot: DataSnapshot | None = None) -> EquipmentBlockJoin:
+    """Spatial join for the active equipment data; rerun after every reload."""
+    global _join
+    snapshot = snapshot or current_data()
+    join = _join
+    if join is not None and join.version == snapshot.equipment_version:
+        return join
+
+    with _join_lock:
+        if _join is None or _join.version != snapshot.equipment_version:
+            _join = EquipmentBlockJoin(snapshot.equipment_df, snapshot.equipment_version)
+            print(f"[INFO] Equipment spatial join in {_join.seconds:.2f}s: {_join.summary()}")
+        return _join
+
+
+if __name__ == "__main__":
+    join = get_equipment_join()
+    mismatched = current_data().equipment_df.assign(
+        located_camp=join.camp_key, located_block=join.block_key, location_check=join.status
+    )
+    mismatched = mismatched[mismatched["location_check"] != MATCH]
+    print(mismatched[["_ID", "Camp", "Sub_block", "located_camp", "located_block", "location_check"]].to_string())
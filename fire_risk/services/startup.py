@@ -0,0 +1,94 @@
+"""
+Import-time profile of the app and the worker boot budget.
+
+`python -m fire_risk.services.startup` imports the app in a fresh interpreter
+under `python -X importtime`, prints the slowest modules and the time per
+top-level package, and exits with status 1 when the import takes longer than
+`FIRE_RISK_STARTUP_BUDGET` seconds (default 5), so a deploy check or CI job
+can refuse a change that slows worker boot.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+import pandas as pd
+
+STARTUP_BUDGET_SECONDS = float(os.environ.get("FIRE_RISK_STARTUP_BUDGET", 5))
+APP_MODULE = "fire_risk.app"
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+_TIMER = "import sys, time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t, file=sys.stderr)"
+
+
+def parse_importtime(stderr: str) -> pd.DataFrame:
+    """`-X importtime` lines as module, package, depth, self_ms, cumulative_ms (in import order)."""
+    rows = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append({
+                "module": module,
+                "package": module.split(".")[0],
+                "depth": len(indent) // 2,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            })
+    return pd.DataFrame(rows, columns=["module", "package", "depth", "self_ms", "cumulative_ms"])
+
+
+def profile_import(module: str = APP_MODULE) -> tuple[float, pd.DataFrame]:
+    """Wall time (s) of importing `module` in a fresh interpreter, and its per-module import times."""
+    env = {**os.environ, "FIRE_RISK_RELOAD_INTERVAL": "0"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _TIMER.format(module=module)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr[-2000:]}")
+    wall = float(result.stderr.strip().splitlines()[-1])
+    return wall, parse_importtime(result.stderr)
+
+
+def format_report(wall: float, modules: pd.DataFrame, budget: float = STARTUP_BUDGET_SECONDS, top: int = 25) -> str:
+    slowest = modules.sort_values("cumulative_ms", ascending=False).head(top)
+    packages = (
+        modules.groupby("package")["self_ms"].sum()
+        .sort_values(ascending=False)
+        .head(top)
+        .rename("self_ms")
+        .reset_index()
+    )
+    status = "OK" if wall <= budget else "OVER BUDGET"
+    lines = [
+        f"Import of the app: {wall:.2f}s (budget {budget:.2f}s) {status}",
+        f"{len(modules)} modules imported",
+        "",
+        f"Slowest {len(slowest)} modules (cumulative, including what they import):",
+    ]
+    lines += [
+        f"  {row.cumulative_ms:9.1f} ms  {row.self_ms:8.1f} ms self  {'  ' * row.depth}{row.module}"
+        for row in slowest.itertuples()
+    ]
+    lines += ["", "Time per top-level package (own module code only):"]
+    lines += [f"  {row.self_ms:9.1f} ms  {row.package}" for row in packages.itertuples()]
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default=APP_MODULE)
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_SECONDS, help="seconds")
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args()
+
+    wall, modules = profile_import(args.module)
+    print(format_report(wall, modules, budget=args.budget, top=args.top))
+    sys.exit(0 if wall <= args.budget else 1)
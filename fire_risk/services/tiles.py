@@ -0,0 +1,432 @@
+"""Camp and block outlines for the browser: Mapbox Vector Tiles from a local MBTiles store, and versioned GeoJSON."""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+import dash
+import numpy as np
+from flask import Response, abort, request
+
+from fire_risk.legacy.data import BASE_DIR
+from fire_risk.services.artifacts import prune_versions
+from fire_risk.services.geometry import SIMPLIFY_ZOOMS, block_outlines, camp_outlines, level_for_zoom, outline_store
+
+TILES_DIR = Path(os.environ.get("FIRE_RISK_TILES_DIR", ".cache"))
+# Optional absolute URL prefix for tiles (e.g. behind a proxy); defaults to
+# the host of the incoming request. mapbox-gl fetches tiles from a web
+# worker, which cannot resolve relative URLs.
+TILE_BASE_URL = os.environ.get("FIRE_RISK_TILE_BASE_URL", "").rstrip("/")
+
+TILESET = "outlines"
+MIN_ZOOM = 8
+MAX_ZOOM = 16  # deeper tiles are cut on demand and kept in memory
+EXTENT = 4096
+BUFFER = 64
+OUTLINE_FILES = ("Camp_Outline.json", "Block_Outline.json")
+
+# Layer name -> (outline kind, properties carried into the tile)
+LAYERS = {
+    "camps": ("camp", ("CampName",)),
+    "blocks": ("block", ("CampName_1", "BlockLabel")),
+}
+
+
+@lru_cache(maxsize=None)
+def outlines_version() -> str:
+    digest = hashlib.sha1()
+    for name in OUTLINE_FILES:
+        path = BASE_DIR / name
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+# -------------------------------------------------------------------
+# MVT ENCODING
+# -------------------------------------------------------------------
+def _varint(n: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _zigzag(n: int) -> int:
+    return (n << 1) ^ (n >> 63)
+
+
+def _field(number: int, wire_type: int) -> bytes:
+    return _varint((number << 3) | wire_type)
+
+
+def _bytes_field(number: int, payload: bytes) -> bytes:
+    return _field(number, 2) + _varint(len(payload)) + payload
+
+
+def _uint_field(number: int, value: int) -> bytes:
+    return _field(number, 0) + _varint(value)
+
+
+def _packed(number: int, values) -> bytes:
+    return _bytes_field(number, b"".join(_varint(v) for v in values))
+
+
+def _command(cmd: int, count: int) -> int:
+    return (cmd & 0x7) | (count << 3)
+
+
+def _polygon_geometry(rings: list[np.ndarray]) -> list[int]:
+    """MoveTo/LineTo/ClosePath stream for integer tile-space rings (open, no repeated end)."""
+    geometry = []
+    cx = cy = 0
+    for ring in rings:
+        x0, y0 = int(ring[0, 0]), int(ring[0, 1])
+        geometry += [_command(1, 1), _zigzag(x0 - cx), _zigzag(y0 - cy)]
+        cx, cy = x0, y0
+        geometry.append(_command(2, len(ring) - 1))
+        for x, y in ring[1:]:
+            x, y = int(x), int(y)
+            geometry += [_zigzag(x - cx), _zigzag(y - cy)]
+            cx, cy = x, y
+        geometry.append(_command(7, 1))
+    return geometry
+
+
+def encode_layer(name: str, features: list[tuple[dict, list[np.ndarray]]]) -> bytes:
+    keys, values = [], []
+    key_ids, value_ids = {}, {}
+    encoded = []
+    for fid, (props, rings) in enumerate(features, start=1):
+        tags = []
+        for k, v in props.items():
+            if v is None:
+                continue
+            v = str(v)
+            if k not in key_ids:
+                key_ids[k] = len(keys)
+                keys.append(k)
+            if v not in value_ids:
+                value_ids[v] = len(values)
+                values.append(v)
+            tags += [key_ids[k], value_ids[v]]
+        feature = (
+            _uint_field(1, fid)
+            + _packed(2, tags)
+            + _uint_field(3, 3)  # POLYGON
+            + _packed(4, _polygon_geometry(rings))
+        )
+        encoded.append(_bytes_field(2, feature))
+
+    layer = _uint_field(15, 2) + _bytes_field(1, name.encode("utf-8"))
+    layer += b"".join(encoded)
+    layer += b"".join(_bytes_field(3, k.encode("utf-8")) for k in keys)
+    layer += b"".join(_bytes_field(4, _bytes_field(1, v.encode("utf-8"))) for v in values)
+    layer += _uint_field(5, EXTENT)
+    return _bytes_field(3, layer)
+
+
+# -------------------------------------------------------------------
+# PROJECTION + CLIPPING
+# -------------------------------------------------------------------
+def _mercator(coords: np.ndarray) -> np.ndarray:
+    """lon/lat -> Web Mercator in [0, 1] world units (y down)."""
+    lon, lat = coords[:, 0], np.clip(coords[:, 1], -85.05112878, 85.05112878)
+    x = (lon + 180.0) / 360.0
+    y = (1.0 - np.log(np.tan(np.radians(lat)) + 1.0 / np.cos(np.radians(lat))) / math.pi) / 2.0
+    return np.column_stack([x, y])
+
+
+def _clip_ring(ring: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """Sutherland-Hodgman clip of a closed ring against the square [lo, hi]^2."""
+    pts = ring
+    for axis, bound, keep_less in ((0, lo, False), (0, hi, True), (1, lo, False), (1, hi, True)):
+        if len(pts) == 0:
+            break
+        out = []
+        prev = pts[-1]
+        prev_in = prev[axis] <= bound if keep_less else prev[axis] >= bound
+        for cur in pts:
+            cur_in = cur[axis] <= bound if keep_less else cur[axis] >= bound
+            if cur_in != prev_in:
+                t = (bound - prev[axis]) / (cur[axis] - prev[axis])
+                out.append(prev + t * (cur - prev))
+            if cur_in:
+                out.append(cur)
+            prev, prev_in = cur, cur_in
+        pts = np.asarray(out)
+    return pts
+
+
+@lru_cache(maxsize=None)
+def _projected_layer(layer: str, level: int | None) -> list[tuple[dict, list[np.ndarray], np.ndarray]]:
+    """Outline features of a simplification level in mercator units, with per-feature bbox."""
+    kind, prop_names = LAYERS[layer]
+    outlines = outline_store(kind, level)
+    if outlines is None:
+        return []
+    out = []
+    for i, feat_props in enumerate(outlines.properties):
+        props = {k: feat_props.get(k) for k in prop_names}
+        rings = [_mercator(np.asarray(r[:-1])) for r in outlines.rings(i) if len(r) >= 4]
+        if not rings:
+            continue
+        pts = np.concatenate(rings)
+        out.append((props, rings, np.concatenate([pts.min(axis=0), pts.max(axis=0)])))
+    return out
+
+
+def render_tile(z: int, x: int, y: int) -> bytes | None:
+    """Encoded (uncompressed) tile, or None if nothing intersects it."""
+    scale = 2 ** z
+    margin = BUFFER / EXTENT / scale
+    x0, y0 = x / scale, y / scale
+    x1, y1 = (x + 1) / scale, (y + 1) / scale
+
+    payload = b""
+    for layer in LAYERS:
+        features = []
+        for props, rings, bbox in _projected_layer(layer, level_for_zoom(z)):
+            if bbox[2] < x0 - margin or bbox[0] > x1 + margin or bbox[3] < y0 - margin or bbox[1] > y1 + margin:
+                continue
+            tile_rings = []
+            for ring in rings:
+                local = (ring * scale - (x, y)) * EXTENT
+                clipped = _clip_ring(local, -BUFFER, EXTENT + BUFFER)
+                if len(clipped) < 3:
+                    continue
+                clipped = np.rint(clipped).astype(np.int64)
+                keep = np.any(clipped != np.roll(clipped, 1, axis=0), axis=1)
+                clipped = clipped[keep]
+                if len(clipped) < 3:
+                    continue
+                tile_rings.append(clipped)
+            if tile_rings:
+                features.append((props, tile_rings))
+        if features:
+            payload += encode_layer(layer, features)
+    return payload or None
+
+
+# -------------------------------------------------------------------
+# MBTILES STORE
+# -------------------------------------------------------------------
+def _tile_range(z: int) -> tuple[range, range]:
+    boxes = [bbox for layer in LAYERS for _, _, bbox in _projected_layer(layer, level_for_zoom(z))]
+    if not boxes:
+        return range(0), range(0)
+    boxes = np.asarray(boxes)
+    scale = 2 ** z
+    min_x, min_y = np.floor(boxes[:, :2].min(axis=0) * scale).astype(int)
+    max_x, max_y = np.floor(boxes[:, 2:].max(axis=0) * scale).astype(int)
+    return range(min_x, max_x + 1), range(min_y, max_y + 1)
+
+
+def build_mbtiles(path: Path, version: str) -> int:
+    """Write all tiles for MIN_ZOOM..MAX_ZOOM into `path`; returns the tile count."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+    con = sqlite3.connect(tmp_path)
+    con.execute("CREATE TABLE metadata (name TEXT, value TEXT)")
+    con.execute(
+        "CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB)"
+    )
+    count = 0
+    for z in range(MIN_ZOOM, MAX_ZOOM + 1):
+        xs, ys = _tile_range(z)
+        rows = []
+        for x in xs:
+            for y in ys:
+                data = render_tile(z, x, y)
+                if data is not None:
+                    # MBTiles rows are TMS (y flipped); pbf payloads are gzipped.
+                    rows.append((z, x, 2 ** z - 1 - y, gzip.compress(data, mtime=0)))
+        con.executemany("INSERT INTO tiles VALUES (?, ?, ?, ?)", rows)
+        count += len(rows)
+    con.execute("CREATE UNIQUE INDEX tile_index ON tiles (zoom_level, tile_column, tile_row)")
+    con.executemany(
+        "INSERT INTO metadata VALUES (?, ?)",
+        [
+            ("name", TILESET),
+            ("format", "pbf"),
+            ("minzoom", str(MIN_ZOOM)),
+            ("maxzoom", str(MAX_ZOOM)),
+            ("version", version),
+        ],
+    )
+    con.commit()
+    con.close()
+    os.replace(tmp_path, path)
+    return count
+
+
+class TileStore:
+    """Read side of the MBTiles file, built on first use for the current outlines."""
+
+    def __init__(self, tiles_dir: Path = TILES_DIR):
+        self.version = outlines_version()
+        tiles_dir.mkdir(parents=True, exist_ok=True)
+        self.path = tiles_dir / f"{TILESET}_{self.version}.mbtiles"
+        if not self.path.exists():
+            build_mbtiles(self.path, self.version)
+            prune_versions(self.path, rf"{TILESET}_[0-9a-f]+\.mbtiles")
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            self._local.con = con
+        return con
+
+    def reset_connections(self) -> None:
+        """Drop connections inherited across a fork; each process opens its own."""
+        self._local = threading.local()
+
+    def get(self, z: int, x: int, y: int) -> bytes | None:
+        """Gzipped tile bytes or None for an empty tile."""
+        if z > MAX_ZOOM:
+            return _deep_tile(z, x, y)
+        row = self._connection().execute(
+            "SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+            (z, x, 2 ** z - 1 - y),
+        ).fetchone()
+        return row[0] if row else None
+
+
+@lru_cache(maxsize=2048)
+def _deep_tile(z: int, x: int, y: int) -> bytes | None:
+    data = render_tile(z, x, y)
+    return gzip.compress(data, mtime=0) if data is not None else None
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_tile_store() -> TileStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = TileStore()
+    return _store
+
+
+# -------------------------------------------------------------------
+# FLASK ROUTES + MAP LAYERS
+# -------------------------------------------------------------------
+def register_tile_routes(server) -> None:
+    @server.route(f"/tiles/{TILESET}/<version>/<int:z>/<int:x>/<int:y>.pbf")
+    def outline_tile(version, z, x, y):
+        if z < 0 or z > 22 or not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+            abort(404)
+        store = get_tile_store()
+        data = store.get(z, x, y)
+
+        # Versioned URLs never change content, so the browser can keep them.
+        if version == store.version:
+            cache_control = "public, max-age=31536000, immutable"
+        else:
+            cache_control = "public, max-age=300"
+        headers = {"Cache-Control": cache_control, "ETag": f'"{store.version}-{z}-{x}-{y}"'}
+        if request.headers.get("If-None-Match") == headers["ETag"]:
+            return Response(status=304, headers=headers)
+        if data is None:
+            return Response(status=204, headers=headers)
+
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+        else:
+            data = gzip.decompress(data)
+        return Response(data, mimetype="application/x-protobuf", headers=headers)
+
+    @server.route(f"/geo/{TILESET}/<version>/<kind>-z<int:level>.json")
+    def outline_geojson(version, kind, level):
+        if kind not in _GEOJSON_SOURCES or level not in SIMPLIFY_ZOOMS:
+            abort(404)
+        data = _outline_geojson(kind, level)
+        if data is None:
+            abort(404)
+        if version == outlines_version():
+            cache_control = "public, max-age=31536000, immutable"
+        else:
+            cache_control = "no-cache"
+        headers = {"Cache-Control": cache_control, "ETag": f'"{outlines_version()}-{kind}-{level}"'}
+        if request.headers.get("If-None-Match") == headers["ETag"]:
+            return Response(status=304, headers=headers)
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+        else:
+            data = gzip.decompress(data)
+        return Response(data, mimetype="application/geo+json", headers=headers)
+
+
+_GEOJSON_SOURCES = {"camps": camp_outlines, "blocks": block_outlines}
+
+
+@lru_cache(maxsize=None)
+def _outline_geojson(kind: str, level: int) -> bytes | None:
+    collection = _GEOJSON_SOURCES[kind](level)
+    if collection is None:
+        return None
+    body = json.dumps(collection, separators=(",", ":")).encode("utf-8")
+    return gzip.compress(body, mtime=0)
+
+
+def outline_geojson_url(kind: str, zoom: float) -> str:
+    """
+    Versioned URL of the `kind` ("camps"/"blocks") outlines simplified for
+    `zoom`. Figures reference it instead of embedding the GeoJSON, so the
+    browser downloads the geometry once and later figure updates only carry
+    per-camp values. Call inside a request.
+    """
+    level = level_for_zoom(zoom) or SIMPLIFY_ZOOMS[-1]
+    return dash.get_relative_path(f"/geo/{TILESET}/{outlines_version()}/{kind}-z{level}.json")
+
+
+def tile_url() -> str:
+    """Absolute {z}/{x}/{y} URL template for the outline tiles."""
+    base = TILE_BASE_URL or request.host_url.rstrip("/")
+    return f"{base}/tiles/{TILESET}/{get_tile_store().version}/{{z}}/{{x}}/{{y}}.pbf"
+
+
+def outline_layers(color: str = "#555555", width: float = 1, layers=("camps", "blocks")) -> list[dict]:
+    """Plotly mapbox `layers` drawing outlines from the vector tiles."""
+    url = tile_url()
+    return [
+        {
+            "sourcetype": "vector",
+            "source": [url],
+            "sourcelayer": name,
+            "type": "line",
+            "color": color,
+            "line": {"width": width * (1.5 if name == "camps" else 1)},
+            "below": "traces",
+        }
+        for name in layers
+    ]
+
+
+if __name__ == "__main__":
+    import time
+
+    started = time.perf_counter()
+    version = outlines_version()
+    TILES_DIR.mkdir(parents=True, exist_ok=True)
+    target = TILES_DIR / f"{TILESET}_{version}.mbtiles"
+    n = build_mbtiles(target, version)
+    print(f"[INFO] Wrote {n} tiles to {target} in {time.perf_counter() - started:.1f}s")
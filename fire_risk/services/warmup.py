@@ -0,0 +1,149 @@
+"""Server preload, per-worker warm-up and the /readyz readiness check."""
+from __future__ import annotations
+
+import gc
+import os
+import threading
+import time
+from datetime import date
+
+from flask import jsonify
+
+from fire_risk.legacy.callbacks.site_callbacks import warm_site_figures
+from fire_risk.legacy.data import cached_camp_summary, current_data
+from fire_risk.legacy.fwi_fri import load_cffwis
+from fire_risk.legacy.layouts import PAGES, page_layout
+from fire_risk.services import figures
+from fire_risk.services.cache import cache
+from fire_risk.services.common import camp_summary_snapshot, summary_from_snapshot
+from fire_risk.services.figure_cache import FIGURE_TTL_SECONDS
+from fire_risk.services.geometry import SIMPLIFY_ZOOMS, geometry_index
+from fire_risk.services.reload import start_data_watcher
+from fire_risk.services.spatial_join import get_equipment_join
+from fire_risk.services.tiles import get_tile_store
+
+# Set by gunicorn.conf.py: the app is imported once in the master and the
+# per-process services start in each worker after fork.
+PRELOADED = os.environ.get("FIRE_RISK_PRELOAD", "0").strip().lower() in ("1", "true", "yes")
+WARMUP_RETRY_SECONDS = 10
+# How long a worker waits for another one to build the camp summary before
+# building it itself.
+WARMUP_WAIT_SECONDS = 60
+
+_ready = threading.Event()
+_warmup: threading.Thread | None = None
+_warm_seconds: float | None = None
+
+
+def preload() -> None:
+    """
+    Build everything read-only in the master before workers are forked, so
+    they share it copy-on-write: data snapshot, simplified outlines and their
+    indexes, the tile store, equipment join, xclim, figure templates and the
+    page layouts. The heap is then frozen so the workers' garbage collector
+    does not touch (and copy) these pages.
+    """
+    started = time.perf_counter()
+    current_data()
+    for level in (*SIMPLIFY_ZOOMS, None):
+        geometry_index(level)
+    get_tile_store()
+    get_equipment_join()
+    load_cffwis()
+    for name in ("plotly", "plotly_white"):
+        figures.template(name)
+    for pathname in ("/", *PAGES):
+        page_layout(pathname)
+    gc.collect()
+    gc.freeze()
+    print(f"[INFO] pid={os.getpid()} Preloaded data, outlines and layouts in {time.perf_counter() - started:.1f}s")
+
+
+def _warm() -> None:
+    global _warm_seconds
+    started = time.perf_counter()
+    if not _claim("camp-summary"):
+        deadline = time.monotonic() + WARMUP_WAIT_SECONDS
+        while cached_camp_summary() is None and time.monotonic() < deadline:
+            time.sleep(0.5)
+    while True:
+        try:
+            cache.purge_expired()
+            summary = camp_summary_snapshot()
+            break
+        except Exception as e:
+            print(f"[WARN] pid={os.getpid()} Warm-up failed, retrying in {WARMUP_RETRY_SECONDS}s: {repr(e)}")
+            time.sleep(WARMUP_RETRY_SECONDS)
+    _warm_seconds = time.perf_counter() - started
+    _ready.set()
+    print(f"[INFO] pid={os.getpid()} Worker ready in {_warm_seconds:.1f}s")
+    _warm_camps(summary)
+
+
+def _claim(name: str) -> bool:
+    """
+    True for the one worker that gets to warm `name` (the camp summary or a
+    camp) for this data version, day and figure TTL; workers booting
+    together would otherwise each send the same weather requests.
+    """
+    key = cache.make_key("warmup", name=name, data=current_data().assessment_version, date=date.today().isoformat())
+    return cache.add(key, os.getpid(), ttl_seconds=FIGURE_TTL_SECONDS)
+
+
+def _warm_camps(summary) -> None:
+    """
+    Fill the forecast frame and the site-level outlook figures for every camp
+    after the worker is ready, so the first visit to a site page does not
+    wait on the weather APIs. Workers booting together split the camps
+    between them (`_claim`), so each camp is fetched once per deploy rather
+    than once per worker; the others read its figures from the cache. A camp
+    whose fetch fails is skipped; its page builds on demand as before.
+    """
+    started = time.perf_counter()
+    warmed = claimed_elsewhere = 0
+    for camp in summary_from_snapshot(summary).itertuples(index=False):
+        if not _claim(f"camp:{camp.CampName}"):
+            claimed_elsewhere += 1
+            continue
+        try:
+            warm_site_figures(camp.CampName, camp.Latitude, camp.Longitude, float(camp.FSI_Calculated))
+            warmed += 1
+        except Exception as e:
+            print(f"[WARN] pid={os.getpid()} Warm-up skipped {camp.CampName}: {repr(e)}")
+    print(
+        f"[INFO] pid={os.getpid()} Warmed site figures for {warmed} camps "
+        f"({claimed_elsewhere} warmed by other workers) in {time.perf_counter() - started:.1f}s"
+    )
+
+
+def start_worker() -> None:
+    """
+    Per-process start-up: run after fork in each worker, or at import when
+    the app is not preloaded. Reopens inherited connections, starts the data
+    watcher (threads do not survive a fork) and warms the camp summary in the
+    background; `/readyz` answers 503 until that is done. Each camp's
+    forecast and site figures are warmed after that, in the same thread.
+    """
+    global _warmup
+    get_tile_store().reset_connections()
+    start_data_watcher()
+    if _warmup is None or not _warmup.is_alive():
+        _ready.clear()
+        _warmup = threading.Thread(target=_warm, name="fire-risk-warmup", daemon=True)
+        _warmup.start()
+
+
+def is_ready() -> bool:
+    return _ready.is_set()
+
+
+def register_readiness_routes(server) -> None:
+    @server.route("/readyz")
+    def readyz():
+        body = {
+            "ready": is_ready(),
+            "pid": os.getpid(),
+            "data_version": current_data().version,
+            "warm_seconds": None if _warm_seconds is None else round(_warm_seconds, 2),
+        }
+        return jsonify(body), 200 if body["ready"] else 503
@@ -0,0 +1,481 @@
+"""
+Local stand-in for the Open-Meteo and NASA POWER APIs.
+
+Serves the four endpoints `fire_risk.legacy.fwi_fri` calls
+(`/v1/forecast`, `/v1/archive`, `/api/temporal/monthly/point`,
+`/api/temporal/climatology/point`) for any coordinates and dates, either
+synthesised from a seasonal model of the camps' climate or replayed from
+recorded payloads (`--replay benchmarks/fixtures`). Latency, server errors
+and rate limiting can be injected, so load tests and benchmarks run offline:
+
+    python -m fire_risk.services.weather_stub --port 8099 \\
+        --latency lognormal:150:0.6 --error-rate 0.02 --rate-limit 20
+    FIRE_RISK_WEATHER_BASE_URL=http://127.0.0.1:8099 python run_fire_risk.py
+
+`GET /stubz` reports request counts per endpoint and status; `POST /stubz`
+with any of `latency`, `error_rate`, `rate_limit`, `burst` changes the fault
+profile of a running stub.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Monthly normals near the Cox's Bazar camps (NASA POWER 1991-2020):
+# T2M (C), RH2M (%), WS10M (m/s), PRECTOTCORR (mm/day).
+CLIMATE_NORMALS = {
+    "T2M": [19.9, 22.4, 25.9, 28.2, 28.9, 28.6, 28.0, 28.1, 28.3, 27.4, 24.4, 21.3],
+    "RH2M": [66.1, 63.5, 67.9, 74.6, 80.3, 87.6, 89.5, 88.6, 86.4, 81.2, 74.0, 70.2],
+    "WS10M": [2.1, 2.4, 2.8, 3.4, 3.9, 4.6, 4.8, 4.1, 3.2, 2.6, 2.2, 2.0],
+    "PRECTOTCORR": [0.2, 0.6, 1.5, 3.6, 10.4, 21.3, 24.6, 19.8, 12.6, 6.1, 1.7, 0.3],
+}
+NORMALS_LAT = 21.2
+POWER_UNITS = {"T2M": "C", "RH2M": "%", "WS10M": "m/s", "PRECTOTCORR": "mm/day"}
+HOURLY_UNITS = {
+    "temperature_2m": "°C",
+    "relative_humidity_2m": "%",
+    "wind_speed_10m": "km/h",
+    "wind_direction_10m": "°",
+    "precipitation": "mm",
+}
+HOURLY_ALIASES = {
+    "relativehumidity_2m": "relative_humidity_2m",
+    "windspeed_10m": "wind_speed_10m",
+    "winddirection_10m": "wind_direction_10m",
+}
+DAILY_UNITS = {"precipitation_sum": "mm"}
+WIND_UNITS = {"kmh": 1.0, "ms": 1 / 3.6, "mph": 1 / 1.609344, "kn": 1 / 1.852}
+
+FORECAST_PATH = "/v1/forecast"
+ARCHIVE_PATH = "/v1/archive"
+POWER_MONTHLY_PATH = "/api/temporal/monthly/point"
+POWER_CLIMATOLOGY_PATH = "/api/temporal/climatology/point"
+
+# Fixture file per endpoint in a replay directory (see benchmarks/record_fixtures.py).
+REPLAY_FILES = {
+    FORECAST_PATH: "openmeteo_forecast_14d.json",
+    ARCHIVE_PATH: "openmeteo_archive_90d.json",
+    POWER_MONTHLY_PATH: "power_monthly.json",
+    POWER_CLIMATOLOGY_PATH: "power_climatology.json",
+}
+
+SERVER_ERRORS = [
+    (500, "Internal Server Error"),
+    (502, "Bad Gateway"),
+    (503, "Service Unavailable"),
+    (504, "Gateway Timeout"),
+]
+RATE_LIMIT_REASON = "API request limit exceeded. Please try again later."
+
+
+class StubRequestError(ValueError):
+    """Bad query parameters; answered with 400 and the API's error body."""
+
+
+# ------ WEATHER SOURCES ------
+def _days(start: date, end: date) -> list[date]:
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def _variables(params: dict, name: str, known: dict, aliases: dict | None = None) -> list[str]:
+    requested = [v.strip() for v in params.get(name, "").split(",") if v.strip()]
+    unknown = [v for v in requested if v not in known and v not in (aliases or {})]
+    if unknown:
+        raise StubRequestError(f"Cannot initialize {name} variable from invalid String value {unknown[0]}")
+    return requested
+
+
+def _open_meteo_envelope(lat: float, lon: float, params: dict) -> dict:
+    utc_offset = round(lon / 15) * 3600
+    return {
+        "latitude": round(lat, 3),
+        "longitude": round(lon, 3),
+        "generationtime_ms": 0.1,
+        "utc_offset_seconds": utc_offset,
+        "timezone": params.get("timezone", "GMT") if params.get("timezone") != "auto" else f"GMT{utc_offset // 3600:+d}",
+        "timezone_abbreviation": f"GMT{utc_offset // 3600:+d}",
+        "elevation": 10.0,
+    }
+
+
+class SyntheticWeather:
+    """
+    Deterministic weather for any point and date: monthly normals
+    interpolated to the day, shifted for latitude, with day-to-day noise
+    seeded by (lat, lon, date) so overlapping requests agree.
+    """
+
+    name = "synthetic"
+
+    def _day(self, lat: float, lon: float, day: date) -> dict:
+        rng = np.random.default_rng(zlib.crc32(f"{lat:.2f},{lon:.2f},{day.toordinal()}".encode()))
+        # Linear between mid-month normals.
+        pos = (day.timetuple().tm_yday - 15.5) / (365.25 / 12)
+        lo, frac = int(math.floor(pos)) % 12, pos - math.floor(pos)
+        normal = {k: v[lo] * (1 - frac) + v[(lo + 1) % 12] * frac for k, v in CLIMATE_NORMALS.items()}
+
+        wet_chance = min(0.9, 0.08 + normal["PRECTOTCORR"] / 12)
+        rain = float(rng.exponential(normal["PRECTOTCORR"] / wet_chance)) if rng.random() < wet_chance else 0.0
+        monsoon = day.month in (5, 6, 7, 8, 9)
+        return {
+            "temp": normal["T2M"] - 0.5 * (abs(lat) - NORMALS_LAT) + rng.normal(0, 1.2) - (1.5 if rain > 5 else 0.0),
+            "rh": normal["RH2M"] + rng.normal(0, 4) + (6 if rain > 5 else 0.0),
+            "wind": normal["WS10M"] * 3.6 * rng.lognormal(0, 0.25),
+            "dir": (200.0 if monsoon else 40.0) + rng.normal(0, 35),
+            "rain": round(rain, 1),
+            "noise": rng.normal(0, 1, size=(4, 24)),
+        }
+
+    def open_meteo(self, path: str, lat: float, lon: float, start: date, end: date, params: dict) -> dict:
+        hourly_vars = _variables(params, "hourly", HOURLY_UNITS, HOURLY_ALIASES)
+        daily_vars = _variables(params, "daily", DAILY_UNITS)
+        wind_factor = WIND_UNITS.get(params.get("wind_speed_unit", "kmh"), 1.0)
+        hours = np.arange(24)
+        diurnal = np.sin((hours - 8) / 24 * 2 * np.pi)
+
+        hourly = {"time": []}
+        columns = {name: [] for name in HOURLY_UNITS}
+        daily = {"time": [], "precipitation_sum": []}
+        for day in _days(start, end):
+            d = self._day(lat, lon, day)
+            amplitude = 2.5 if d["rain"] > 5 else 4.0
+            rain_hours = np.zeros(24)
+            if d["rain"]:
+                rain_hours[13:19] = d["rain"] / 6
+            hourly["time"] += [f"{day.isoformat()}T{h:02d}:00" for h in hours]
+            columns["temperature_2m"] += np.round(d["temp"] + amplitude * diurnal + 0.4 * d["noise"][0], 1).tolist()
+            columns["relative_humidity_2m"] += np.clip(np.round(d["rh"] - 12 * diurnal + 2 * d["noise"][1]), 20, 100).astype(int).tolist()
+            columns["wind_speed_10m"] += np.round(np.maximum(d["wind"] * (1 + 0.35 * diurnal) + 1.5 * d["noise"][2], 0) * wind_factor, 1).tolist()
+            columns["wind_direction_10m"] += (np.round(d["dir"] + 15 * d["noise"][3]) % 360).astype(int).tolist()
+            columns["precipitation"] += np.round(rain_hours, 1).tolist()
+            daily["time"].append(day.isoformat())
+            daily["precipitation_sum"].append(d["rain"])
+
+        for name in hourly_vars:
+            hourly[name] = columns[HOURLY_ALIASES.get(name, name)]
+        body = _open_meteo_envelope(lat, lon, params)
+        if hourly_vars:
+            body["hourly_units"] = {"time": "iso8601", **{n: HOURLY_UNITS[HOURLY_ALIASES.get(n, n)] for n in hourly_vars}}
+            body["hourly"] = hourly
+        if daily_vars:
+            body["daily_units"] = {"time": "iso8601", **{n: DAILY_UNITS[n] for n in daily_vars}}
+            body["daily"] = {"time": daily["time"], **{n: daily[n] for n in daily_vars}}
+        return body
+
+    def _power(self, lat: float, lon: float, parameters: list[str], keys, noise: random.Random | None) -> dict:
+        values = {}
+        for name in parameters:
+            normals = CLIMATE_NORMALS[name]
+            if name == "T2M":
+                normals = [v - 0.5 * (abs(lat) - NORMALS_LAT) for v in normals]
+            monthly = [
+                round(v + (noise.gauss(0, 0.3 if name != "PRECTOTCORR" else max(v * 0.25, 0.1)) if noise else 0.0), 2)
+                for v in normals
+            ]
+            monthly = [max(v, 0.0) for v in monthly]
+            values[name] = {**dict(zip(keys, monthly)), keys[12]: round(sum(monthly) / 12, 2)}
+        return {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [lon, lat, 10.0]},
+            "properties": {"parameter": values},
+            "header": {"api": {"version": "stub", "name": "POWER Temporal API"}, "fill_value": -999.0},
+            "parameters": {name: {"units": POWER_UNITS[name]} for name in parameters},
+        }
+
+    def power_monthly(self, lat: float, lon: float, year: int, parameters: list[str]) -> dict:
+        keys = [f"{year}{m:02d}" for m in range(1, 14)]
+        return self._power(lat, lon, parameters, keys, random.Random(zlib.crc32(f"{lat:.2f},{lon:.2f},{year}".encode())))
+
+    def power_climatology(self, lat: float, lon: float, parameters: list[str]) -> dict:
+        keys = [f"{m:02d}" for m in range(1, 13)] + ["ANN"]
+        return self._power(lat, lon, parameters, keys, None)
+
+
+class ReplayWeather:
+    """
+    Recorded payloads served for any point and date: Open-Meteo days are
+    taken in turn from the recording (wrapping around) and re-stamped with
+    the requested dates, and POWER monthly values are re-keyed to the
+    requested year.
+    """
+
+    name = "replay"
+
+    def __init__(self, fixtures_dir: str | Path):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.recordings = {}
+        for path, filename in REPLAY_FILES.items():
+            with open(self.fixtures_dir / filename, encoding="utf-8") as fh:
+                self.recordings[path] = json.load(fh)
+
+    def open_meteo(self, path: str, lat: float, lon: float, start: date, end: date, params: dict) -> dict:
+        recording = self.recordings[path]
+        hourly, daily = recording["hourly"], recording["daily"]
+        n_days = len(daily["time"])
+        out_hourly = {name: [] for name in hourly}
+        out_daily = {name: [] for name in daily}
+        for offset, day in enumerate(_days(start, end)):
+            source = offset % n_days
+            for name, values in hourly.items():
+                if name == "time":
+                    out_hourly[name] += [f"{day.isoformat()}T{hour:02d}:00" for hour in range(24)]
+                else:
+                    out_hourly[name] += values[source * 24:(source + 1) * 24]
+            out_daily["time"].append(day.isoformat())
+            for name, values in daily.items():
+                if name != "time":
+                    out_daily[name].append(values[source])
+        return {**recording, "latitude": round(lat, 3), "longitude": round(lon, 3), "hourly": out_hourly, "daily": out_daily}
+
+    def power_monthly(self, lat: float, lon: float, year: int, parameters: list[str]) -> dict:
+        recording = self.recordings[POWER_MONTHLY_PATH]
+        values = {
+            name: {f"{year}{key[4:]}": value for key, value in months.items()}
+            for name, months in recording["properties"]["parameter"].items()
+        }
+        return {**recording, "properties": {"parameter": values}}
+
+    def power_climatology(self, lat: float, lon: float, parameters: list[str]) -> dict:
+        return self.recordings[POWER_CLIMATOLOGY_PATH]
+
+
+# ------ FAULT INJECTION ------
+@dataclass(frozen=True)
+class Latency:
+    """Per-request delay in ms: `0`, `fixed:MS`, `uniform:LO:HI`, `normal:MEAN:SD` or `lognormal:MEDIAN:SIGMA`."""
+
+    kind: str = "fixed"
+    args: tuple[float, ...] = (0.0,)
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        kind, *args = str(spec).strip().split(":")
+        if kind.replace(".", "", 1).isdigit():
+            return cls("fixed", (float(kind),))
+        arity = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+        if kind not in arity or len(args) != arity[kind]:
+            raise ValueError(f"invalid latency {spec!r}; expected {cls.__doc__.split(': ', 1)[1]}")
+        return cls(kind, tuple(float(a) for a in args))
+
+    def sample_ms(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            value = rng.uniform(*self.args)
+        elif self.kind == "normal":
+            value = rng.gauss(*self.args)
+        elif self.kind == "lognormal":
+            value = rng.lognormvariate(math.log(max(self.args[0], 1e-3)), self.args[1])
+        else:
+            value = self.args[0]
+        return max(value, 0.0)
+
+    def __str__(self) -> str:
+        return ":".join([self.kind, *(f"{a:g}" for a in self.args)])
+
+
+@dataclass
+class Faults:
+    latency: Latency = field(default_factory=Latency)
+    error_rate: float = 0.0       # share of requests answered with a 5xx
+    rate_limit: float = 0.0       # requests per second per client; 0 means unlimited
+    burst: int = 10               # requests a client may make at once before the limit applies
+
+    @classmethod
+    def from_env(cls) -> "Faults":
+        return cls(
+            latency=Latency.parse(os.environ.get("FIRE_RISK_STUB_LATENCY", "0")),
+            error_rate=float(os.environ.get("FIRE_RISK_STUB_ERROR_RATE", 0)),
+            rate_limit=float(os.environ.get("FIRE_RISK_STUB_RATE_LIMIT", 0)),
+            burst=int(os.environ.get("FIRE_RISK_STUB_BURST", 10)),
+        )
+
+    def as_dict(self) -> dict:
+        return {"latency": str(self.latency), "error_rate": self.error_rate, "rate_limit": self.rate_limit, "burst": self.burst}
+
+
+class RateLimiter:
+    """Token bucket per client."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def acquire(self, client: str, rate: float, burst: int) -> float:
+        """0 when the request may go ahead, otherwise seconds until it could."""
+        if rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.get(client, (float(burst), now))
+            tokens = min(float(burst), tokens + (now - last) * rate)
+            if tokens >= 1.0:
+                self._buckets[client] = (tokens - 1.0, now)
+                return 0.0
+            self._buckets[client] = (tokens, now)
+        return (1.0 - tokens) / rate
+
+
+# ------ SERVICE ------
+class WeatherStubService:
+    """
+    Answers a weather API request (path and query parameters) with a status,
+    JSON body and headers after applying the fault profile. Used by the HTTP
+    server below and in-process by the benchmarks.
+    """
+
+    def __init__(self, source=None, faults: Faults | None = None, seed: int | None = None):
+        self.source = source or SyntheticWeather()
+        self.faults = faults or Faults()
+        self.rng = random.Random(seed)
+        self.limiter = RateLimiter()
+        self.stats: Counter = Counter()
+        self._stats_lock = threading.Lock()
+
+    def respond(self, path: str, params: dict, client: str = "local") -> tuple[int, dict, dict]:
+        faults = self.faults
+        status, body, headers = self._respond(path, params, client, faults)
+        with self._stats_lock:
+            self.stats[(path, status)] += 1
+        return status, body, headers
+
+    def _respond(self, path: str, params: dict, client: str, faults: Faults) -> tuple[int, dict, dict]:
+        if path not in REPLAY_FILES:
+            return 404, {"error": True, "reason": f"Unknown endpoint {path}"}, {}
+        retry_after = self.limiter.acquire(client, faults.rate_limit, faults.burst)
+        if retry_after:
+            return 429, {"error": True, "reason": RATE_LIMIT_REASON}, {"Retry-After": str(math.ceil(retry_after))}
+
+        delay_ms = faults.latency.sample_ms(self.rng)
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+        if faults.error_rate and self.rng.random() < faults.error_rate:
+            status, reason = self.rng.choice(SERVER_ERRORS)
+            return status, {"error": True, "reason": reason}, {}
+
+        try:
+            return 200, self._payload(path, params), {}
+        except StubRequestError as e:
+            if path.startswith("/api/"):
+                return 422, {"messages": [str(e)]}, {}
+            return 400, {"error": True, "reason": str(e)}, {}
+
+    def _payload(self, path: str, params: dict) -> dict:
+        lat, lon = self._coordinates(params)
+        if path in (FORECAST_PATH, ARCHIVE_PATH):
+            try:
+                start = date.fromisoformat(params["start_date"])
+                end = date.fromisoformat(params["end_date"])
+            except (KeyError, ValueError) as e:
+                raise StubRequestError(f"Parameter 'start_date' and 'end_date' must be ISO dates: {e}") from e
+            if end < start:
+                raise StubRequestError("End-date must be larger or equal than start-date")
+            return self.source.open_meteo(path, lat, lon, start, end, params)
+
+        parameters = [p for p in params.get("parameters", "").split(",") if p]
+        unknown = [p for p in parameters if p not in CLIMATE_NORMALS]
+        if not parameters or unknown:
+            raise StubRequestError(f"Unsupported POWER parameters: {','.join(unknown) or '(none)'}")
+        if path == POWER_CLIMATOLOGY_PATH:
+            return self.source.power_climatology(lat, lon, parameters)
+        try:
+            year = int(params["start"][:4])
+        except (KeyError, ValueError) as e:
+            raise StubRequestError("Parameter 'start' must be a year") from e
+        return self.source.power_monthly(lat, lon, year, parameters)
+
+    @staticmethod
+    def _coordinates(params: dict) -> tuple[float, float]:
+        try:
+            lat, lon = float(params["latitude"]), float(params["longitude"])
+        except (KeyError, ValueError) as e:
+            raise StubRequestError("Parameter 'latitude' and 'longitude' must be numbers") from e
+        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            raise StubRequestError("Latitude must be in range of -90 to 90°. Longitude must be in range of -180 to 180°.")
+        return lat, lon
+
+    def report(self) -> dict:
+        with self._stats_lock:
+            counts = [
+                {"path": path, "status": status, "count": count}
+                for (path, status), count in sorted(self.stats.items())
+            ]
+        return {"source": self.source.name, "faults": self.faults.as_dict(), "requests": counts}
+
+    def configure(self, changes: dict) -> None:
+        faults = self.faults
+        self.faults = Faults(
+            latency=Latency.parse(changes["latency"]) if "latency" in changes else faults.latency,
+            error_rate=float(changes.get("error_rate", faults.error_rate)),
+            rate_limit=float(changes.get("rate_limit", faults.rate_limit)),
+            burst=int(changes.get("burst", faults.burst)),
+        )
+
+
+def create_app(service: WeatherStubService | None = None):
+    """
+    Flask app serving the stub; `gunicorn "fire_risk.services.weather_stub:create_app()"`
+    builds it from FIRE_RISK_STUB_REPLAY, FIRE_RISK_STUB_LATENCY,
+    FIRE_RISK_STUB_ERROR_RATE, FIRE_RISK_STUB_RATE_LIMIT and FIRE_RISK_STUB_BURST.
+    """
+    from flask import Flask, jsonify, request
+
+    if service is None:
+        replay_dir = os.environ.get("FIRE_RISK_STUB_REPLAY", "").strip()
+        service = WeatherStubService(ReplayWeather(replay_dir) if replay_dir else None, Faults.from_env())
+
+    server = Flask(__name__)
+    server.config["weather_stub"] = service
+
+    def serve(path):
+        status, body, headers = service.respond(path, request.args.to_dict(), request.remote_addr or "local")
+        response = jsonify(body)
+        response.status_code = status
+        response.headers.update(headers)
+        return response
+
+    for path in REPLAY_FILES:
+        server.add_url_rule(path, endpoint=path, view_func=lambda path=path: serve(path))
+
+    @server.route("/stubz", methods=["GET", "POST"])
+    def stubz():
+        if request.method == "POST":
+            try:
+                service.configure(request.get_json(force=True) or {})
+            except (TypeError, ValueError) as e:
+                return jsonify({"error": True, "reason": str(e)}), 400
+            print(f"[INFO] Weather stub faults now {service.faults.as_dict()}")
+        return jsonify(service.report())
+
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--replay", type=Path, default=os.environ.get("FIRE_RISK_STUB_REPLAY") or None,
+                        help="directory of recorded payloads (e.g. benchmarks/fixtures); synthetic weather if omitted")
+    parser.add_argument("--latency", default=os.environ.get("FIRE_RISK_STUB_LATENCY", "0"), help=Latency.__doc__)
+    parser.add_argument("--error-rate", type=float, default=float(os.environ.get("FIRE_RISK_STUB_ERROR_RATE", 0)))
+    parser.add_argument("--rate-limit", type=float, default=float(os.environ.get("FIRE_RISK_STUB_RATE_LIMIT", 0)),
+                        help="requests per second per client (0: unlimited)")
+    parser.add_argument("--burst", type=int, default=int(os.environ.get("FIRE_RISK_STUB_BURST", 10)))
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    faults = Faults(Latency.parse(args.latency), args.error_rate, args.rate_limit, args.burst)
+    service = WeatherStubService(ReplayWeather(args.replay) if args.replay else None, faults, seed=args.seed)
+    print(f"[INFO] Weather stub ({service.source.name}) on http://{args.host}:{args.port} with {faults.as_dict()}")
+    print(f"[INFO] Point the app at it with FIRE_RISK_WEATHER_BASE_URL=http://{args.host}:{args.port}")
+    create_app(service).run(host=args.host, port=args.port, threaded=True)
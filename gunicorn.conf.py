@@ -0,0 +1,33 @@
+"""
+Production server: `gunicorn -c gunicorn.conf.py`.
+
+The app is imported and its data, outlines and layouts are built once in the
+master, then shared copy-on-write by the forked workers; each worker reopens
+its connections and warms the camp summary, and `/readyz` answers 503 until
+that is done. The weather fetches behind the summary and each camp's figures
+are split between the workers through the shared cache, so a deploy sends
+them once rather than once per worker. `python run_fire_risk.py` remains the single-process dev server.
+"""
+import os
+
+os.environ.setdefault("FIRE_RISK_PRELOAD", "1")
+
+wsgi_app = "fire_risk.app:server"
+bind = f"0.0.0.0:{os.environ.get('PORT', 10000)}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+threads = int(os.environ.get("FIRE_RISK_THREADS", 4))
+worker_class = "gthread"
+preload_app = True
+timeout = 120
+
+
+def when_ready(server):
+    from fire_risk.services.warmup import preload
+
+    preload()
+
+
+def post_fork(server, worker):
+    from fire_risk.services.warmup import start_worker
+
+    start_worker()
@@ -0,0 +1,20 @@
+"""TTLCache.add is a claim only one caller wins until it expires."""
+from __future__ import annotations
+
+from fire_risk.services.cache import TTLCache
+
+
+def test_add_only_sets_missing_key(tmp_path):
+    cache = TTLCache(str(tmp_path / "cache.sqlite"))
+
+    assert cache.add("warmup|camp=Camp 1", 101, ttl_seconds=60)
+    assert not cache.add("warmup|camp=Camp 1", 202, ttl_seconds=60)
+    assert cache.get("warmup|camp=Camp 1") == 101
+
+
+def test_add_replaces_expired_key(tmp_path):
+    cache = TTLCache(str(tmp_path / "cache.sqlite"))
+    cache.set("warmup|camp=Camp 1", 101, ttl_seconds=-1)
+
+    assert cache.add("warmup|camp=Camp 1", 202, ttl_seconds=60)
+    assert cache.get("warmup|camp=Camp 1") == 202
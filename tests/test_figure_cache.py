@@ -0,0 +1,34 @@
+"""Cached forecast figures follow the forecast frame they were drawn from."""
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from fire_risk.services.cache import TTLCache, cache
+from fire_risk.services.figure_cache import cached_figures, frame_fingerprint
+
+
+@pytest.fixture(autouse=True)
+def scratch_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "db_path", TTLCache(str(tmp_path / "cache.sqlite")).db_path)
+
+
+def _forecast(fwi: list[float]) -> pd.DataFrame:
+    return pd.DataFrame({"Date": pd.date_range("2026-07-01", periods=len(fwi)), "FWI": fwi})
+
+
+def _figures(forecast_df: pd.DataFrame) -> list[dict]:
+    def build():
+        return [{"data": [{"type": "scatter", "y": forecast_df["FWI"].tolist()}], "layout": {}}]
+
+    return cached_figures("test-forecast", build, camp="Camp 1", forecast=frame_fingerprint(forecast_df))
+
+
+def test_fingerprint_tracks_content():
+    assert frame_fingerprint(_forecast([1.0, 2.0])) == frame_fingerprint(_forecast([1.0, 2.0]))
+    assert frame_fingerprint(_forecast([1.0, 2.0])) != frame_fingerprint(_forecast([1.0, 3.0]))
+
+
+def test_refetched_forecast_rebuilds_figures():
+    assert _figures(_forecast([10.0, 20.0]))[0]["data"][0]["y"] == [10.0, 20.0]
+    assert _figures(_forecast([10.0, 35.0]))[0]["data"][0]["y"] == [10.0, 35.0]
@@ -0,0 +1,31 @@
+"""Colour grouping with nulls matches the Plotly Express figures it replaces."""
+from __future__ import annotations
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import pytest
+
+from fire_risk.services import figures
+
+
+def _traces(fig) -> list[tuple[str, list]]:
+    return [(trace.name, [int(v) for v in trace.x]) for trace in go.Figure(fig).data]
+
+
+@pytest.mark.parametrize("chart", ["line", "bar"])
+@pytest.mark.parametrize(
+    "risk",
+    [
+        ["Low fire danger", None, "High fire danger", "Low fire danger"],
+        [None, None, None, None],
+    ],
+    ids=["some-null", "all-null"],
+)
+def test_null_colour_groups_match_plotly_express(chart, risk):
+    df = pd.DataFrame({"Day": [1, 2, 3, 4], "FWI": [3.0, 4.0, 40.0, 5.0], "FWI_Risk": risk})
+
+    ours = getattr(figures, chart)(df, x="Day", y="FWI", color="FWI_Risk")
+    expected = getattr(px, chart)(df, x="Day", y="FWI", color="FWI_Risk")
+
+    assert _traces(ours) == _traces(expected)
@@ -0,0 +1,77 @@
+"""Low-bandwidth figure rounding only touches trace data."""
+from __future__ import annotations
+
+import copy
+
+from fire_risk.services import figures
+from fire_risk.services.lite import round_figures
+from fire_risk.services.overview import build_severity_donut
+
+
+def _without(figure: dict, *keys: str) -> dict:
+    figure = copy.deepcopy(figure)
+    for trace in figure["data"]:
+        for key in keys:
+            trace.pop(key, None)
+    return figure
+
+
+def test_donut_keeps_hole_and_colours():
+    donut = build_severity_donut()
+    donut["data"][0]["values"] = [1.234, 2.5, 0.0, 3.987]
+
+    rounded = round_figures(donut)
+
+    assert rounded["data"][0]["values"] == [1.2, 2.5, 0.0, 4.0]
+    assert rounded["data"][0]["hole"] == 0.55
+    assert _without(rounded, "values") == _without(donut, "values")
+
+
+def test_risk_strip_keeps_colorscale():
+    strip = figures.risk_strip(
+        ["Oct 20", "Oct 21"],
+        ["Low risk", "Extreme risk"],
+        ["FRI 12.345", "FRI 99.876"],
+        row_label="FRI",
+        title="Forecast",
+        height=120,
+        margin_t=40,
+        show_row_label=True,
+    )
+    strip["data"][0]["z"] = [[1.04, 3.96]]
+
+    rounded = round_figures({"props": {"figure": strip}})["props"]["figure"]
+
+    assert rounded["data"][0]["z"] == [[1.0, 4.0]]
+    assert rounded["data"][0]["colorscale"] == figures.RISK_HEATMAP_COLORSCALE
+    assert _without(rounded, "z") == _without(strip, "z")
+
+
+def test_inline_geojson_is_not_rounded():
+    outline = {"type": "FeatureCollection", "features": [{
+        "type": "Feature",
+        "id": "Camp 11",
+        "geometry": {"type": "Polygon", "coordinates": [[[92.1553, 21.1894], [92.1612, 21.1931], [92.1553, 21.1894]]]},
+    }]}
+    figure = {"data": [{"type": "choroplethmap", "geojson": outline, "locations": ["Camp 11"], "z": [57.46]}], "layout": {}}
+
+    rounded = round_figures(figure)
+
+    assert rounded["data"][0]["z"] == [57.5]
+    assert rounded["data"][0]["geojson"] == outline
+
+
+def test_map_coordinates_are_not_rounded():
+    points = {
+        "type": "scattermap",
+        "lat": [21.1894273, 21.19663652],
+        "lon": [92.1553118, 92.16338841],
+        "customdata": [[12.345], [67.891]],
+    }
+    figure = {"data": [points], "layout": {}}
+
+    rounded = round_figures(figure)
+
+    assert rounded["data"][0]["customdata"] == [[12.3], [67.9]]
+    assert rounded["data"][0]["lat"] == points["lat"]
+    assert rounded["data"][0]["lon"] == points["lon"]